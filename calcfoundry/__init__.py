@@ -0,0 +1,13 @@
+"""
+CalcFoundry page generator.
+
+Calculator specs live in tools/gen_*.py and register themselves with
+`register(CalculatorSpec(...))`. `python -m calcfoundry build` loads every
+spec and renders all pages in one process.
+"""
+
+from .build import build
+from .spec import CalculatorSpec, Variants, load_specs, register
+from .template import render_page
+
+__all__ = ["CalculatorSpec", "Variants", "build", "load_specs", "register", "render_page"]
@@ -0,0 +1,59 @@
+"""
+The shared calculator runtime as a fingerprinted static bundle.
+
+calcfoundry/runtime/core.js and core.css are copied into Hugo's static/
+directory as calcfoundry-core.<hash>.js/.css, where <hash> is taken from the
+file contents. Pages link the fingerprinted names, so browsers can cache the
+runtime forever and a changed runtime is picked up under a new URL.
+"""
+
+import glob
+import hashlib
+import os
+
+from .minify import minify_css, minify_js
+
+RUNTIME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runtime")
+BUNDLE_NAME = "calcfoundry-core"
+BUNDLE_EXTENSIONS = ("js", "css")
+
+
+def runtime_path(ext):
+    return os.path.join(RUNTIME_DIR, f"core.{ext}")
+
+
+_MINIFIERS = {"js": minify_js, "css": minify_css}
+
+
+def core_assets():
+    """Returns {ext: (fingerprinted file name, minified bytes)} for the runtime bundle."""
+    assets = {}
+    for ext in BUNDLE_EXTENSIONS:
+        with open(runtime_path(ext), encoding="utf-8") as f:
+            data = _MINIFIERS[ext](f.read()).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        assets[ext] = (f"{BUNDLE_NAME}.{digest}.{ext}", data)
+    return assets
+
+
+def emit_core_assets(static_dir, assets=None):
+    """
+    Writes the bundle into static_dir (only files that are missing) and
+    removes older calcfoundry-core.* fingerprints. Returns the written paths.
+    """
+    assets = assets or core_assets()
+    os.makedirs(static_dir, exist_ok=True)
+    current = {name for name, _ in assets.values()}
+
+    for path in glob.glob(os.path.join(static_dir, f"{BUNDLE_NAME}.*")):
+        if os.path.basename(path) not in current:
+            os.remove(path)
+
+    written = []
+    for name, data in assets.values():
+        path = os.path.join(static_dir, name)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(data)
+            written.append(path)
+    return written
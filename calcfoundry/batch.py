@@ -0,0 +1,252 @@
+"""
+Batch pricing from CSV: `python -m calcfoundry mortgage --in loans.csv --out results.csv`
+(and `python -m calcfoundry inflation ...` for restating amounts in another year's dollars).
+
+Rows are read, priced and written in fixed-size chunks, so memory stays
+constant however long the file is. Each chunk is parsed into NumPy columns
+and run through the vectorized engine in one go. The input's own columns
+(loan ids, notes, ...) are passed through, and the results are appended after
+them. Needs NumPy, like calcfoundry.engines.
+
+Blank cells in an optional column take its default, as the page's inputs do.
+Unlike the page, which reads junk such as "abc" as its default, a non-numeric
+value in any column (including "nan" and "inf") marks the row invalid: its
+results are left blank rather than priced on a guess.
+"""
+
+import csv
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from time import perf_counter
+
+import numpy as np
+
+CHUNK_ROWS = 50_000
+
+
+@dataclass
+class Column:
+    """A numeric input column: the header names it may go by, and its value when missing or blank."""
+    names: tuple
+    default: float = None      # None = required
+
+
+@dataclass
+class BatchStats:
+    rows: int = 0
+    invalid: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+
+@contextmanager
+def _open(path, mode):
+    if path == "-":
+        yield sys.stdin if mode == "r" else sys.stdout
+        return
+    with open(path, mode, newline="", encoding="utf-8") as f:
+        yield f
+
+
+def _floats(values, default):
+    """
+    Parses one chunk of a column; blanks take the default. Returns the values
+    and a mask of junk cells: non-numeric text and the literals float() accepts
+    but no input means ("nan", "inf"). A NaN default can so stand for "blank"
+    without junk passing for one.
+    """
+    text = np.asarray(values)
+    blank = text == ""
+    try:
+        out = np.where(blank, "nan", text).astype(float)
+    except ValueError:
+        out = np.empty(len(values))
+        for i, value in enumerate(values):
+            value = value.strip()
+            blank[i] = not value
+            try:
+                out[i] = float(value) if value else np.nan
+            except ValueError:
+                out[i] = np.nan
+    junk = ~blank & ~np.isfinite(out)
+    out[blank] = np.nan if default is None else default
+    return out, junk
+
+
+def _locate(header, columns):
+    """Maps each input column to its index in the header (None if it's absent and optional)."""
+    lookup = {name.strip().lower(): i for i, name in enumerate(header)}
+    positions = {}
+    for key, column in columns.items():
+        index = next((lookup[name] for name in column.names if name in lookup), None)
+        if index is None and column.default is None:
+            raise SystemExit(f"Input is missing a {column.names[0]} column (also accepted: {', '.join(column.names[1:])})")
+        positions[key] = index
+    return positions
+
+
+def stream_csv(in_path, out_path, columns, outputs, compute, chunk_rows=CHUNK_ROWS):
+    """
+    Streams in_path to out_path chunk by chunk. `columns` maps argument names
+    to Columns; compute(**arrays) returns (valid mask, {output: array}) for a
+    chunk; `outputs` lists (output, printf format) in column order. Invalid
+    rows keep their input and get blank results.
+    """
+    stats = BatchStats()
+    start = perf_counter()
+    with _open(in_path, "r") as src, _open(out_path, "w") as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst, lineterminator="\n")
+        header = next(reader, None)
+        if header is None:
+            raise SystemExit(f"{in_path} is empty")
+        positions = _locate(header, columns)
+        writer.writerow(header + [name for name, _ in outputs])
+
+        while True:
+            rows = list(islice(reader, chunk_rows))
+            if not rows:
+                break
+            arrays = {}
+            junk = np.zeros(len(rows), dtype=bool)
+            for key, index in positions.items():
+                default = columns[key].default
+                if index is None:
+                    arrays[key] = np.full(len(rows), default, dtype=float)
+                else:
+                    arrays[key], bad = _floats([row[index] if index < len(row) else "" for row in rows], default)
+                    junk |= bad
+            valid, results = compute(**arrays)
+            valid = valid & ~junk
+
+            invalid = np.flatnonzero(~valid).tolist()
+            formatted = []
+            for name, fmt in outputs:
+                cells = list(map(fmt.__mod__, results[name].tolist()))
+                for i in invalid:
+                    cells[i] = ""
+                formatted.append(cells)
+            writer.writerows(map(list.__add__, rows, map(list, zip(*formatted))))
+
+            stats.rows += len(rows)
+            stats.invalid += len(invalid)
+            stats.chunks += 1
+    stats.seconds = perf_counter() - start
+    return stats
+
+
+# --- MORTGAGE ---
+# Column names follow the mortgage page's input ids, with plain-English aliases.
+
+# The page's payment_freq <select> options: monthly, fortnightly, weekly.
+PAYMENT_FREQUENCIES = (12, 26, 52)
+
+MORTGAGE_COLUMNS = {
+    "principal": Column(("loan_amount", "principal", "amount")),
+    "rate": Column(("interest_rate", "rate", "annual_rate")),
+    "term": Column(("loan_term", "term", "years")),
+    "frequency": Column(("payment_freq", "frequency", "freq"), 12.0),
+    "extra": Column(("extra_payment", "extra"), 0.0),
+}
+
+MORTGAGE_OUTPUTS = [
+    ("payment", "%.2f"),
+    ("periods", "%.10g"),
+    ("total_cost", "%.2f"),
+    ("total_interest", "%.2f"),
+    ("payment_with_extra", "%.2f"),
+    ("periods_with_extra", "%.10g"),
+    ("total_cost_with_extra", "%.2f"),
+    ("total_interest_with_extra", "%.2f"),
+    ("interest_saved", "%.2f"),
+    ("periods_saved", "%.10g"),
+]
+
+
+def price_mortgages(principal, rate, term, frequency, extra):
+    """One chunk through engines.mortgage.quote, with the page's input validation."""
+    from .engines import mortgage
+
+    finite = np.isfinite(principal) & np.isfinite(rate) & np.isfinite(term) & np.isfinite(extra)
+    valid = finite & (principal > 0) & (rate >= 0) & (term > 0) & np.isin(frequency, PAYMENT_FREQUENCIES) & (extra >= 0)
+    # Price invalid rows as a harmless placeholder loan; their results are blanked.
+    q = mortgage.quote(
+        np.where(valid, principal, 1.0),
+        np.where(valid, rate, 0.0),
+        np.where(valid, term, 1.0),
+        np.where(valid, frequency, 12.0),
+        np.where(valid, extra, 0.0),
+    )
+    return valid, {
+        "payment": q.payment,
+        "periods": q.periods,
+        "total_cost": q.total_cost,
+        "total_interest": q.interest,
+        "payment_with_extra": q.extra_payment,
+        "periods_with_extra": q.extra_periods,
+        "total_cost_with_extra": q.extra_total_cost,
+        "total_interest_with_extra": q.extra_interest,
+        "interest_saved": q.interest_saved,
+        "periods_saved": q.periods_saved,
+    }
+
+
+def mortgage_batch(in_path, out_path, chunk_rows=CHUNK_ROWS):
+    return stream_csv(in_path, out_path, MORTGAGE_COLUMNS, MORTGAGE_OUTPUTS, price_mortgages, chunk_rows)
+
+
+# --- INFLATION ---
+# Column names follow the ShadowStats page's input ids, with plain-English aliases.
+# A blank or missing to_year (NaN) means the latest data year. A literal "nan"
+# or "inf" is junk (see _floats), so its row is invalid, not the latest year.
+
+INFLATION_COLUMNS = {
+    "amount": Column(("start_amount", "amount", "value")),
+    "from_year": Column(("start_year", "from_year")),
+    "to_year": Column(("end_year", "to_year"), np.nan),
+}
+
+INFLATION_OUTPUTS = [
+    ("official_value", "%.2f"),
+    ("shadow_value", "%.2f"),
+    ("official_rate", "%.4f"),
+    ("shadow_rate", "%.4f"),
+]
+
+
+def adjust_amounts(amount, from_year, to_year):
+    """One chunk through engines.inflation.adjust, with the page's input validation."""
+    from .engines import inflation
+
+    tables = inflation.page_tables()
+    to_year = np.where(np.isnan(to_year), tables.first_year + len(tables.official) - 1, to_year)
+    first = np.trunc(from_year)
+    valid = np.isfinite(amount) & np.isfinite(to_year) & (first >= tables.first_year) & (first < np.trunc(to_year))
+    # Invalid rows are adjusted as a harmless placeholder; their results are blanked.
+    a = inflation.adjust(
+        np.where(valid, amount, 0.0),
+        np.where(valid, from_year, tables.first_year),
+        np.where(valid, to_year, tables.first_year + 1),
+        tables,
+    )
+    return valid, {
+        "official_value": a.official,
+        "shadow_value": a.shadow,
+        "official_rate": a.official_rate,
+        "shadow_rate": a.shadow_rate,
+    }
+
+
+def inflation_batch(in_path, out_path, chunk_rows=CHUNK_ROWS):
+    return stream_csv(in_path, out_path, INFLATION_COLUMNS, INFLATION_OUTPUTS, adjust_amounts, chunk_rows)
+
+
+def format_stats(stats, what, verb="Priced"):
+    rate = stats.rows / stats.seconds if stats.seconds else 0
+    invalid = f" ({stats.invalid:,} invalid, left blank)" if stats.invalid else ""
+    return (
+        f"{verb} {stats.rows:,} {what}{invalid} in {stats.chunks:,} chunk(s), "
+        f"{stats.seconds:.2f} s ({rate:,.0f} rows/s)."
+    )
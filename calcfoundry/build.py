@@ -0,0 +1,382 @@
+import argparse
+import dataclasses
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from time import perf_counter
+
+from .assets import emit_core_assets
+from .manifest import existing_date, is_current, load_manifest, save_manifest, source_hash, spec_hash
+from .minify import MINIFIER_VERSION, minify_spec
+from . import spec as spec_module, template, trace, variants
+from .spec import load_specs
+from .variants import family_key, family_slug, iter_variants, orphaned_families
+
+# --- CONFIGURATION & PATH SETUP ---
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
+STATIC_DIR = os.path.join(PROJECT_ROOT, "static")
+
+# Page assembly (this module), variant expansion and prefilling, and the slug
+# rules decide the bytes and file names as much as the template does, so an
+# edit to any of them invalidates every page in the manifest too.
+RENDER_VERSION = source_hash(__file__, variants.__file__, spec_module.__file__)
+
+
+@dataclass
+class PageResult:
+    slug: str
+    path: str
+    render_time: float
+    write_time: float
+    size: int
+    saved: int = 0
+    events: list = None    # trace spans recorded while building this page (--trace only)
+
+
+def render_bytes(spec, date, minify=True):
+    """Renders one page in memory. Returns (page bytes, bytes saved by minification)."""
+    saved = 0
+    if minify:
+        with trace.span("minify", slug=spec.slug):
+            spec, saved = minify_spec(spec)
+    with trace.span("render", slug=spec.slug):
+        data = template.render_page(spec, date).encode("utf-8")
+    return data, saved
+
+
+def _build_page(spec, date, output_dir, minify):
+    path = os.path.join(output_dir, f"{spec.slug}.md")
+
+    start = perf_counter()
+    data, saved = render_bytes(spec, date, minify)
+    rendered = perf_counter()
+    with trace.span("write", slug=spec.slug, bytes=len(data)):
+        with open(path, "wb") as f:
+            f.write(data)
+    written = perf_counter()
+
+    return PageResult(spec.slug, path, rendered - start, written - rendered, len(data), saved)
+
+
+def build_page(spec, date, output_dir, minify=True, traced=False):
+    """
+    Renders and writes one page. Runs in the build process or in a pool worker.
+    With traced=True the page's spans come back on result.events.
+    """
+    if not traced:
+        return _build_page(spec, date, output_dir, minify)
+    with trace.capture() as events:
+        with trace.span("page", slug=spec.slug):
+            result = _build_page(spec, date, output_dir, minify)
+    result.events = events
+    return result
+
+
+def _collect(result):
+    trace.extend(result.events)
+    result.events = None
+    return result
+
+
+def page_date(entry, path, today):
+    """Keeps the original publish date, including pages built before the manifest existed."""
+    return (entry or {}).get("date") or existing_date(path) or today
+
+
+def page_version(minify=True):
+    """
+    The version recorded in the manifest: the template and render code, and
+    for minified pages the minifier too.
+    """
+    version = f"{template.TEMPLATE_VERSION}.{RENDER_VERSION}"
+    return f"{version}.{MINIFIER_VERSION}" if minify else version
+
+
+def _map(pool, jobs, task, specs, dates):
+    if pool is not None and len(specs) > 1:
+        chunksize = max(1, len(specs) // (jobs * 4))
+        return list(pool.map(task, specs, dates, chunksize=chunksize))
+    return [task(spec, date) for spec, date in zip(specs, dates)]
+
+
+def build_variants(spec, date, output_dir, pool=None, jobs=1, minify=True):
+    """
+    Streams a spec's variant pages into output_dir/<slug>/ in bounded batches.
+
+    The grid is expanded lazily and at most `batch_size` pages are rendered
+    (in the pool, if given) before they are written and dropped, so memory
+    stays flat however many variants there are. Pages left over from an
+    older grid are removed first. Returns one PageResult for the whole family
+    and the number of pages written.
+    """
+    directory = os.path.join(output_dir, spec.slug)
+    os.makedirs(directory, exist_ok=True)
+    for path in family_pages(directory):
+        os.remove(path)
+
+    task = partial(build_page, output_dir=directory, minify=minify, traced=trace.enabled())
+    variants = iter_variants(spec)
+    family = PageResult(family_key(spec), directory, 0.0, 0.0, 0)
+    count = 0
+    while True:
+        batch = list(itertools.islice(variants, spec.variants.batch_size))
+        if not batch:
+            break
+        for result in _map(pool, jobs, task, batch, [date] * len(batch)):
+            _collect(result)
+            family.render_time += result.render_time
+            family.write_time += result.write_time
+            family.size += result.size
+            family.saved += result.saved
+        count += len(batch)
+    return family, count
+
+
+def family_pages(directory):
+    """The variant pages (.md files) in a family directory, sorted; none if it doesn't exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(entry.path for entry in entries if entry.name.endswith(".md"))
+    except FileNotFoundError:
+        return []
+
+
+def prune_family(output_dir, key):
+    """Deletes an orphaned variant family's pages (and its directory, once empty). Returns the page count."""
+    directory = os.path.join(output_dir, family_slug(key))
+    pages = family_pages(directory)
+    for path in pages:
+        os.remove(path)
+    try:
+        os.rmdir(directory)
+    except OSError:
+        pass
+    return len(pages)
+
+
+def build(specs=None, output_dir=OUTPUT_DIR, jobs=1, force=False, static_dir=STATIC_DIR, minify=True, complete=None):
+    """
+    Renders and writes every spec (all registered specs by default).
+
+    Pages whose spec hash and template version match the build manifest are
+    skipped without being opened, so a no-op rebuild leaves every mtime alone.
+    With jobs > 1 stale pages are built across a process pool; results always
+    come back in spec order and the bytes don't depend on the worker count.
+    Specs with a variants grid also stream their variant family (see
+    build_variants), tracked in the manifest as a single "<slug>/*" entry.
+    A family whose spec no longer has a grid is deleted along with its entry;
+    so is one whose spec is gone, when `complete` says specs is every spec
+    (the default when specs is None).
+    Embedded JS/CSS is minified before rendering unless minify=False.
+    The shared runtime bundle the pages link is written to static_dir first.
+    Returns (built, unchanged) lists of PageResult / slug.
+    """
+    if complete is None:
+        complete = specs is None
+    if specs is None:
+        with trace.span("load specs"):
+            specs = load_specs()
+    os.makedirs(output_dir, exist_ok=True)
+    with trace.span("bundle"):
+        bundled = emit_core_assets(static_dir, template.CORE_ASSETS)
+    for path in bundled:
+        print(f"📦 Bundled: {path}")
+    with trace.span("load manifest"):
+        manifest = load_manifest(output_dir)
+    today = datetime.now().strftime("%Y-%m-%d")
+    version = page_version(minify)
+
+    stale, dates, digests, families, unchanged = [], [], [], [], []
+    for spec in specs:
+        path = os.path.join(output_dir, f"{spec.slug}.md")
+        entry = manifest.get(spec.slug)
+        with trace.span("hash", slug=spec.slug):
+            digest = spec_hash(spec)
+        if spec.variants:
+            key = family_key(spec)
+            family_entry = manifest.get(key)
+            if force or not is_current(family_entry, digest, version, os.path.join(output_dir, spec.slug)):
+                families.append((spec, (family_entry or {}).get("date") or today, digest))
+            else:
+                unchanged.append(key)
+        if not force and is_current(entry, digest, version, path):
+            unchanged.append(spec.slug)
+            continue
+        date = page_date(entry, path, today)
+        # The grid (and its result function) stays in this process; workers only render.
+        stale.append(dataclasses.replace(spec, variants=None) if spec.variants else spec)
+        dates.append(date)
+        digests.append(digest)
+
+    task = partial(build_page, output_dir=output_dir, minify=minify, traced=trace.enabled())
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and (len(stale) > 1 or families) else None
+    try:
+        built = [_collect(result) for result in _map(pool, jobs, task, stale, dates)]
+        for result, date, digest in zip(built, dates, digests):
+            manifest[result.slug] = {
+                "spec_hash": digest,
+                "template_version": version,
+                "date": date,
+                "bytes": result.size,
+            }
+            print(f"✅ Created: {result.path}")
+
+        for spec, date, digest in families:
+            with trace.span("variants", slug=spec.slug):
+                result, count = build_variants(spec, date, output_dir, pool, jobs, minify)
+            manifest[result.slug] = {
+                "spec_hash": digest,
+                "template_version": version,
+                "date": date,
+                "bytes": result.size,
+                "pages": count,
+            }
+            built.append(result)
+            print(f"✅ Created: {count} variant page(s) in {result.path}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    orphaned = orphaned_families(specs, manifest, complete)
+    for key in orphaned:
+        count = prune_family(output_dir, key)
+        del manifest[key]
+        print(f"🗑️  Removed {count} orphaned variant page(s) of {key}")
+
+    if built or orphaned:
+        with trace.span("save manifest"):
+            save_manifest(output_dir, manifest)
+    return built, unchanged
+
+
+def format_report(results):
+    """Per-page table of render time, write time, output size and bytes saved by minification, plus a total row."""
+    width = max([len(r.slug) for r in results] + [len("Page")])
+    rule = f"{'-' * width}  {'-' * 10}  {'-' * 10}  {'-' * 10}  {'-' * 10}"
+    lines = [
+        f"{'Page':<{width}}  {'Render ms':>10}  {'Write ms':>10}  {'Bytes':>10}  {'Saved':>10}",
+        rule,
+    ]
+    for r in results:
+        lines.append(
+            f"{r.slug:<{width}}  {r.render_time * 1000:>10.2f}  {r.write_time * 1000:>10.2f}  {r.size:>10,}  {r.saved:>10,}"
+        )
+    lines.append(rule)
+    lines.append(
+        f"{f'Total ({len(results)} pages)':<{width}}  "
+        f"{sum(r.render_time for r in results) * 1000:>10.2f}  "
+        f"{sum(r.write_time for r in results) * 1000:>10.2f}  "
+        f"{sum(r.size for r in results):>10,}  "
+        f"{sum(r.saved for r in results):>10,}"
+    )
+    return "\n".join(lines)
+
+
+def select_specs(slugs):
+    specs = load_specs()
+    if not slugs:
+        return specs
+    by_slug = {spec.slug: spec for spec in specs}
+    unknown = [slug for slug in slugs if slug not in by_slug]
+    if unknown:
+        raise SystemExit(f"Unknown calculator(s): {', '.join(unknown)}. Known: {', '.join(by_slug)}")
+    return [by_slug[slug] for slug in slugs]
+
+
+def add_build_arguments(parser):
+    parser.add_argument("slugs", nargs="*", help="Only build these calculators (default: all)")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="Directory for the generated Markdown pages")
+    parser.add_argument("--static", default=STATIC_DIR, help="Hugo static/ directory for the shared runtime bundle")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="Rebuild every page even if the manifest says it is current")
+    parser.add_argument("--no-minify", dest="minify", action="store_false", help="Embed calculator JS/CSS as written")
+    parser.add_argument("--dry-run", action="store_true", help="Render in memory and report per-page byte changes against the existing pages; write nothing")
+    parser.add_argument("--trace", metavar="OUT.json", help="Write a Chrome trace-event file of the build (open it in Perfetto)")
+    parser.add_argument("--watch", action="store_true", help="Stay resident and rebuild pages whose spec or template changes")
+    parser.add_argument("--interval", type=float, default=0.05, help="Watch-mode polling interval in seconds")
+
+
+def run_build(args):
+    if args.watch:
+        from .watch import watch
+
+        if args.trace:
+            raise SystemExit("--trace records a single build; it can't be combined with --watch")
+        watch(args.output, args.interval, args.static, args.minify)
+        return
+
+    if args.dry_run:
+        from .dryrun import dry_run, format_dry_run
+
+        print(format_dry_run(dry_run(select_specs(args.slugs), args.output, args.minify, complete=not args.slugs)))
+        return
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.trace:
+        trace.enable()
+    start = perf_counter()
+    with trace.span("build", jobs=jobs):
+        with trace.span("load specs"):
+            specs = select_specs(args.slugs)
+        built, unchanged = build(specs, args.output, jobs=jobs, force=args.force, static_dir=args.static,
+                                 minify=args.minify, complete=not args.slugs)
+    elapsed = perf_counter() - start
+    if built:
+        print()
+        print(format_report(built))
+    print(f"\nBuilt {len(built)} page(s), {len(unchanged)} unchanged, in {elapsed * 1000:.1f} ms with {jobs} job(s).")
+    if args.trace:
+        count = trace.save(args.trace)
+        print(f"🧭 Wrote {count} trace events to {args.trace}")
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def add_batch_arguments(parser):
+    parser.add_argument("--in", dest="input", required=True, metavar="IN.csv", help="Input CSV with a header row ('-' for stdin)")
+    parser.add_argument("--out", dest="output", required=True, metavar="OUT.csv", help="Output CSV: the input columns plus the results ('-' for stdout)")
+    parser.add_argument("--chunk-size", type=_positive_int, default=None, help="Rows per chunk (default 50,000)")
+
+
+def run_mortgage(args):
+    from .batch import CHUNK_ROWS, format_stats, mortgage_batch
+
+    stats = mortgage_batch(args.input, args.output, args.chunk_size or CHUNK_ROWS)
+    print(format_stats(stats, "loan(s)"), file=sys.stderr if args.output == "-" else sys.stdout)
+
+
+def run_inflation(args):
+    from .batch import CHUNK_ROWS, format_stats, inflation_batch
+
+    stats = inflation_batch(args.input, args.output, args.chunk_size or CHUNK_ROWS)
+    print(format_stats(stats, "amount(s)", "Adjusted"), file=sys.stderr if args.output == "-" else sys.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="calcfoundry", description="CalcFoundry page generator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Generate content/posts/*.md from every calculator spec")
+    add_build_arguments(build_parser)
+    build_parser.set_defaults(func=run_build)
+
+    mortgage_parser = commands.add_parser("mortgage", help="Price a CSV of loans with the mortgage calculator's math (needs NumPy)")
+    add_batch_arguments(mortgage_parser)
+    mortgage_parser.set_defaults(func=run_mortgage)
+
+    inflation_parser = commands.add_parser("inflation", help="Restate a CSV of amounts in another year's dollars, official and ShadowStats (needs NumPy)")
+    add_batch_arguments(inflation_parser)
+    inflation_parser.set_defaults(func=run_inflation)
+
+    args = parser.parse_args(argv)
+    args.func(args)
@@ -0,0 +1,138 @@
+"""
+Contribution schedules shared by the investment and retirement calculators:
+an annual escalation of the monthly contribution, contribution holidays and
+one-off deposits or withdrawals.
+
+A calculator adds INPUTS_HTML and SETUP_JS to its spec, reads the schedule
+with readFlows_{tool_id}() and values it with flowValue_{tool_id}(). The
+future value never walks the months: escalating contributions are a
+geometric series, so the discounted sum of the first n contributions,
+S(n) = sum PMT_k v^k with v = 1/(1+i), has a closed form. A holiday
+subtracts S over its months and a one-off flow is a single term, so a
+schedule costs O(events) to value whatever the horizon.
+"""
+
+INPUTS_HTML = """
+<details class="mc-options">
+    <summary>Contribution schedule</summary>
+    <label>Annual Contribution Increase (%)</label>
+    <input type="number" id="flow_escalation_{tool_id}" placeholder="e.g. 3" value="0" step="0.1">
+    <label>Contribution Holidays (years, e.g. "3, 8-9")</label>
+    <input type="text" id="flow_holidays_{tool_id}" placeholder="e.g. 3, 8-9">
+    <label>One-off Deposits / Withdrawals (one per line: year: amount)</label>
+    <textarea id="flow_lumps_{tool_id}" rows="3" placeholder="10: 20000&#10;15: -5000"></textarea>
+</details>
+"""
+
+SETUP_JS = """
+    // The schedule from the inputs: { escalation (fraction per year), holidays
+    // (merged [first, last] month ranges, 1-based), lumps ([{ month, amount }]) },
+    // or { error }. active is false when it is just a flat contribution.
+    function readFlows_{tool_id}() {
+        const escalation = (parseFloat(document.getElementById('flow_escalation_{tool_id}').value) || 0) / 100;
+        const holidays = [];
+        for (const part of document.getElementById('flow_holidays_{tool_id}').value.split(',')) {
+            if (!part.trim()) continue;
+            const m = /^\\s*(\\d+)\\s*(?:-\\s*(\\d+))?\\s*$/.exec(part);
+            if (!m || parseInt(m[1]) < 1 || (m[2] && parseInt(m[2]) < parseInt(m[1]))) {
+                return { error: `Could not read contribution holiday "${part.trim()}". Use years such as "3" or "8-9".` };
+            }
+            holidays.push([12 * (parseInt(m[1]) - 1) + 1, 12 * parseInt(m[2] || m[1])]);
+        }
+        holidays.sort((a, b) => a[0] - b[0]);
+        const merged = [];
+        for (const range of holidays) {
+            const last = merged[merged.length - 1];
+            if (last && range[0] <= last[1] + 1) last[1] = Math.max(last[1], range[1]);
+            else merged.push(range);
+        }
+        const lumps = [];
+        for (const line of document.getElementById('flow_lumps_{tool_id}').value.split('\\n')) {
+            if (!line.trim()) continue;
+            const m = /^\\s*([\\d.]+)\\s*:\\s*(-?[\\d.,]+)\\s*$/.exec(line);
+            const amount = m ? parseFloat(m[2].replace(/,/g, '')) : NaN;
+            if (!m || isNaN(amount)) {
+                return { error: `Could not read one-off flow "${line.trim()}". Use "year: amount", e.g. "10: 20000" or "15: -5000".` };
+            }
+            lumps.push({ month: Math.round(parseFloat(m[1]) * 12), amount: amount });
+        }
+        lumps.sort((a, b) => a.month - b.month);
+        return { escalation: escalation, holidays: merged, lumps: lumps, active: escalation !== 0 || merged.length > 0 || lumps.length > 0 };
+    }
+
+    // sum_{y=0}^{n-1} x^y
+    function geometric_{tool_id}(x, n) {
+        return Math.abs(x - 1) < 1e-12 ? n : (Math.pow(x, n) - 1) / (x - 1);
+    }
+
+    // S(n) = sum_{k=1}^{n} PMT_k v^k, where the contribution at the end of
+    // month k is PMT (1+e)^floor((k-1)/12): whole years form a geometric series
+    // in (1+e) v^12, and the months of a part year another in v.
+    function discountedContributions_{tool_id}(PMT, escalation, v, n) {
+        if (n <= 0) return 0;
+        const years = Math.floor(n / 12), rest = n - 12 * years;
+        const yearSum = v * geometric_{tool_id}(v, 12);
+        const full = yearSum * geometric_{tool_id}((1 + escalation) * Math.pow(v, 12), years);
+        const part = Math.pow(1 + escalation, years) * Math.pow(v, 12 * years) * v * geometric_{tool_id}(v, rest);
+        return PMT * (full + part);
+    }
+
+    // Discounted contributions actually paid in months 1..n (holidays skipped).
+    function paidContributions_{tool_id}(PMT, flows, v, n) {
+        let total = discountedContributions_{tool_id}(PMT, flows.escalation, v, n);
+        for (const [first, last] of flows.holidays) {
+            if (first > n) break;
+            total -= discountedContributions_{tool_id}(PMT, flows.escalation, v, Math.min(last, n))
+                - discountedContributions_{tool_id}(PMT, flows.escalation, v, first - 1);
+        }
+        return total;
+    }
+
+    // Balance after `months` months at annual rate ratePercent: the principal,
+    // the scheduled contributions and every one-off flow up to then, each
+    // compounded to the end. A fractional final period f pays month n+1's
+    // contribution pro rata, PMT_{n+1} ((1+i)^f - 1) / i, as the flat closed
+    // form does. Also returns the total paid in and the first month a
+    // withdrawal takes the balance below zero (or -1).
+    function flowValue_{tool_id}(P, PMT, ratePercent, months, flows) {
+        const i = ratePercent / 100 / 12;
+        const v = 1 / (1 + i);
+        const n = Math.floor(months), f = months - n;
+        const balanceAt = (k) => {
+            let value = P + paidContributions_{tool_id}(PMT, flows, v, k);
+            for (const lump of flows.lumps) {
+                if (lump.month <= k) value += lump.amount * Math.pow(v, lump.month);
+            }
+            return value * Math.pow(1 + i, k);
+        };
+        let negativeAt = -1;
+        for (const lump of flows.lumps) {
+            if (lump.amount < 0 && lump.month <= n && balanceAt(lump.month) < 0) {
+                negativeAt = lump.month;
+                break;
+            }
+        }
+        const onHoliday = flows.holidays.some(([first, last]) => first <= n + 1 && n + 1 <= last);
+        const partial = f > 0 && !onHoliday ? PMT * Math.pow(1 + flows.escalation, Math.floor(n / 12)) : 0;
+        let contributed = P + paidContributions_{tool_id}(PMT, flows, 1, n) + partial * f;
+        for (const lump of flows.lumps) {
+            if (lump.month <= n) contributed += lump.amount;
+        }
+        const growth = Math.pow(1 + i, f);
+        const balance = balanceAt(n) * growth + partial * (i !== 0 ? (growth - 1) / i : f);
+        return { balance: balance, contributed: contributed, negativeAt: negativeAt };
+    }
+
+    // Month-by-month contributions (index k = paid at the end of month k,
+    // one-off flows included), for the chart and the Monte Carlo paths.
+    function monthlyFlows_{tool_id}(PMT, flows, months) {
+        const n = Math.floor(months);
+        const out = new Float64Array(n + 1);
+        for (let k = 1; k <= n; k++) out[k] = PMT * Math.pow(1 + flows.escalation, Math.floor((k - 1) / 12));
+        for (const [first, last] of flows.holidays) out.fill(0, first, Math.min(last, n) + 1);
+        for (const lump of flows.lumps) {
+            if (lump.month <= n) out[lump.month] += lump.amount;
+        }
+        return out;
+    }
+"""
@@ -0,0 +1,166 @@
+"""
+Official CPI-U data and the ShadowStats divergence model for the inflation
+calculator (tools/gen_true_inflation.py) and calcfoundry.engines.inflation.
+
+CPI_ANCHORS are BLS annual averages; official_cpi_table() interpolates them
+into one index per year. A full monthly series can be dropped in at
+MONTHLY_CSV: FRED's CPIAUCNSA download (CPI-U, not seasonally adjusted),
+i.e. a header line followed by "1913-01-01,9.8" rows. The repo ships it.
+load_monthly() validates it, the yearly table then uses its calendar-year
+averages, and the page gets the months as a base64 Float32Array
+(encode_float32). Without the file the page falls back to the annual anchors.
+
+The shadow index is the official one times a cumulative divergence, baked as
+prefix products (shadow_multiplier_table) so any range is one division.
+"""
+
+import base64
+import csv
+import math
+import os
+import re
+import struct
+from dataclasses import dataclass
+
+MONTHLY_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cpi_u_monthly.csv")
+DATA_FILES = (MONTHLY_CSV,)   # rebuilt on change by build --watch
+
+# Anchors used for interpolation. Source: BLS
+CPI_ANCHORS = {
+    1913: 9.9, 1920: 20.0, 1930: 16.7, 1940: 14.0, 1950: 24.1,
+    1960: 29.6, 1970: 38.8, 1980: 82.4, 1990: 130.7, 2000: 172.2,
+    2010: 218.0, 2020: 258.8, 2021: 270.9, 2022: 292.6, 2023: 304.7, 2024: 314.0, 2025: 322.0,
+}
+CPI_EXTRAPOLATION = 1.03   # yearly growth assumed past the last data year
+
+# ShadowStats methodology roughly matches Official until 1980.
+# Post 1980: Diverges by ~1.5% - 2% annually.
+# Post 1990: Diverges by ~4% - 5% annually (widening gap).
+SHADOW_DIVERGENCE = (
+    (1980, 0.012),   # 1.2% divergence in the 80s
+    (1990, 0.045),   # 4.5% divergence post-90s (Conservative avg of SGS charts)
+)
+
+_DATE = re.compile(r"^(\d{4})-(\d{2})(?:-\d{2})?$")
+_MISSING = ("", ".")   # FRED's marks for a month that was never published
+
+
+@dataclass
+class MonthlySeries:
+    """Consecutive monthly index values; values[0] is (year, month)."""
+    year: int
+    month: int
+    values: list
+
+    def offset(self, year, month):
+        """Position of (year, month) in values (may fall outside it)."""
+        return (year - self.year) * 12 + (month - self.month)
+
+    def annual_averages(self):
+        """{year: mean} for every calendar year the series fully covers."""
+        averages = {}
+        start = (13 - self.month) % 12          # first January in values
+        for i in range(start, len(self.values) - 11, 12):
+            averages[self.year + (self.month - 1 + i) // 12] = sum(self.values[i:i + 12]) / 12
+        return averages
+
+
+def load_monthly(path=MONTHLY_CSV):
+    """
+    Reads and validates the monthly series, or returns None if the file is
+    absent. Every row needs a YYYY-MM(-DD) date and a positive index, and the
+    months must run consecutively with no gaps or repeats; anything else
+    raises ValueError naming the line. A month whose value is blank or "."
+    (BLS published no October 2025 index, for one) is interpolated linearly
+    between its neighbours, so the first and last months need values.
+    """
+    if not os.path.exists(path):
+        return None
+    series = None
+    missing = []
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = csv.reader(f)
+        next(rows, None)
+        for line, row in enumerate(rows, start=2):
+            if not row or not "".join(row).strip():
+                continue
+            where = f"{path}:{line}"
+            match = _DATE.match(row[0].strip())
+            if len(row) < 2 or not match:
+                raise ValueError(f"{where}: expected 'YYYY-MM-DD,value', got {','.join(row)!r}")
+            year, month = int(match.group(1)), int(match.group(2))
+            if not 1 <= month <= 12:
+                raise ValueError(f"{where}: month {month} is out of range")
+            if row[1].strip() in _MISSING:
+                value = None
+            else:
+                try:
+                    value = float(row[1])
+                except ValueError:
+                    raise ValueError(f"{where}: {row[1]!r} is not a number") from None
+                if not (math.isfinite(value) and value > 0):
+                    raise ValueError(f"{where}: CPI must be positive, got {row[1]!r}")
+            if series is None:
+                series = MonthlySeries(year, month, [])
+            elif series.offset(year, month) != len(series.values):
+                expected = series.year + (series.month - 1 + len(series.values)) // 12, (series.month - 1 + len(series.values)) % 12 + 1
+                raise ValueError(f"{where}: expected {expected[0]}-{expected[1]:02d} next, got {year}-{month:02d}")
+            if value is None:
+                if not series.values:
+                    raise ValueError(f"{where}: the first month needs a value")
+                missing.append(len(series.values))
+            series.values.append(value)
+    if series is None or len(series.values) < 12:
+        raise ValueError(f"{path}: needs at least a year of monthly values")
+    if series.values[-1] is None:
+        raise ValueError(f"{path}: the last month needs a value")
+    for i in missing:
+        after = next(j for j in range(i + 1, len(series.values)) if series.values[j] is not None)
+        series.values[i] = series.values[i - 1] + (series.values[after] - series.values[i - 1]) / (after - i + 1)
+    return series
+
+
+def official_cpi_table(monthly=None):
+    """
+    One index per year from the first anchor to the last data year, linearly
+    interpolated between anchors. Years a monthly series fully covers use its
+    average instead (which is how BLS defines the annual figure).
+    """
+    years = sorted(CPI_ANCHORS)
+    table = []
+    for low, high in zip(years, years[1:]):
+        for year in range(low, high):
+            ratio = (year - low) / (high - low)
+            table.append(CPI_ANCHORS[low] + (ratio * (CPI_ANCHORS[high] - CPI_ANCHORS[low])))
+    table.append(CPI_ANCHORS[years[-1]])
+    if monthly is not None:
+        averages = monthly.annual_averages()
+        for year in range(years[-1] + 1, max(averages, default=0) + 1):
+            table.append(table[-1] * CPI_EXTRAPOLATION)
+        for year, average in averages.items():
+            if year >= years[0]:
+                table[year - years[0]] = average
+    return table
+
+
+def annual_divergence(year):
+    """Extra inflation the shadow model adds on top of the official CPI in a year."""
+    divergence = 0.0
+    for start, value in SHADOW_DIVERGENCE:
+        if year >= start:
+            divergence = value
+    return divergence
+
+
+def shadow_multiplier_table(count):
+    """Prefix products of (1 + divergence): entry i covers the years from the first CPI year up to (not including) first + i."""
+    first = min(CPI_ANCHORS)
+    table = [1.0]
+    for year in range(first, first + count - 1):
+        table.append(table[-1] * (1 + annual_divergence(year)))
+    return table
+
+
+def encode_float32(values):
+    """Little-endian Float32 bytes, base64 (about a fifth smaller than the shipped series as JSON)."""
+    return base64.b64encode(struct.pack(f"<{len(values)}f", *values)).decode("ascii")
@@ -0,0 +1,168 @@
+"""
+Dry-run mode: `python -m calcfoundry build --dry-run`.
+
+Renders every page in memory and compares it with what is on disk, without
+writing anything. For each page it reports the bytes added and removed, the
+net size change and how much of that is inline <script> or <style> code, so a
+template change that bloats every page shows up before it ships. Variant
+pages the build would delete (left over from an older grid, or from a family
+whose grid or spec is gone) count as removed.
+"""
+
+import difflib
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime
+
+from .build import family_pages, page_date, render_bytes
+from .manifest import load_manifest
+from .variants import family_key, family_slug, iter_variants, orphaned_families
+
+_INLINE_SCRIPT = re.compile(rb"<script>(.*?)</script>", re.S)
+_INLINE_STYLE = re.compile(rb"<style>(.*?)</style>", re.S)
+
+
+@dataclass
+class PageDiff:
+    slug: str
+    status: str        # new, changed, same or deleted (or the counts for a variant family)
+    added: int = 0
+    removed: int = 0
+    size: int = 0      # net change in page bytes
+    js: int = 0        # net change in inline <script> bytes
+    css: int = 0       # net change in inline <style> bytes
+
+
+def inline_sizes(data):
+    """Bytes of inline <script> and <style> code in a page."""
+    js = sum(len(m) for m in _INLINE_SCRIPT.findall(data))
+    css = sum(len(m) for m in _INLINE_STYLE.findall(data))
+    return js, css
+
+
+def byte_changes(old, new):
+    """
+    Returns (added, removed) bytes between two versions of a page. Lines are
+    matched first; changed line blocks are then compared byte by byte.
+    """
+    added = removed = 0
+    old_lines, new_lines = old.splitlines(True), new.splitlines(True)
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False).get_opcodes():
+        if tag == "equal":
+            continue
+        old_block, new_block = b"".join(old_lines[i1:i2]), b"".join(new_lines[j1:j2])
+        if tag != "replace":
+            added += len(new_block)
+            removed += len(old_block)
+            continue
+        for op, a1, a2, b1, b2 in difflib.SequenceMatcher(None, old_block, new_block, autojunk=False).get_opcodes():
+            if op != "equal":
+                added += b2 - b1
+                removed += a2 - a1
+    return added, removed
+
+
+def diff_page(slug, path, data):
+    try:
+        with open(path, "rb") as f:
+            old = f.read()
+    except OSError:
+        js, css = inline_sizes(data)
+        return PageDiff(slug, "new", len(data), 0, len(data), js, css)
+    if old == data:
+        return PageDiff(slug, "same")
+    added, removed = byte_changes(old, data)
+    old_js, old_css = inline_sizes(old)
+    new_js, new_css = inline_sizes(data)
+    return PageDiff(slug, "changed", added, removed, len(data) - len(old), new_js - old_js, new_css - old_css)
+
+
+def deleted_page(slug, path):
+    with open(path, "rb") as f:
+        old = f.read()
+    js, css = inline_sizes(old)
+    return PageDiff(slug, "deleted", 0, len(old), -len(old), -js, -css)
+
+
+def _add(family, page, counts):
+    counts[page.status] = counts.get(page.status, 0) + 1
+    family.added += page.added
+    family.removed += page.removed
+    family.size += page.size
+    family.js += page.js
+    family.css += page.css
+
+
+def _family_status(counts):
+    return ", ".join(f"{counts[s]} {s}" for s in ("new", "changed", "same", "deleted") if s in counts)
+
+
+def _diff_family(spec, date, output_dir, minify):
+    directory = os.path.join(output_dir, spec.slug)
+    family = PageDiff(family_key(spec), "")
+    counts = {}
+    stale = set(family_pages(directory))
+    for variant in iter_variants(spec):
+        data, _ = render_bytes(variant, date, minify)
+        path = os.path.join(directory, f"{variant.slug}.md")
+        stale.discard(path)
+        _add(family, diff_page(variant.slug, path, data), counts)
+    for path in sorted(stale):
+        _add(family, deleted_page(os.path.basename(path)[:-3], path), counts)
+    family.status = _family_status(counts)
+    return family
+
+
+def _diff_orphan(output_dir, key):
+    family = PageDiff(key, "")
+    counts = {}
+    for path in family_pages(os.path.join(output_dir, family_slug(key))):
+        _add(family, deleted_page(os.path.basename(path)[:-3], path), counts)
+    family.status = _family_status(counts) or "0 deleted"
+    return family
+
+
+def dry_run(specs, output_dir, minify=True, complete=False):
+    """
+    Renders every spec (and variant family) in memory and returns a PageDiff
+    per page, plus one per orphaned family the build would delete (see
+    calcfoundry.build.build for `complete`).
+    """
+    manifest = load_manifest(output_dir)
+    today = datetime.now().strftime("%Y-%m-%d")
+    diffs = []
+    for spec in specs:
+        path = os.path.join(output_dir, f"{spec.slug}.md")
+        data, _ = render_bytes(spec, page_date(manifest.get(spec.slug), path, today), minify)
+        diffs.append(diff_page(spec.slug, path, data))
+        if spec.variants:
+            date = (manifest.get(family_key(spec)) or {}).get("date") or today
+            diffs.append(_diff_family(spec, date, output_dir, minify))
+    for key in orphaned_families(specs, manifest, complete):
+        diffs.append(_diff_orphan(output_dir, key))
+    return diffs
+
+
+def format_dry_run(diffs):
+    """Per-page table of byte changes, plus a total row."""
+    width = max([len(d.slug) for d in diffs] + [len("Page")])
+    status_width = max([len(d.status) for d in diffs] + [len("Status")])
+    rule = f"{'-' * width}  {'-' * status_width}  " + "  ".join(["-" * 10] * 5)
+    lines = [
+        f"{'Page':<{width}}  {'Status':<{status_width}}  {'+Bytes':>10}  {'-Bytes':>10}  {'Net':>10}  {'JS':>10}  {'CSS':>10}",
+        rule,
+    ]
+    for d in diffs:
+        lines.append(
+            f"{d.slug:<{width}}  {d.status:<{status_width}}  "
+            f"{d.added:>10,}  {d.removed:>10,}  {d.size:>+10,}  {d.js:>+10,}  {d.css:>+10,}"
+        )
+    lines.append(rule)
+    changed = sum(1 for d in diffs if d.added or d.removed)
+    lines.append(
+        f"{f'Total ({changed} of {len(diffs)} changed)':<{width + status_width + 2}}  "
+        f"{sum(d.added for d in diffs):>10,}  {sum(d.removed for d in diffs):>10,}  "
+        f"{sum(d.size for d in diffs):>+10,}  {sum(d.js for d in diffs):>+10,}  {sum(d.css for d in diffs):>+10,}"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,8 @@
+"""
+Vectorized Python counterparts of the calculators' JavaScript math.
+
+Each engine mirrors one calculator's calculation_js but works on NumPy arrays,
+so thousands of scenarios are priced in one pass (variant pages, reports and
+the batch CLIs). NumPy is only needed when an engine is imported; page builds
+don't use it.
+"""
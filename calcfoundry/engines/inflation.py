@@ -0,0 +1,91 @@
+"""
+Vectorized inflation adjuster mirroring the ShadowStats calculator's shadow_js
+(tools/gen_true_inflation.py).
+
+The official CPI and the cumulative shadow divergence are the page's dense
+per-year tables (calcfoundry.cpi), so restating any number of
+(amount, from_year, to_year) rows is a gather from each table at both years.
+Years before the data clamp to its first year, and years past it are
+extrapolated as getOfficialIndex and shadowMultiplier do.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .. import cpi
+
+
+@dataclass
+class Tables:
+    first_year: int
+    official: np.ndarray        # CPI per year from first_year
+    shadow: np.ndarray          # cumulative divergence per year from first_year
+    divergence: float           # yearly divergence past the table
+
+
+@dataclass
+class Adjustment:
+    """Everything shadow_js reports, one element per row."""
+    official: np.ndarray        # amount in to_year dollars, official CPI
+    shadow: np.ndarray          # amount in to_year dollars, shadow index
+    official_rate: np.ndarray   # average yearly inflation (percent)
+    shadow_rate: np.ndarray
+
+
+def tables(monthly=None):
+    """The page's tables: built from `monthly` if given (see calcfoundry.cpi.load_monthly), else the anchors."""
+    official = np.array(cpi.official_cpi_table(monthly))
+    first = min(cpi.CPI_ANCHORS)
+    return Tables(
+        first,
+        official,
+        np.array(cpi.shadow_multiplier_table(len(official))),
+        cpi.annual_divergence(first + len(official) - 1),
+    )
+
+
+@lru_cache(maxsize=1)
+def page_tables():
+    """The tables the page is built with (the monthly CSV when present)."""
+    return tables(cpi.load_monthly())
+
+
+def _gather(table, index, growth):
+    last = len(table) - 1
+    beyond = np.maximum(index - last, 0)
+    return table[np.clip(index, 0, last)] * np.power(growth, beyond)
+
+
+def official_index(years, t=None):
+    """getOfficialIndex on an array of whole years."""
+    t = t or page_tables()
+    return _gather(t.official, np.asarray(years, dtype=np.int64) - t.first_year, cpi.CPI_EXTRAPOLATION)
+
+
+def shadow_multiplier(years, t=None):
+    """shadowMultiplier on an array of whole years."""
+    t = t or page_tables()
+    return _gather(t.shadow, np.asarray(years, dtype=np.int64) - t.first_year, 1 + t.divergence)
+
+
+def adjust(amount, from_year, to_year, t=None):
+    """
+    Restates amounts from from_year to to_year dollars. Years are truncated
+    to whole years like the page's parseInt; from_year < to_year as on the page
+    (rates come out NaN otherwise).
+    """
+    t = t or page_tables()
+    amount, y1, y2 = np.broadcast_arrays(
+        np.asarray(amount, dtype=float),
+        np.trunc(np.asarray(from_year, dtype=float)).astype(np.int64),
+        np.trunc(np.asarray(to_year, dtype=float)).astype(np.int64),
+    )
+    ratio_official = official_index(y2, t) / official_index(y1, t)
+    ratio_shadow = ratio_official * (shadow_multiplier(y2, t) / shadow_multiplier(y1, t))
+    n = (y2 - y1).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        official_rate = (np.power(ratio_official, 1 / n) - 1) * 100
+        shadow_rate = (np.power(ratio_shadow, 1 / n) - 1) * 100
+    return Adjustment(amount * ratio_official, amount * ratio_shadow, official_rate, shadow_rate)
@@ -0,0 +1,67 @@
+"""
+Vectorized investment growth engine mirroring the investment calculator
+(tools/gen_investment.py).
+
+Monthly compounding at i = rate / 100 / 12 with a contribution at the end of
+every month. Balances come from a single cumulative product of the monthly
+growth factors, g_k = (1+i)^k, and B_k = P g_k + PMT (g_k - 1) / i
+(P + PMT k at 0%), which is the page's closed form at every month at once.
+Negative contributions count as zero, as on the page.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Series:
+    """
+    Monthly series, shape (scenarios, months + 1); column k is the end of
+    month k (column 0 is the start). Scenarios shorter than the longest one
+    hold their final values.
+    """
+    balance: np.ndarray
+    contributed: np.ndarray
+    interest: np.ndarray
+    months: np.ndarray          # horizon per scenario (fractional months allowed)
+
+
+def series(principal, contribution, rate, years):
+    P, PMT, rate, years = (
+        np.atleast_1d(a)
+        for a in np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (principal, contribution, rate, years)))
+    )
+    PMT = np.maximum(PMT, 0)
+    i = rate / 100 / 12
+    months = years * 12
+    k = np.arange(int(np.ceil(months.max())) + 1, dtype=float)
+
+    # Month k compounds for min(1, months - (k - 1)) periods: a whole month,
+    # the final fraction of one, or nothing once the horizon has passed.
+    exponent = np.clip(months[:, None] - (k[None, 1:] - 1), 0, 1)
+    growth = np.ones((len(P), len(k)))
+    np.cumprod(np.power(1 + i[:, None], exponent), axis=1, out=growth[:, 1:])
+
+    elapsed = np.minimum(k[None, :], months[:, None])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(i[:, None] != 0, (growth - 1) / np.where(i != 0, i, 1)[:, None], elapsed)
+    balance = P[:, None] * growth + PMT[:, None] * annuity
+    contributed = P[:, None] + PMT[:, None] * elapsed
+    return Series(balance, contributed, balance - contributed, months)
+
+
+def yearly(values):
+    """Year-end columns of a monthly series (the last column closes a partial year)."""
+    last = values.shape[-1] - 1
+    return values[..., np.minimum(np.arange(0, last + 12, 12), last)]
+
+
+def final_balance(principal, contribution, rate, years):
+    """The page's closed-form result: P(1+i)^(12t) + PMT((1+i)^(12t) - 1)/i."""
+    P, PMT, rate, years = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (principal, contribution, rate, years)))
+    PMT = np.maximum(PMT, 0)
+    i = rate / 100 / 12
+    growth = np.power(1 + i, years * 12)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return P * growth + PMT * np.where(i != 0, (growth - 1) / np.where(i != 0, i, 1), years * 12)
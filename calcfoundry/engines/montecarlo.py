@@ -0,0 +1,108 @@
+"""
+Seeded Monte Carlo reference engine mirroring CalcFoundry.monteCarlo
+(calcfoundry/runtime/core.js).
+
+Draws come from the same counter-based hash of (seed, path, step) as the
+Web Worker, and the same Box-Muller transform, growth models and percentile
+interpolation, so a seed gives the page's bands here (to the last few ulps of
+the platform's log/cos). Balances are kept as one array of paths and advanced
+month by month, with the P10/P50/P90 taken at every year end, so memory is
+O(paths) however long the horizon.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..returns import returns_table
+
+_TWO_32 = 4294967296.0
+
+
+@dataclass
+class Bands:
+    """Balance percentiles at month 0, every year end and the final month."""
+    months: np.ndarray
+    p10: np.ndarray
+    p50: np.ndarray
+    p90: np.ndarray
+
+
+def mix(x):
+    """The worker's 32-bit integer hash, on uint32 arrays (products wrap mod 2^32 like Math.imul)."""
+    x = np.asarray(x, dtype=np.uint32)
+    with np.errstate(over="ignore"):
+        x = x ^ (x >> np.uint32(16))
+        x = x * np.uint32(0x7FEB352D)
+        x = x ^ (x >> np.uint32(15))
+        x = x * np.uint32(0x846CA68B)
+        return x ^ (x >> np.uint32(16))
+
+
+def path_keys(seed, paths):
+    return mix(mix(np.uint32(seed & 0xFFFFFFFF)) ^ np.arange(paths, dtype=np.uint32))
+
+
+def uniforms(keys, step):
+    """One uniform in (0, 1) per path for a step (a month index)."""
+    return (mix(keys ^ np.uint32(step)).astype(float) + 0.5) / _TWO_32
+
+
+def percentile(sorted_values, q):
+    """Linear interpolation between order statistics, computed exactly as the worker does."""
+    h = q * (len(sorted_values) - 1)
+    lo = int(np.floor(h))
+    t = h - lo
+    a, b = sorted_values[lo], sorted_values[min(lo + 1, len(sorted_values) - 1)]
+    return b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t
+
+
+def simulate(principal, contribution, rate, years, model="lognormal", volatility=15.0,
+             paths=10_000, seed=42, returns=None, contributions=None):
+    """
+    Simulates `paths` balances with a monthly contribution at the end of each
+    month. rate and volatility are annual percentages; model is "normal",
+    "lognormal" or "bootstrap" (whole years drawn from `returns`, by default
+    the bundled S&P 500 table). `contributions` optionally replaces the flat
+    contribution with a per-month schedule (element k paid at the end of
+    month k, element 0 at the start).
+    """
+    months = int(round(years * 12))
+    mean, vol = rate / 100, volatility / 100
+    drift = (np.log1p(mean) - vol * vol / 2) / 12 if model == "lognormal" else mean / 12
+    shock = vol / np.sqrt(12)
+    table = np.power(1 + np.asarray(returns if returns is not None else returns_table(), dtype=float) / 100, 1 / 12)
+
+    keys = path_keys(seed, paths)
+    balance = np.full(paths, float(principal) + (contributions[0] if contributions is not None else 0))
+    growth = spare = None
+    marks, bands = [], []
+
+    def report(month):
+        ordered = np.sort(balance)
+        marks.append(month)
+        bands.append([percentile(ordered, q) for q in (0.1, 0.5, 0.9)])
+
+    report(0)
+    for m in range(months):
+        if model == "bootstrap":
+            if m % 12 == 0:
+                growth = table[np.floor(uniforms(keys, m) * len(table)).astype(int)]
+            g = growth
+        else:
+            # Box-Muller pairs: cosine normal for even months, sine for the next.
+            if m % 2 == 0:
+                radius = np.sqrt(-2 * np.log(uniforms(keys, m)))
+                angle = 2 * np.pi * uniforms(keys, m + 1)
+                z, spare = radius * np.cos(angle), radius * np.sin(angle)
+            else:
+                z = spare
+            g = np.exp(drift + shock * z) if model == "lognormal" else 1 + drift + shock * z
+        if contributions is not None:
+            contribution = contributions[m + 1] if m + 1 < len(contributions) else 0
+        balance = balance * g + contribution
+        if (m + 1) % 12 == 0 or m + 1 == months:
+            report(m + 1)
+
+    p10, p50, p90 = np.array(bands).T
+    return Bands(np.array(marks), p10, p50, p90)
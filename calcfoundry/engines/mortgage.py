@@ -0,0 +1,162 @@
+"""
+Vectorized mortgage engine mirroring `mortgage_js` (tools/gen_mortgage_calculator.py).
+
+Every function takes scalars or equal-length arrays of principal, annual rate
+(percent), term (years), payments per year and extra payment per period, and
+broadcasts them like NumPy does. The math is the page's: periodic rate
+r = rate / 100 / frequency, N = term * frequency periods, level payment
+M = P r (1+r)^N / ((1+r)^N - 1) (P / N at 0%), and the closed-form payoff of
+payoff_{tool_id}.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Payoff:
+    periods: np.ndarray      # payments made (the term, if the payment never clears the loan)
+    interest: np.ndarray     # total interest paid
+    balance: np.ndarray      # balance still owed after the last period (0 when paid off)
+
+
+@dataclass
+class Quote:
+    """Everything mortgage_js reports, one element per loan."""
+    payment: np.ndarray           # base periodic payment M
+    periods: np.ndarray           # scheduled number of payments N
+    total_cost: np.ndarray        # P + base interest
+    interest: np.ndarray          # base total interest
+    extra_payment: np.ndarray     # M + extra
+    extra_periods: np.ndarray     # payments made with the extra payment
+    extra_total_cost: np.ndarray
+    extra_interest: np.ndarray
+    interest_saved: np.ndarray
+    periods_saved: np.ndarray     # N - extra_periods
+
+
+@dataclass
+class Schedule:
+    """
+    Per-period schedules, shape (loans, periods). Column k is payment k + 1.
+    Entries where `after_payoff` is True (the loan was already repaid, or its
+    term is shorter than the longest loan's) are zero.
+    """
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+    after_payoff: np.ndarray
+    payment: np.ndarray           # level payment per loan (M + extra)
+    periods: np.ndarray           # payments made per loan
+
+
+def _loans(principal, rate, term, frequency, extra):
+    P, rate, term, frequency, extra = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (principal, rate, term, frequency, extra))
+    )
+    r = rate / 100 / frequency
+    N = term * frequency
+    return P, r, N, extra
+
+
+def _growth(r, k):
+    return np.power(1 + r, k)
+
+
+def balance_after(P, r, X, k):
+    """Closed-form balance after k level payments X: P(1+r)^k - X((1+r)^k - 1)/r (P - Xk at 0%)."""
+    growth = _growth(r, k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(r > 0, (growth - 1) / np.where(r > 0, r, 1), k)
+    return P * growth - X * annuity
+
+
+def _payment(P, r, N):
+    growth = _growth(r, N)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r > 0, P * (r * growth) / (growth - 1), P / N)
+
+
+def level_payment(principal, rate, term, frequency=12):
+    """The scheduled periodic payment M."""
+    P, r, N, _ = _loans(principal, rate, term, frequency, 0)
+    return _payment(P, r, N)
+
+
+def payoff(P, r, X, max_periods):
+    """
+    Vectorized payoff_{tool_id}: payments until the balance clears,
+    n = ceil(-ln(1 - rP/X) / ln(1+r)), with an exact final payment B_{n-1}(1+r).
+    Loans X can't clear within max_periods stop there with a balance left.
+    """
+    P, r, X, max_periods = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (P, r, X, max_periods)))
+    amortizes = X > P * r
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exact = np.where(
+            r > 0,
+            -np.log1p(-np.where(amortizes, r * P / X, 0)) / np.log1p(r),
+            P / np.where(X != 0, X, 1),
+        )
+    n = np.maximum(1, np.ceil(exact - 1e-9))
+    paid = amortizes & (n <= max_periods)
+
+    periods = np.where(paid, n, max_periods)
+    last = balance_after(P, r, X, n - 1) * (1 + r)
+    remaining = balance_after(P, r, X, max_periods)
+    interest = np.where(paid, (n - 1) * X + last - P, max_periods * X + remaining - P)
+    return Payoff(periods, interest, np.where(paid, 0.0, remaining))
+
+
+def quote(principal, rate, term, frequency=12, extra=0.0):
+    """Prices every loan the way mortgage_js does, without and with the extra payment."""
+    P, r, N, extra = _loans(principal, rate, term, frequency, extra)
+    M = _payment(P, r, N)
+    max_periods = np.ceil(N)
+    base = payoff(P, r, M, max_periods)
+    with_extra = payoff(P, r, M + extra, max_periods)
+    return Quote(
+        payment=M,
+        periods=N,
+        total_cost=P + base.interest,
+        interest=base.interest,
+        extra_payment=M + extra,
+        extra_periods=with_extra.periods,
+        extra_total_cost=P + with_extra.interest,
+        extra_interest=with_extra.interest,
+        interest_saved=base.interest - with_extra.interest,
+        periods_saved=N - with_extra.periods,
+    )
+
+
+def schedule(principal, rate, term, frequency=12, extra=0.0):
+    """
+    Full amortization schedules for every loan as 2-D arrays.
+
+    Balances come from the closed form for every (loan, period) cell at once,
+    so there is no per-loan or per-period Python loop. Memory is
+    loans x longest term x 8 bytes per array; chunk large books.
+    """
+    P, r, N, extra = _loans(principal, rate, term, frequency, extra)
+    P, r, N, extra = (np.atleast_1d(a) for a in (P, r, N, extra))
+    X = _payment(P, r, N) + extra
+    max_periods = np.ceil(N)
+    periods = payoff(P, r, X, max_periods).periods
+
+    k = np.arange(1, int(max_periods.max()) + 1, dtype=float)
+    opening = balance_after(P[:, None], r[:, None], X[:, None], k[None, :] - 1)
+    interest = opening * r[:, None]
+    principal_paid = np.minimum(X[:, None] - interest, opening)
+    closing = opening - principal_paid
+    # Clear float dust on the final payment so a repaid loan reads exactly 0.
+    closing = np.where(k[None, :] == periods[:, None], np.where(np.abs(closing) < 1e-6, 0.0, closing), closing)
+
+    after_payoff = k[None, :] > periods[:, None]
+    return Schedule(
+        interest=np.where(after_payoff, 0.0, interest),
+        principal=np.where(after_payoff, 0.0, principal_paid),
+        balance=np.where(after_payoff, 0.0, closing),
+        after_payoff=after_payoff,
+        payment=X,
+        periods=periods,
+    )
@@ -0,0 +1,152 @@
+"""
+Drawdown reference engine mirroring the retirement calculator's decumulation
+phase (tools/gen_retirement_savings.py).
+
+A first-year withdrawal W is taken at the start of each retirement year and
+raised with inflation f; what is left grows by that year's return. At a fixed
+return R the balance after y withdrawals is (1+R)^y (B - W G(q, y)) with
+q = (1+f)/(1+R), so how long the money lasts is a closed form. The safe
+withdrawal rate is the largest W / B that funds every year of a horizon; it is
+found by bisection, run on every return sequence at once.
+
+The goal seek inverts the accumulation instead: the contribution, horizon or
+return that reaches a target balance in today's money. The first two are
+closed forms; the return is a bracketed Newton solve on whole arrays.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..returns import returns_table
+
+
+@dataclass
+class SafeWithdrawal:
+    """Sustainable first-year withdrawal rates (fractions of the starting balance)."""
+    fixed: float                # at the fixed return every year
+    historical: np.ndarray      # per historical start year, in table order
+    worst: float                # never failed historically
+    p90: float                  # succeeded in 90% of start years
+    median: float
+
+
+def years_lasting(balance, withdrawal, rate, inflation):
+    """Funded years (fractional) for inflation-raised withdrawals at a fixed return, or inf."""
+    B, W, R, f = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (balance, withdrawal, rate, inflation)))
+    q = (1 + f) / (1 + R)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        arg = 1 + (q - 1) * B / W
+        n = np.where(np.abs(q - 1) < 1e-12, B / W, np.log(arg) / np.log(q))
+    return np.where((W <= 0) | ((np.abs(q - 1) >= 1e-12) & (arg <= 0)), np.inf, n)
+
+
+def historical_growth(years, returns=None):
+    """Growth factors (start years, years): row s replays the table from year s, wrapping around."""
+    table = 1 + np.asarray(returns if returns is not None else returns_table(), dtype=float) / 100
+    return table[(np.arange(len(table))[:, None] + np.arange(years)[None, :]) % len(table)]
+
+
+def sustainable_rates(growth, inflation, iterations=40):
+    """
+    The highest first-year withdrawal rate that funds all withdrawals, for each
+    row of `growth` (lanes, years). Every lane bisects its own rate in [0, 1];
+    a step is one pass over the years with all the lanes' midpoints at once.
+    """
+    growth = np.atleast_2d(np.asarray(growth, dtype=float))
+    lanes, years = growth.shape
+    raise_ = np.power(1 + inflation, np.arange(years))
+    lo, hi = np.zeros(lanes), np.ones(lanes)
+    for _ in range(iterations):
+        rate = (lo + hi) / 2
+        balance = np.ones(lanes)
+        alive = np.ones(lanes, dtype=bool)
+        for y in range(years):
+            w = rate * raise_[y]
+            alive &= balance >= w - 1e-12
+            balance = np.where(alive, (balance - w) * growth[:, y], balance)
+        lo = np.where(alive, rate, lo)
+        hi = np.where(alive, hi, rate)
+    return lo
+
+
+def safe_withdrawal_rate(rate, inflation, years, returns=None, iterations=40):
+    """The page's solver: rate and inflation are annual percentages, years the horizon."""
+    years = int(round(years))
+    lanes = np.vstack([np.full((1, years), 1 + rate / 100), historical_growth(years, returns)])
+    rates = sustainable_rates(lanes, inflation / 100, iterations)
+    historical = rates[1:]
+    ordered = np.sort(historical)
+    return SafeWithdrawal(
+        float(rates[0]),
+        historical,
+        float(ordered[0]),
+        float(ordered[int(np.floor(0.1 * len(ordered)))]),
+        float(ordered[len(ordered) // 2]),
+    )
+
+
+# --- GOAL SEEK ---
+# Flat monthly contributions, compounded monthly at the real rate
+# j = ((1 + rate) / (1 + inflation) - 1) / 12, as the page values them.
+
+def _real_monthly(rate, inflation):
+    return ((1 + np.asarray(rate, dtype=float) / 100) / (1 + np.asarray(inflation, dtype=float) / 100) - 1) / 12
+
+
+def real_balance(principal, contribution, rate, inflation, months):
+    """Balance in today's money: P (1+j)^n + PMT ((1+j)^n - 1) / j (P + PMT n at j = 0)."""
+    j = _real_monthly(rate, inflation)
+    n = np.asarray(months, dtype=float)
+    g = np.power(1 + j, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return principal * g + contribution * np.where(j != 0, (g - 1) / np.where(j != 0, j, 1), n)
+
+
+def required_contribution(principal, target, rate, inflation, months):
+    """The monthly contribution that reaches `target`; zero or less if the savings already do."""
+    base = real_balance(principal, 0.0, rate, inflation, months)
+    return (target - base) / (real_balance(principal, 1.0, rate, inflation, months) - base)
+
+
+def required_months(principal, contribution, target, rate, inflation):
+    """Months until the balance reaches `target` (0 if it already has, inf if it never does)."""
+    P, PMT, T, j = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (principal, contribution, target, _real_monthly(rate, inflation))))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = PMT / np.where(j != 0, j, 1)
+        n = np.where(j != 0, np.log((T + a) / (P + a)) / np.log1p(j), (T - P) / PMT)
+    n = np.where(P >= T, 0.0, n)
+    return np.where(np.isfinite(n) & (n >= 0), n, np.inf)
+
+
+def required_return(principal, contribution, target, inflation, months, lo=-50.0, hi=100.0,
+                    tolerance=1e-6, guess=None):
+    """
+    The annual return (percent) that reaches `target`, by a bracketed Newton
+    solve run on every scenario at once: Newton steps on a central-difference
+    slope while they stay inside each scenario's shrinking bracket, bisection
+    otherwise. NaN where [lo, hi] holds no solution; lo where even lo reaches it.
+    """
+    P, PMT, T, f, n = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (principal, contribution, target, inflation, months)))
+    gap = lambda r: real_balance(P, PMT, r, f, n) - T
+    floor = float(lo)
+    lo, hi = np.full(P.shape, floor), np.full(P.shape, float(hi))
+    flo, fhi = gap(lo), gap(hi)
+    at_floor = flo >= 0
+    solvable = flo * fhi < 0
+    x = (lo + hi) / 2 if guess is None else np.clip(np.asarray(guess, dtype=float), lo, hi)
+    x = np.where((x > lo) & (x < hi), x, (lo + hi) / 2)
+    for _ in range(100):
+        fx = gap(x)
+        below = (fx < 0) == (flo < 0)
+        lo, flo = np.where(below, x, lo), np.where(below, fx, flo)
+        hi = np.where(below, hi, x)
+        h = 1e-6 * (1 + np.abs(x))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = x - fx * 2 * h / (gap(x + h) - gap(x - h))
+        step = np.where((step > lo) & (step < hi), step, (lo + hi) / 2)
+        done = np.abs(step - x) <= tolerance
+        x = step
+        if done[solvable].all():
+            break
+    return np.where(solvable, x, np.where(at_floor, floor, np.nan))
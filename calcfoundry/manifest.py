@@ -0,0 +1,116 @@
+"""
+Build manifest for incremental generation.
+
+The manifest sits next to the generated pages as .calcfoundry-manifest.json
+and records, per page slug, the spec hash and template version it was built
+from plus a stable publish date. A page whose hashes still match (and whose
+file still exists) is skipped without being opened.
+"""
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+
+MANIFEST_NAME = ".calcfoundry-manifest.json"
+MANIFEST_FORMAT = 1
+
+_DATE_LINE = re.compile(r"^date:\s*(\S+)\s*$", re.MULTILINE)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def source_hash(*paths):
+    """Short hash of the given source files, for versioning code the pages depend on."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _project_module(value):
+    """The repo module defining value (or value itself, if a module); None for the stdlib and packages."""
+    module = value if inspect.ismodule(value) else sys.modules.get(getattr(value, "__module__", None) or "")
+    path = getattr(module, "__file__", None)
+    return module if path and os.path.abspath(path).startswith(PROJECT_ROOT + os.sep) else None
+
+
+def _reachable_modules(function):
+    """The repo modules a function can reach through globals, transitively, sorted by name."""
+    seen = {}
+    pending = [_project_module(function)]
+    while pending:
+        module = pending.pop()
+        if module is None or module.__name__ in seen:
+            continue
+        seen[module.__name__] = module
+        pending.extend(_project_module(value) for value in vars(module).values()
+                       if inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value))
+    return [seen[name] for name in sorted(seen)]
+
+
+def _function_source(value):
+    # Variant grids carry a result function. Hash its source and that of every
+    # repo module it can reach (the spec module's helpers, the fragments it
+    # imports), so an edit to any of them rebuilds the pages.
+    try:
+        parts = [inspect.getsource(value)]
+        parts.extend(inspect.getsource(module) for module in _reachable_modules(value))
+        return "\n".join(parts)
+    except (OSError, TypeError):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+
+
+def spec_hash(spec):
+    """Stable content hash of every field of a spec."""
+    payload = json.dumps(dataclasses.asdict(spec), sort_keys=True, ensure_ascii=False, default=_function_source)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def manifest_path(output_dir):
+    return os.path.join(output_dir, MANIFEST_NAME)
+
+
+def load_manifest(output_dir):
+    """Returns {slug: entry}. A missing or unreadable manifest is an empty one."""
+    try:
+        with open(manifest_path(output_dir), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("format") != MANIFEST_FORMAT:
+        return {}
+    return data.get("pages", {})
+
+
+def save_manifest(output_dir, pages):
+    """Writes the manifest atomically, sorted by slug for stable diffs."""
+    path = manifest_path(output_dir)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"format": MANIFEST_FORMAT, "pages": dict(sorted(pages.items()))}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def existing_date(path):
+    """Reads the front-matter date of a page generated before the manifest existed."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            head = f.read(512)
+    except OSError:
+        return None
+    match = _DATE_LINE.search(head)
+    return match.group(1) if match else None
+
+
+def is_current(entry, digest, template_version, path):
+    return (
+        entry is not None
+        and entry.get("spec_hash") == digest
+        and entry.get("template_version") == template_version
+        and os.path.exists(path)
+    )
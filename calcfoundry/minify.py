@@ -0,0 +1,496 @@
+"""
+Build-time minifier for the JS and CSS embedded in calculator pages.
+
+Pure Python, no dependencies. JS is tokenized (strings, template literals,
+regex literals and comments are understood), re-emitted without comments or
+redundant whitespace, and local identifiers are renamed to short names.
+
+Renaming is deliberately conservative:
+  * only names declared inside the snippet (let/const/var, function names,
+    parameters, catch bindings) are renamed, never properties or globals;
+  * with top_level=True, names declared at the snippet's top level are page
+    globals (onclick handlers call them) and are kept;
+  * a name that ever appears as an object key or shorthand property, or any
+    name in `reserved`, is kept; snippets using eval or with are not renamed;
+  * new names never collide with any identifier that appears in the snippet.
+Line breaks that automatic semicolon insertion could depend on are kept.
+"""
+
+import hashlib
+import re
+from dataclasses import replace
+from functools import lru_cache
+
+# --- TOKENIZER ---
+
+_NAME = re.compile(r"(?:[^\W\d]|\$)(?:\w|\$)*")
+_NUMBER = re.compile(r"0[xXbBoO][\da-fA-F_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?")
+_PUNCTUATORS = sorted(
+    """>>>= ... === !== **= <<= >>= >>> &&= ||= ??= => == != <= >= && || ?? ?. ++ -- += -= *= /= %= &= |= ^= ** << >>
+    { } ( ) [ ] ; , < > + - * / % & | ^ ! ~ ? : = . @ #""".split(),
+    key=len,
+    reverse=True,
+)
+_REGEX_AFTER_WORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else", "yield", "await",
+}
+_KEYWORDS = {
+    "break", "case", "catch", "class", "const", "continue", "debugger", "default", "delete", "do", "else", "enum",
+    "export", "extends", "false", "finally", "for", "function", "if", "import", "in", "instanceof", "new", "null",
+    "return", "super", "switch", "this", "throw", "true", "try", "typeof", "var", "void", "while", "with", "yield",
+    "let", "static", "implements", "interface", "package", "private", "protected", "public", "await", "async", "of",
+    "arguments", "eval", "undefined", "NaN", "Infinity",
+}
+
+# Tokens after which a line break may end the statement, and tokens that may start one.
+_ENDERS = {")", "]", "}", "++", "--"}
+_STARTERS = {"(", "[", "{", "++", "--", "!", "~", "+", "-"}
+
+
+class Token:
+    __slots__ = ("kind", "text", "newline")
+
+    def __init__(self, kind, text, newline):
+        self.kind = kind          # name, num, str, tpl, regex, punct
+        self.text = text
+        self.newline = newline    # a line break came before this token
+
+    def __repr__(self):
+        return f"Token({self.kind!r}, {self.text!r})"
+
+
+def _scan_quoted(src, i, quote):
+    j = i + 1
+    while src[j] != quote:
+        j += 2 if src[j] == "\\" else 1
+    return j + 1
+
+
+def _scan_template(src, i):
+    """Scans template text from src[i] (a backtick or the closing brace of ${...}) to the next ` or ${."""
+    j = i + 1
+    while True:
+        c = src[j]
+        if c == "\\":
+            j += 2
+        elif c == "`":
+            return j + 1, False
+        elif c == "$" and src[j + 1] == "{":
+            return j + 2, True
+        else:
+            j += 1
+
+
+def _scan_regex(src, i):
+    j = i + 1
+    in_class = False
+    while True:
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "\n":
+            raise ValueError("Unterminated regex literal")
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            break
+        j += 1
+    j += 1
+    while j < len(src) and (src[j].isalnum() or src[j] == "_"):
+        j += 1
+    return j
+
+
+def _regex_allowed(prev):
+    if prev is None:
+        return True
+    if prev.kind == "name":
+        return prev.text in _REGEX_AFTER_WORDS
+    if prev.kind == "punct":
+        return prev.text not in (")", "]", "}")
+    return False
+
+
+def tokenize(src):
+    tokens = []
+    templates = []   # brace depth inside each open ${...}
+    i, n, newline = 0, len(src), False
+    while i < n:
+        c = src[i]
+        if c in " \t\r\n\f\v\u00a0\ufeff":
+            newline = newline or c == "\n"
+            i += 1
+            continue
+        if src.startswith("//", i):
+            end = src.find("\n", i)
+            i = n if end < 0 else end
+            continue
+        if src.startswith("/*", i):
+            end = src.index("*/", i + 2) + 2
+            newline = newline or "\n" in src[i:end]
+            i = end
+            continue
+
+        prev = tokens[-1] if tokens else None
+        if c in "'\"":
+            end = _scan_quoted(src, i, c)
+            tokens.append(Token("str", src[i:end], newline))
+        elif c == "`" or (c == "}" and templates and templates[-1] == 0):
+            if c == "}":
+                templates.pop()
+            end, opened = _scan_template(src, i)
+            if opened:
+                templates.append(0)
+            tokens.append(Token("tpl", src[i:end], newline))
+        elif c == "/" and _regex_allowed(prev):
+            end = _scan_regex(src, i)
+            tokens.append(Token("regex", src[i:end], newline))
+        elif c.isdigit() or (c == "." and src[i + 1:i + 2].isdigit()):
+            end = _NUMBER.match(src, i).end()
+            tokens.append(Token("num", src[i:end], newline))
+        else:
+            match = _NAME.match(src, i)
+            if match:
+                end = match.end()
+                tokens.append(Token("name", src[i:end], newline))
+            else:
+                text = next((p for p in _PUNCTUATORS if src.startswith(p, i)), c)
+                if text == "?." and src[i + 2:i + 3].isdigit():
+                    text = "?"
+                if templates and text == "{":
+                    templates[-1] += 1
+                elif templates and text == "}":
+                    templates[-1] -= 1
+                end = i + len(text)
+                tokens.append(Token("punct", text, newline))
+        i = end
+        newline = False
+    return tokens
+
+
+# --- EMITTER ---
+
+def _ends_statement(token):
+    if token.kind == "punct":
+        return token.text in _ENDERS
+    if token.kind == "tpl":
+        return token.text.endswith("`")
+    return True
+
+
+def _starts_statement(token):
+    if token.kind == "punct":
+        return token.text in _STARTERS
+    if token.kind == "tpl":
+        return token.text.startswith("`")
+    return True
+
+
+def _is_word(c):
+    return c.isalnum() or c in "_$\\" or ord(c) > 127
+
+
+def emit(tokens):
+    out = []
+    prev = None
+    for token in tokens:
+        text = token.text
+        if prev is not None:
+            if token.newline and _ends_statement(prev) and _starts_statement(token):
+                out.append("\n")
+            elif _is_word(prev.text[-1]) and _is_word(text[0]):
+                out.append(" ")
+            elif prev.kind == "regex" and _is_word(text[0]):
+                out.append(" ")
+            elif prev.kind == "num" and text[0] == ".":
+                out.append(" ")
+            elif prev.text[-1] in "+-" and text[0] == prev.text[-1]:
+                out.append(" ")
+            elif prev.text[-1] == "<" and text.startswith("!--"):
+                out.append(" ")
+        out.append(text)
+        prev = token
+    return "".join(out)
+
+
+# --- MANGLER ---
+
+def _matching(tokens, i):
+    """Index of the bracket closing tokens[i]."""
+    pairs = {"(": ")", "[": "]", "{": "}"}
+    opening, closing = tokens[i].text, pairs[tokens[i].text]
+    depth = 0
+    for j in range(i, len(tokens)):
+        if tokens[j].kind != "punct":
+            continue
+        if tokens[j].text == opening:
+            depth += 1
+        elif tokens[j].text == closing:
+            depth -= 1
+            if depth == 0:
+                return j
+    return len(tokens) - 1
+
+
+def _pattern_names(tokens, start, end):
+    """Plain names bound by a parameter list or array pattern between tokens[start] and tokens[end]."""
+    names = []
+    depth = 0
+    for j in range(start + 1, end):
+        token = tokens[j]
+        if token.kind == "punct" and token.text in "([{":
+            depth += 1
+        elif token.kind == "punct" and token.text in ")]}":
+            depth -= 1
+        elif token.kind == "name" and depth == 0 and tokens[j - 1].text in ("(", "[", ",", "..."):
+            names.append(j)
+    return names
+
+
+def _declarator_names(tokens, i):
+    """Binding names of the let/const/var declaration whose keyword is tokens[i]."""
+    names = []
+    j = i + 1
+    while j < len(tokens):
+        token = tokens[j]
+        if token.kind == "name":
+            names.append(j)
+        elif token.text == "[":
+            close = _matching(tokens, j)
+            names.extend(_pattern_names(tokens, j, close))
+            j = close
+        elif token.text == "{":
+            j = _matching(tokens, j)     # object patterns bind shorthand keys; leave them alone
+        else:
+            break
+        # Skip the initializer up to the next declarator.
+        j += 1
+        depth = 0
+        while j < len(tokens):
+            token = tokens[j]
+            if token.kind == "punct" and token.text in "([{":
+                depth += 1
+            elif token.kind == "punct" and token.text in ")]}":
+                if depth == 0:
+                    return names
+                depth -= 1
+            elif depth == 0 and (token.text in (",", ";") or token.text in ("of", "in") and token.kind == "name"):
+                break
+            elif depth == 0 and token.newline and _ends_statement(tokens[j - 1]) and token.kind == "name":
+                return names
+            j += 1
+        if j >= len(tokens) or tokens[j].text != ",":
+            break
+        j += 1
+    return names
+
+
+def _declarations(tokens):
+    """Yields (token index, brace depth) for every binding the snippet declares."""
+    depth = 0
+    for i, token in enumerate(tokens):
+        if token.kind == "punct":
+            if token.text == "{":
+                depth += 1
+            elif token.text == "}":
+                depth -= 1
+            elif token.text == "=>":
+                if tokens[i - 1].kind == "name":
+                    yield i - 1, depth + 1
+                elif tokens[i - 1].text == ")":
+                    close = i - 1
+                    depth_back, j = 0, close
+                    while j >= 0:
+                        if tokens[j].text == ")":
+                            depth_back += 1
+                        elif tokens[j].text == "(":
+                            depth_back -= 1
+                            if depth_back == 0:
+                                break
+                        j -= 1
+                    for name in _pattern_names(tokens, j, close):
+                        yield name, depth + 1
+            continue
+        if token.kind != "name" or (i and tokens[i - 1].text in (".", "?.")):
+            continue
+        if token.text in ("let", "const", "var"):
+            for name in _declarator_names(tokens, i):
+                yield name, depth
+        elif token.text == "function":
+            j = i + 1
+            if j < len(tokens) and tokens[j].text == "*":
+                j += 1
+            if j < len(tokens) and tokens[j].kind == "name":
+                yield j, depth
+                j += 1
+            if j < len(tokens) and tokens[j].text == "(":
+                for name in _pattern_names(tokens, j, _matching(tokens, j)):
+                    yield name, depth + 1
+        elif token.text == "catch" and i + 1 < len(tokens) and tokens[i + 1].text == "(":
+            for name in _pattern_names(tokens, i + 1, _matching(tokens, i + 1)):
+                yield name, depth + 1
+
+
+def _short_names():
+    first = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$"
+    rest = first + "0123456789"
+    yield from first
+    for a in first:
+        for b in rest:
+            yield a + b
+    for a in first:
+        for b in rest:
+            for c in rest:
+                yield a + b + c
+
+
+_BLOCK_AFTER = {")", ";", "{", "}", "=>", "else", "try", "finally", "do"}
+
+
+def _opens_object(tokens, i):
+    # Anything that isn't clearly a block counts as an object literal; that only ever keeps more names.
+    return i > 0 and tokens[i - 1].text not in _BLOCK_AFTER
+
+
+def _object_keys(tokens):
+    """Names used as object keys, shorthand properties or object-pattern bindings."""
+    keys = set()
+    stack = []
+    for i, token in enumerate(tokens):
+        if token.kind == "tpl":
+            if token.text.startswith("}") and stack:
+                stack.pop()
+            if token.text.endswith("${"):
+                stack.append("${")
+        elif token.kind == "punct":
+            if token.text in ("(", "["):
+                stack.append(token.text)
+            elif token.text == "{":
+                stack.append("object" if _opens_object(tokens, i) else "block")
+            elif token.text in (")", "]", "}") and stack:
+                stack.pop()
+        elif token.kind == "name" and stack and stack[-1] == "object" and _is_reference(tokens, i):
+            after = tokens[i + 1].text if i + 1 < len(tokens) else None
+            if tokens[i - 1].text in ("{", ",", "...") and after in (":", ",", "}", "(", "="):
+                keys.add(token.text)
+    return keys
+
+
+def _is_reference(tokens, i):
+    prev = tokens[i - 1].text if i else None
+    return prev not in (".", "?.")
+
+
+def mangle(tokens, reserved=(), top_level=False):
+    """Renames local bindings in place (see the module docstring for the rules)."""
+    names = [t.text for t in tokens if t.kind == "name"]
+    if "eval" in names or "with" in names:
+        return tokens
+
+    keep = set(reserved) | _KEYWORDS | _object_keys(tokens)
+
+    declared = set()
+    for i, depth in _declarations(tokens):
+        name = tokens[i].text
+        if top_level and depth == 0:
+            keep.add(name)
+        else:
+            declared.add(name)
+    declared -= keep
+    if not declared:
+        return tokens
+
+    counts = {}
+    for i, token in enumerate(tokens):
+        if token.kind == "name" and token.text in declared and _is_reference(tokens, i):
+            counts[token.text] = counts.get(token.text, 0) + 1
+
+    taken = set(names) | keep
+    fresh = (name for name in _short_names() if name not in taken)
+    renames = {}
+    for name in sorted(counts, key=lambda n: (-counts[n] * len(n), n)):
+        short = next(fresh)
+        if len(short) < len(name):
+            renames[name] = short
+
+    for i, token in enumerate(tokens):
+        if token.kind == "name" and token.text in renames and _is_reference(tokens, i):
+            token.text = renames[token.text]
+    return tokens
+
+
+# --- PUBLIC API ---
+
+# {tool_id} placeholders become a plain identifier so fragments tokenize (and cache) independently of the page.
+_TOOL_ID = "{tool_id}"
+_TOOL_ID_SENTINEL = "__cf_tool_id__"
+
+_CSS_TOKENS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|(\s+)|([^"'/\s]+|/)""", re.S)
+
+
+@lru_cache(maxsize=1024)
+def minify_js(js, reserved=(), top_level=False, mangle_names=True):
+    """Returns js without comments and redundant whitespace, with local names shortened."""
+    if not js.strip():
+        return js
+    tokens = tokenize(js.replace(_TOOL_ID, _TOOL_ID_SENTINEL))
+    if mangle_names:
+        mangle(tokens, reserved, top_level)
+    return emit(tokens).replace(_TOOL_ID_SENTINEL, _TOOL_ID)
+
+
+@lru_cache(maxsize=1024)
+def minify_css(css):
+    """Returns css without comments and redundant whitespace. Strings are left as written."""
+    out, strings = [], []
+    for string, comment, space, other in _CSS_TOKENS.findall(css):
+        if string:
+            strings.append(string)
+            out.append("\0")
+        elif space or comment:
+            out.append(" ")
+        else:
+            out.append(other)
+    text = re.sub(" +", " ", "".join(out)).strip()
+    text = re.sub(r" ?([{};,>]) ?", r"\1", text)
+    text = text.replace(": ", ":").replace(";}", "}")
+    parts = text.split("\0")
+    return "".join(part + (strings[i] if i < len(strings) else "") for i, part in enumerate(parts))
+
+
+def declared_globals(js):
+    """Names a page-level script declares at its top level."""
+    tokens = tokenize(js.replace(_TOOL_ID, _TOOL_ID_SENTINEL))
+    return tuple(sorted({tokens[i].text for i, depth in _declarations(tokens) if depth == 0}))
+
+
+# Names the page template references from outside calculation_js.
+TEMPLATE_NAMES = ("resultText", "historySummary", "CalcFoundry")
+
+
+def minify_spec(spec):
+    """
+    Minifies a spec's setup_js, init_js, calculation_js and extra_css.
+    Returns (minified spec, bytes saved).
+    """
+    page_globals = TEMPLATE_NAMES + declared_globals(spec.setup_js)
+    minified = replace(
+        spec,
+        setup_js=minify_js(spec.setup_js, page_globals, top_level=True),
+        init_js=minify_js(spec.init_js, page_globals),
+        calculation_js=minify_js(spec.calculation_js, page_globals),
+        extra_css=minify_css(spec.extra_css),
+    )
+    saved = sum(
+        len(getattr(spec, field).encode("utf-8")) - len(getattr(minified, field).encode("utf-8"))
+        for field in ("setup_js", "init_js", "calculation_js", "extra_css")
+    )
+    return minified, saved
+
+
+# Any change to the minifier changes the output of every page.
+with open(__file__, "rb") as _source:
+    MINIFIER_VERSION = hashlib.sha256(_source.read()).hexdigest()[:16]
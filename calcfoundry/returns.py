@@ -0,0 +1,152 @@
+"""
+Stochastic-return controls shared by the investment and retirement calculators.
+
+A calculator adds INPUTS_HTML, OUTPUT_HTML and SETUP_JS to its spec and calls
+runMonteCarlo_{tool_id}(principal, contribution, ratePercent, months,
+contributions) from its calculation_js, where contributions is an optional
+month-by-month schedule (see calcfoundry.cashflows). The simulation itself is
+CalcFoundry.monteCarlo in the shared runtime (a Web Worker);
+calcfoundry.engines.montecarlo is its NumPy twin.
+
+The bootstrap model resamples whole years from SP500_TOTAL_RETURNS, which is
+baked into each page at build time.
+"""
+
+import json
+
+# S&P 500 total return (dividends reinvested), calendar years, in percent.
+SP500_TOTAL_RETURNS = {
+    1970: 4.01, 1971: 14.31, 1972: 18.98, 1973: -14.66, 1974: -26.47,
+    1975: 37.20, 1976: 23.84, 1977: -7.18, 1978: 6.56, 1979: 18.44,
+    1980: 32.42, 1981: -4.91, 1982: 21.55, 1983: 22.56, 1984: 6.27,
+    1985: 31.73, 1986: 18.67, 1987: 5.25, 1988: 16.61, 1989: 31.69,
+    1990: -3.10, 1991: 30.47, 1992: 7.62, 1993: 10.08, 1994: 1.32,
+    1995: 37.58, 1996: 22.96, 1997: 33.36, 1998: 28.58, 1999: 21.04,
+    2000: -9.10, 2001: -11.89, 2002: -22.10, 2003: 28.68, 2004: 10.88,
+    2005: 4.91, 2006: 15.79, 2007: 5.49, 2008: -37.00, 2009: 26.46,
+    2010: 15.06, 2011: 2.11, 2012: 16.00, 2013: 32.39, 2014: 13.69,
+    2015: 1.38, 2016: 11.96, 2017: 21.83, 2018: -4.38, 2019: 31.49,
+    2020: 18.40, 2021: 28.71, 2022: -18.11, 2023: 26.29,
+}
+
+MODELS = ("normal", "lognormal", "bootstrap")
+DEFAULT_SEED = 42
+DEFAULT_VOLATILITY = 15.0
+
+
+def returns_table():
+    """The bootstrap table in year order."""
+    return [SP500_TOTAL_RETURNS[year] for year in sorted(SP500_TOTAL_RETURNS)]
+
+
+_FIRST_YEAR, _LAST_YEAR = min(SP500_TOTAL_RETURNS), max(SP500_TOTAL_RETURNS)
+
+INPUTS_HTML = f"""
+<details class="mc-options">
+    <summary>Random returns (Monte Carlo)</summary>
+    <label>Return Model</label>
+    <select id="mc_model_{{tool_id}}">
+        <option value="off" selected>Off (fixed rate)</option>
+        <option value="normal">Normal (mean = your rate)</option>
+        <option value="lognormal">Lognormal (mean = your rate)</option>
+        <option value="bootstrap">Historical S&amp;P 500 years ({_FIRST_YEAR}-{_LAST_YEAR})</option>
+    </select>
+    <div class="row-inputs">
+        <div>
+            <label>Volatility (% / yr)</label>
+            <input type="number" id="mc_volatility_{{tool_id}}" value="{DEFAULT_VOLATILITY:g}" step="0.5">
+        </div>
+        <div>
+            <label>Paths</label>
+            <select id="mc_paths_{{tool_id}}">
+                <option value="10000" selected>10,000</option>
+                <option value="25000">25,000</option>
+                <option value="50000">50,000</option>
+                <option value="100000">100,000</option>
+            </select>
+        </div>
+        <div>
+            <label>Seed</label>
+            <input type="number" id="mc_seed_{{tool_id}}" value="{DEFAULT_SEED}">
+        </div>
+    </div>
+</details>
+"""
+
+OUTPUT_HTML = """
+<div id="mc_box_{tool_id}" style="display:none;">
+    <h4 style="margin-bottom:0;">Monte Carlo Range <small id="mc_status_{tool_id}" style="font-weight:normal; opacity:0.7;"></small></h4>
+    <canvas id="mc_chart_{tool_id}" class="calc-chart"></canvas>
+    <div class="calc-legend"><span style="background:rgba(76,175,80,0.55)"></span>P10-P50<span style="background:rgba(76,175,80,0.3)"></span>P50-P90</div>
+    <div id="mc_summary_{tool_id}" style="margin-top:8px;"></div>
+</div>
+"""
+
+SETUP_JS = """
+    const MC_RETURNS_{tool_id} = """ + json.dumps(returns_table()) + """;
+
+    // Starts (or restarts) the simulation for the current inputs and streams
+    // the yearly P10/P50/P90 bands into the chart. Does nothing when the model is off.
+    function runMonteCarlo_{tool_id}(principal, contribution, ratePercent, months, contributions) {
+        const box = document.getElementById('mc_box_{tool_id}');
+        const model = document.getElementById('mc_model_{tool_id}').value;
+        if (model === 'off' || !(months > 0)) {
+            box.style.display = 'none';
+            return;
+        }
+        box.style.display = 'block';
+        const config = {
+            paths: parseInt(document.getElementById('mc_paths_{tool_id}').value),
+            months: Math.round(months),
+            principal: principal,
+            contribution: contribution,
+            contributions: contributions || null,
+            model: model,
+            mean: ratePercent,
+            volatility: parseFloat(document.getElementById('mc_volatility_{tool_id}').value) || 0,
+            seed: parseInt(document.getElementById('mc_seed_{tool_id}').value) || 0,
+            returns: MC_RETURNS_{tool_id},
+        };
+        const years = config.months / 12;
+        const count = Math.ceil(years) + 1;
+        const p10 = new Float64Array(count), p50 = new Float64Array(count), p90 = new Float64Array(count);
+        let filled = 0;
+        const status = document.getElementById('mc_status_{tool_id}');
+        const fmt = (num) => '$' + Math.round(num).toLocaleString('en-US');
+        status.innerText = `(simulating ${config.paths.toLocaleString('en-US')} paths...)`;
+
+        const draw = () => {
+            const low = p10.subarray(0, filled).map(v => Math.max(0, v));
+            CalcFoundry.stackedChart('mc_chart_{tool_id}', [
+                { values: low, color: 'rgba(0,0,0,0)' },
+                { values: p50.subarray(0, filled).map((v, i) => Math.max(0, v - low[i])), color: 'rgba(76,175,80,0.55)' },
+                { values: p90.subarray(0, filled).map((v, i) => Math.max(0, v - Math.max(low[i], p50[i]))), color: 'rgba(76,175,80,0.3)' },
+            ], {
+                xMax: Math.min(years, (filled - 1)),
+                xLabel: (x) => (Math.round(x * 10) / 10) + 'y',
+                yLabel: fmt,
+            });
+        };
+        CalcFoundry.monteCarlo('{tool_id}', config, function(band) {
+            p10[filled] = band.p10;
+            p50[filled] = band.p50;
+            p90[filled] = band.p90;
+            filled++;
+            if (filled > 1) draw();
+        }, function() {
+            status.innerText = `(${config.paths.toLocaleString('en-US')} paths, seed ${config.seed})`;
+            document.getElementById('mc_summary_{tool_id}').innerHTML =
+                `<small>After ${Math.round(years * 10) / 10} years: ` +
+                `P10 <strong>${fmt(p10[filled - 1])}</strong> · ` +
+                `median <strong>${fmt(p50[filled - 1])}</strong> · ` +
+                `P90 <strong>${fmt(p90[filled - 1])}</strong></small>`;
+        });
+    }
+"""
+
+CSS = """
+  .mc-options { margin-top: 15px; }
+  .mc-options summary { cursor: pointer; font-weight: bold; }
+  .mc-options .row-inputs { display: flex; gap: 10px; }
+  .mc-options .row-inputs div { flex: 1; }
+"""
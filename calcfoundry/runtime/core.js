@@ -0,0 +1,345 @@
+/* CalcFoundry core runtime: history panel, result box, downloads, virtualized tables, canvas charts,
+   the Monte Carlo worker and the Plotly loader.
+   Shared by every calculator page; each page only calls CalcFoundry.init() with its tool id. */
+(function () {
+    const tools = {};
+
+    function read(toolId) {
+        return JSON.parse(localStorage.getItem(tools[toolId].storageKey)) || [];
+    }
+
+    function renderHistory(toolId) {
+        const list = document.getElementById('history_list_' + toolId);
+        if (!list) return;
+        list.innerHTML = read(toolId).map(item => `<li>${item}</li>`).join('');
+    }
+
+    function addToHistory(toolId, item) {
+        const config = tools[toolId];
+        let history = read(toolId);
+        if (history.length === 0 || history[0] !== item) {
+            history.unshift(item);
+            if (history.length > config.limit) history.pop();
+            localStorage.setItem(config.storageKey, JSON.stringify(history));
+            renderHistory(toolId);
+        }
+    }
+
+    function clearHistory(toolId) {
+        localStorage.removeItem(tools[toolId].storageKey);
+        renderHistory(toolId);
+    }
+
+    function downloadHistory(toolId) {
+        const config = tools[toolId];
+        const history = read(toolId);
+        if (history.length === 0) {
+            alert("No history to download.");
+            return;
+        }
+
+        let content = "CalcFoundry - " + config.title + " History\n";
+        content += "Date: " + new Date().toLocaleDateString() + "\n";
+        content += "-----------------------------------\n\n";
+
+        history.forEach(item => {
+            let cleanItem = item.replace(/<[^>]*>?/gm, '');
+            content += cleanItem + "\n";
+        });
+
+        saveBlob([content], config.downloadName + "_History_" + new Date().toISOString().slice(0,10) + ".txt", 'text/plain');
+    }
+
+    // Downloads a Blob built from a list of string parts (never joined into one string).
+    function saveBlob(parts, fileName, type) {
+        const blob = new Blob(parts, { type: type });
+        const url = window.URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = fileName;
+        document.body.appendChild(a);
+        a.click();
+        document.body.removeChild(a);
+        window.URL.revokeObjectURL(url);
+    }
+
+    // Writes rowCount rows as CSV, chunkSize rows per Blob part, so a long
+    // table never becomes one giant string. row(i) returns an array of cells.
+    function downloadCSV(fileName, header, rowCount, row, chunkSize) {
+        chunkSize = chunkSize || 500;
+        const parts = [header.join(',') + '\n'];
+        for (let start = 0; start < rowCount; start += chunkSize) {
+            const end = Math.min(rowCount, start + chunkSize);
+            const lines = new Array(end - start);
+            for (let i = start; i < end; i++) lines[i - start] = row(i).join(',');
+            parts.push(lines.join('\n') + '\n');
+        }
+        saveBlob(parts, fileName, 'text/csv');
+    }
+
+    // Renders only the rows scrolled into view (plus a small overscan) of a
+    // fixed-row-height table inside a scrolling container. renderRow(i)
+    // returns the cells' HTML for row i; call the returned update(rowCount)
+    // after the data changes.
+    function virtualTable(containerId, header, renderRow, rowHeight) {
+        const box = document.getElementById(containerId);
+        if (!box) return function() {};
+        rowHeight = rowHeight || 28;
+        const overscan = 8;
+        let rowCount = 0;
+        let first = -1, last = -1, pending = false;
+
+        box.innerHTML = `<div class="vt-row vt-head">${header}</div>`
+            + `<div class="vt-body"><div class="vt-spacer"></div><div class="vt-rows"></div></div>`;
+        const body = box.lastChild;
+        const spacer = body.firstChild;
+        const rows = body.lastChild;
+
+        function draw() {
+            pending = false;
+            const height = body.clientHeight || rowHeight * 20;
+            const start = Math.max(0, Math.floor(body.scrollTop / rowHeight) - overscan);
+            const end = Math.min(rowCount, Math.ceil((body.scrollTop + height) / rowHeight) + overscan);
+            if (start === first && end === last) return;
+            first = start;
+            last = end;
+            let html = '';
+            for (let i = start; i < end; i++) html += `<div class="vt-row">${renderRow(i)}</div>`;
+            rows.style.transform = `translateY(${start * rowHeight}px)`;
+            rows.innerHTML = html;
+        }
+
+        body.addEventListener('scroll', function() {
+            if (!pending) {
+                pending = true;
+                window.requestAnimationFrame(draw);
+            }
+        });
+
+        return function update(count) {
+            rowCount = count;
+            spacer.style.height = (rowCount * rowHeight) + 'px';
+            first = last = -1;
+            draw();
+        };
+    }
+
+    // Stacked area chart on a <canvas>, cheap enough to redraw on every
+    // keystroke (no library, one path per layer). layers is a list of
+    // { values, color } drawn bottom-up, all the same length; x runs from 0 to
+    // xMax across the points. Options: xMax, xLabel(x), yLabel(y).
+    function stackedChart(canvasId, layers, options) {
+        const canvas = document.getElementById(canvasId);
+        if (!canvas || !canvas.getContext || layers.length === 0) return;
+        const ratio = window.devicePixelRatio || 1;
+        const width = canvas.clientWidth, height = canvas.clientHeight;
+        if (canvas.width !== Math.round(width * ratio) || canvas.height !== Math.round(height * ratio)) {
+            canvas.width = Math.round(width * ratio);
+            canvas.height = Math.round(height * ratio);
+        }
+        const ctx = canvas.getContext('2d');
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        ctx.clearRect(0, 0, width, height);
+
+        const count = layers[0].values.length;
+        const top = new Float64Array(count);
+        for (const layer of layers) {
+            for (let i = 0; i < count; i++) top[i] += layer.values[i];
+        }
+        let yMax = 0;
+        for (let i = 0; i < count; i++) yMax = Math.max(yMax, top[i]);
+        if (!(yMax > 0) || count < 2) return;
+
+        const pad = { left: 8, right: 8, top: 18, bottom: 18 };
+        const plotW = width - pad.left - pad.right, plotH = height - pad.top - pad.bottom;
+        const x = (i) => pad.left + plotW * i / (count - 1);
+        const y = (v) => pad.top + plotH * (1 - v / yMax);
+
+        // Each layer fills the band between the running totals below and above it.
+        const base = new Float64Array(count);
+        for (const layer of layers) {
+            ctx.beginPath();
+            ctx.moveTo(x(0), y(base[0] + layer.values[0]));
+            for (let i = 1; i < count; i++) ctx.lineTo(x(i), y(base[i] + layer.values[i]));
+            for (let i = count - 1; i >= 0; i--) ctx.lineTo(x(i), y(base[i]));
+            ctx.closePath();
+            ctx.fillStyle = layer.color;
+            ctx.fill();
+            for (let i = 0; i < count; i++) base[i] += layer.values[i];
+        }
+
+        ctx.fillStyle = '#bbb';
+        ctx.font = '11px sans-serif';
+        ctx.textBaseline = 'top';
+        ctx.textAlign = 'left';
+        ctx.fillText(options.yLabel ? options.yLabel(yMax) : String(yMax), pad.left, 2);
+        ctx.textBaseline = 'bottom';
+        const xMax = options.xMax || count - 1;
+        for (const frac of [0, 0.5, 1]) {
+            ctx.textAlign = frac === 0 ? 'left' : frac === 1 ? 'right' : 'center';
+            ctx.fillText(options.xLabel ? options.xLabel(xMax * frac) : String(xMax * frac), pad.left + plotW * frac, height);
+        }
+    }
+
+    // --- MONTE CARLO ---
+    // Seeded return simulation, run in a Web Worker built from this function's
+    // source (so it must not touch anything outside itself). Random numbers
+    // come from a counter-based hash of (seed, path, step), so every draw is
+    // reproducible on its own and calcfoundry/engines/montecarlo.py reproduces
+    // the same paths. The state is one Float64Array balance per path; after
+    // every year (a chunk) the P10/P50/P90 balances are posted and the paths
+    // move on, so paths x months is never held in memory.
+    function monteCarloWorker() {
+        function mix(x) {
+            x ^= x >>> 16;
+            x = Math.imul(x, 0x7feb352d);
+            x ^= x >>> 15;
+            x = Math.imul(x, 0x846ca68b);
+            x ^= x >>> 16;
+            return x >>> 0;
+        }
+
+        function percentile(sorted, q) {
+            const h = q * (sorted.length - 1);
+            const lo = Math.floor(h), t = h - lo;
+            const a = sorted[lo], b = sorted[Math.min(lo + 1, sorted.length - 1)];
+            return t >= 0.5 ? b - (b - a) * (1 - t) : a + (b - a) * t;
+        }
+
+        // config: { paths, months, principal, contribution, model ('normal',
+        // 'lognormal' or 'bootstrap'), mean and volatility (annual %), seed,
+        // returns (annual % table for bootstrap), contributions (optional
+        // per-month schedule; index k is paid at the end of month k) }.
+        function simulate(config, emit) {
+            const paths = config.paths, months = config.months;
+            const mean = config.mean / 100, vol = config.volatility / 100;
+            const drift = config.model === 'lognormal' ? (Math.log1p(mean) - vol * vol / 2) / 12 : mean / 12;
+            const shock = vol / Math.sqrt(12);
+            const table = (config.returns || []).map(r => Math.pow(1 + r / 100, 1 / 12));
+            const keys = new Uint32Array(paths);
+            const seedKey = mix(config.seed >>> 0);
+            for (let p = 0; p < paths; p++) keys[p] = mix(seedKey ^ p);
+
+            const balance = new Float64Array(paths).fill(config.principal);
+            const growth = new Float64Array(paths);   // bootstrap: this year's monthly factor; otherwise the spare normal
+            const sorted = new Float64Array(paths);
+            const uniform = (p, step) => (mix(keys[p] ^ step) + 0.5) / 4294967296;
+            const bootstrap = config.model === 'bootstrap', lognormal = config.model === 'lognormal';
+            const schedule = config.contributions;
+            if (schedule) balance.fill(config.principal + schedule[0]);
+
+            const report = (month) => {
+                sorted.set(balance);
+                sorted.sort();
+                emit({ month: month, p10: percentile(sorted, 0.1), p50: percentile(sorted, 0.5), p90: percentile(sorted, 0.9) });
+            };
+            report(0);
+            for (let m = 0; m < months; m++) {
+                const contribution = schedule ? (schedule[m + 1] || 0) : config.contribution;
+                if (bootstrap) {
+                    if (m % 12 === 0) {
+                        for (let p = 0; p < paths; p++) growth[p] = table[Math.floor(uniform(p, m) * table.length)];
+                    }
+                    for (let p = 0; p < paths; p++) balance[p] = balance[p] * growth[p] + contribution;
+                } else {
+                    // Box-Muller gives two normals per pair of uniforms: the cosine one
+                    // for an even month, the sine one (kept in growth) for the next.
+                    for (let p = 0; p < paths; p++) {
+                        let z;
+                        if (m % 2 === 0) {
+                            const radius = Math.sqrt(-2 * Math.log(uniform(p, m)));
+                            const angle = 2 * Math.PI * uniform(p, m + 1);
+                            z = radius * Math.cos(angle);
+                            growth[p] = radius * Math.sin(angle);
+                        } else {
+                            z = growth[p];
+                        }
+                        const g = lognormal ? Math.exp(drift + shock * z) : 1 + drift + shock * z;
+                        balance[p] = balance[p] * g + contribution;
+                    }
+                }
+                if ((m + 1) % 12 === 0 || m + 1 === months) report(m + 1);
+            }
+        }
+
+        if (typeof window === 'undefined' && typeof self !== 'undefined') {
+            self.onmessage = function(e) {
+                simulate(e.data, band => self.postMessage(band));
+                self.postMessage({ done: true });
+            };
+        }
+        return simulate;
+    }
+
+    const workers = {};
+    let workerUrl = null;
+
+    // Runs a simulation for toolId (cancelling any still running for it),
+    // calling onChunk({ month, p10, p50, p90 }) per year and onDone() at the end.
+    // Without Worker support it runs inline.
+    function monteCarlo(toolId, config, onChunk, onDone) {
+        if (workers[toolId]) workers[toolId].terminate();
+        delete workers[toolId];
+        if (typeof Worker === 'undefined' || !window.URL.createObjectURL) {
+            monteCarloWorker()(config, onChunk);
+            if (onDone) onDone();
+            return;
+        }
+        if (!workerUrl) {
+            workerUrl = window.URL.createObjectURL(new Blob(['(' + monteCarloWorker.toString() + ')()'], { type: 'text/javascript' }));
+        }
+        const worker = new Worker(workerUrl);
+        workers[toolId] = worker;
+        worker.onmessage = function(e) {
+            if (e.data.done) {
+                worker.terminate();
+                delete workers[toolId];
+                if (onDone) onDone();
+            } else {
+                onChunk(e.data);
+            }
+        };
+        worker.postMessage(config);
+    }
+
+    // Shows the result box and records the history entry after a calculation.
+    function finish(toolId, resultText, historySummary) {
+        const resBox = document.getElementById('result_box');
+        if (resultText) {
+            document.getElementById('result_val').innerHTML = resultText;
+            resBox.style.display = 'block';
+        }
+        if (historySummary) addToHistory(toolId, historySummary);
+    }
+
+    // Plotly is pulled in on demand so Hugo's minifier can't strip a static tag.
+    function loadPlotly(toolId, ready) {
+        if (typeof Plotly !== 'undefined') {
+            ready();
+            return;
+        }
+        const status = document.getElementById('loading_status_' + toolId);
+        if (status) status.style.display = 'block';
+
+        const script = document.createElement('script');
+        script.src = "https://cdn.plot.ly/plotly-2.24.1.min.js";
+        script.onload = function() {
+            if (status) status.style.display = 'none';
+            ready();
+        };
+        script.onerror = function() {
+            if (status) status.innerHTML = "Error: Could not load graphing library.";
+        };
+        document.head.appendChild(script);
+    }
+
+    function init(toolId, config) {
+        tools[toolId] = config;
+        window.addEventListener('load', function() { renderHistory(toolId); });
+    }
+
+    window.CalcFoundry = {
+        init, finish, addToHistory, renderHistory, clearHistory, downloadHistory,
+        saveBlob, downloadCSV, virtualTable, stackedChart, monteCarlo, loadPlotly
+    };
+})();
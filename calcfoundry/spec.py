@@ -0,0 +1,150 @@
+import importlib
+import pkgutil
+import sys
+from dataclasses import dataclass
+
+from . import trace
+
+# --- SPEC PACKAGE ---
+# Every calculator lives in tools/gen_*.py and registers itself on import.
+SPEC_PACKAGE = "tools"
+SPEC_PREFIX = "gen_"
+
+
+def slugify(text):
+    """Page slug of a title: letters, digits and spaces kept, lowercased, spaces as dashes."""
+    return "".join(c for c in text if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
+
+
+@dataclass
+class Variants:
+    """
+    A parameter grid of prefilled landing pages generated from one calculator.
+
+    `grid` maps input element ids to the values to try; every combination
+    (in grid order) becomes one page under <output>/<slug>/. `title` and
+    `description` are str.format patterns over those values. `result`, if
+    given, is a module-level function called with the values that returns the
+    result-box HTML baked into the page. Pages are streamed `batch_size` at a
+    time, so a grid of any size builds in constant memory.
+    """
+    grid: dict
+    title: str
+    description: str = ""
+    result: object = None
+    batch_size: int = 500
+
+
+@dataclass
+class CalculatorSpec:
+    """
+    Everything that makes one calculator page unique.
+    The shared page template (calcfoundry.template) supplies the rest:
+    front matter, layout grid, history runtime and the math section.
+
+    Fragments (inputs_html, calculation_js, setup_js, init_js, extra_css,
+    actions_html, output_html) may use the literal token {tool_id}; it is replaced with the
+    page's tool id when the page is rendered.
+    """
+    title: str
+    category: str
+    description: str
+    inputs_html: str
+    calculation_js: str
+    formula_latex: str
+    educational_content: str
+    variable_definitions: str = ""
+
+    # Page furniture
+    layout: str = "form"            # "form" or "graph" (Plotly-backed)
+    button_label: str = "Calculate"
+    actions_html: str = ""          # Replaces the default Calculate button
+    output_html: str = ""           # Extra output below the result box (tables, charts)
+    math_link: str = "How is this calculated?"
+    usage_heading: str = "How to Use This Calculator"
+    math_intro: str = "The tool uses the following mathematical principle:"
+    math_outro: str = ""
+
+    # History panel
+    history_title: str = "History"
+    history_intro: str = ""
+    history_limit: int = 10
+    history_download: bool = True
+    clear_label: str = "Clear"
+    storage_key: str = ""           # Defaults to calcfoundry_history_<tool_id>
+
+    # Extra page code
+    setup_js: str = ""              # Top-level helpers and data tables
+    init_js: str = ""               # Runs once the page (and Plotly) has loaded
+    extra_css: str = ""
+
+    # Programmatic pages
+    result_html: str = ""           # Precomputed result shown before the first Calculate
+    variants: Variants = None     # Parameter grid of prefilled variant pages
+    page_slug: str = ""             # Overrides the slug derived from the title
+
+    @property
+    def slug(self):
+        return self.page_slug or slugify(self.title)
+
+    @property
+    def tool_id(self):
+        return self.slug.replace("-", "_")
+
+
+# --- REGISTRY ---
+# slug -> CalculatorSpec, in registration order.
+REGISTRY = {}
+
+# spec module name -> slugs it registered (used to reload a single module).
+MODULE_SPECS = {}
+
+
+def register(spec):
+    """Adds a spec to the registry (replacing any spec with the same slug) and returns it."""
+    REGISTRY[spec.slug] = spec
+    return spec
+
+
+def _import_spec_module(name):
+    for slug in MODULE_SPECS.pop(name, ()):
+        REGISTRY.pop(slug, None)
+    before = set(REGISTRY)
+    with trace.span("load spec", module=name):
+        if name in sys.modules:
+            module = importlib.reload(sys.modules[name])
+        else:
+            module = importlib.import_module(name)
+    MODULE_SPECS[name] = [slug for slug in REGISTRY if slug not in before]
+    return module
+
+
+def reload_spec_module(name):
+    """Re-imports one spec module (importlib.reload if already loaded) and returns the specs it registered."""
+    _import_spec_module(name)
+    return [REGISTRY[slug] for slug in MODULE_SPECS[name]]
+
+
+def unload_spec_module(name):
+    """Forgets a spec module whose file was deleted, along with its specs."""
+    for slug in MODULE_SPECS.pop(name, ()):
+        REGISTRY.pop(slug, None)
+    sys.modules.pop(name, None)
+
+
+def spec_modules():
+    """Lists the importable spec module names under tools/, sorted by name."""
+    package = importlib.import_module(SPEC_PACKAGE)
+    return sorted(
+        f"{SPEC_PACKAGE}.{info.name}"
+        for info in pkgutil.iter_modules(package.__path__)
+        if info.name.startswith(SPEC_PREFIX)
+    )
+
+
+def load_specs():
+    """Imports every spec module once and returns the registered specs sorted by slug."""
+    for name in spec_modules():
+        if name not in MODULE_SPECS:
+            _import_spec_module(name)
+    return [REGISTRY[slug] for slug in sorted(REGISTRY)]
@@ -0,0 +1,280 @@
+"""
+The shared CalcFoundry page template.
+
+The page is assembled from partials (front matter, calculator grid, page
+script, styles and the math section). Partials are plain str.format strings,
+so literal JS/CSS braces are doubled exactly like the old f-string templates.
+
+Partials are compiled once into render plans: tuples that alternate literal
+chunks and slot names. Rendering fills the slots and does a single
+''.join. Plans are cached on disk (marshal, keyed by TEMPLATE_VERSION) next to
+the module's bytecode, so a cold build skips compilation too.
+
+The history panel, result box, Plotly loader and base styles live once in the
+shared runtime bundle (see calcfoundry.assets); each page only calls
+CalcFoundry.init() with its own tool id and settings.
+"""
+
+import glob
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import string
+import sys
+
+from . import assets
+
+# --- PARTIALS ---
+
+FRONT_MATTER = """---
+title: "{title}"
+date: {date}
+categories: ["{category}"]
+summary: "{description}"
+math: true
+disableSpecial1stPost: true
+---
+
+{description}
+
+"""
+
+GRID = """{{{{< calculator >}}}}
+
+<link rel="stylesheet" href="/{core_css}">
+<div class="calc-grid calc-{layout}">
+  <div class="calc-main">
+    {main_header}
+    {inputs_html}
+    {actions_html}
+    {main_output}
+    <div id="result_box" class="result-box" style="display:{result_display};">
+        <span id="result_val">{result_html}</span>
+    </div>
+    {output_html}
+
+    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
+        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
+            {math_link}
+        </a>
+    </div>
+  </div>
+
+  <div class="calc-history">
+    <h4>{history_title}</h4>
+    {history_intro}
+    <ul id="history_list_{tool_id}"></ul>
+
+    <div style="display:flex; gap:10px; margin-top:10px;">
+        {history_buttons}
+    </div>
+  </div>
+</div>
+"""
+
+DEFAULT_ACTIONS = """<button onclick="calculate_{tool_id}()">{button_label}</button>"""
+
+SAVE_BUTTON = """<button onclick="CalcFoundry.downloadHistory('{tool_id}')" class="btn-small" style="flex:1;">Save</button>
+        """
+
+CLEAR_BUTTON = """<button onclick="CalcFoundry.clearHistory('{tool_id}')" class="btn-small" style="flex:1;">{clear_label}</button>"""
+
+GRAPH_HEADER = """<div id="loading_status_{tool_id}" style="display:none; color: #888; font-size: 0.8em; margin-bottom: 5px;">Loading Graph Engine...</div>
+"""
+
+GRAPH_OUTPUT = """<div id="graph_{tool_id}" class="graph-box"></div>
+"""
+
+PAGE_RUNTIME = """
+<script src="/{core_js}"></script>
+<script>
+    CalcFoundry.init("{tool_id}", {config});
+{setup_js}{init_js}
+    function calculate_{tool_id}() {{
+        {calculation_js}
+
+        CalcFoundry.finish("{tool_id}", resultText, historySummary);
+    }}
+</script>
+"""
+
+INIT_RUNTIME = """
+    window.addEventListener('load', function() {{
+        {init_js}
+    }});
+"""
+
+STYLES = """
+<style>{extra_css}</style>
+"""
+
+CLOSE = """
+{{{{< /calculator >}}}}
+"""
+
+MATH_SECTION = """
+## {usage_heading}
+{educational_content}
+
+## The Math Behind It
+{math_intro}
+
+$$
+{formula_latex}
+$$
+{math_outro}{variables}"""
+
+VARIABLES = """
+**Where:**
+
+{variable_definitions}
+"""
+
+# The shared runtime (calcfoundry/runtime/core.js and core.css), linked by fingerprinted name.
+CORE_ASSETS = assets.core_assets()
+
+# Any edit to this module (partials or render logic) or to the runtime bundle
+# invalidates every page in the build manifest.
+with open(__file__, "rb") as _source:
+    _version = hashlib.sha256(_source.read())
+for _name, _ in CORE_ASSETS.values():
+    _version.update(_name.encode("utf-8"))
+TEMPLATE_VERSION = _version.hexdigest()[:16]
+
+
+# --- RENDER PLANS ---
+
+PARTIALS = {
+    "page": FRONT_MATTER + GRID + PAGE_RUNTIME + "{styles}" + CLOSE + MATH_SECTION,
+    "default_actions": DEFAULT_ACTIONS,
+    "save_button": SAVE_BUTTON,
+    "clear_button": CLEAR_BUTTON,
+    "graph_header": GRAPH_HEADER,
+    "graph_output": GRAPH_OUTPUT,
+    "init_runtime": INIT_RUNTIME,
+    "styles": STYLES,
+    "variables": VARIABLES,
+}
+
+# Lives with the module's bytecode (honouring sys.pycache_prefix); one file per template version.
+PLAN_CACHE = os.path.join(os.path.dirname(importlib.util.cache_from_source(__file__)), "template-plans.{version}.marshal")
+
+
+def compile_plan(partial):
+    """Compiles a str.format partial into (literal, slot, literal, ..., literal)."""
+    plan = []
+    for literal, field, spec, conversion in string.Formatter().parse(partial):
+        if plan and len(plan) % 2:
+            plan[-1] += literal          # consecutive literals (from doubled braces) merge
+        else:
+            plan.append(literal)
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            raise ValueError(f"Template slot {{{field}}} must be a plain name")
+        plan.append(field)
+    if len(plan) % 2 == 0:
+        plan.append("")
+    return tuple(plan)
+
+
+def _load_plans():
+    path = PLAN_CACHE.format(version=TEMPLATE_VERSION)
+    try:
+        with open(path, "rb") as f:
+            plans = marshal.load(f)
+        if isinstance(plans, dict) and plans.keys() == PARTIALS.keys():
+            return plans
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    plans = {name: compile_plan(partial) for name, partial in PARTIALS.items()}
+    if not sys.dont_write_bytecode:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            for stale in glob.glob(PLAN_CACHE.format(version="*")):
+                os.remove(stale)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                marshal.dump(plans, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return plans
+
+
+PLANS = _load_plans()
+
+
+def fill(plan, values):
+    """Renders a plan: every odd chunk is a slot name looked up in `values`."""
+    chunks = list(plan)
+    chunks[1::2] = [values[name] for name in plan[1::2]]
+    return "".join(chunks)
+
+
+def _with_tool_id(fragment, tool_id):
+    return fragment.replace("{tool_id}", tool_id)
+
+
+def render_page(spec, date):
+    """Renders the full Markdown page for a spec. `date` is the front-matter date string."""
+    tool_id = spec.tool_id
+    graph = spec.layout == "graph"
+    ids = {"tool_id": tool_id}
+
+    actions_html = spec.actions_html or fill(PLANS["default_actions"], {"tool_id": tool_id, "button_label": spec.button_label})
+    history_buttons = fill(PLANS["clear_button"], {"tool_id": tool_id, "clear_label": spec.clear_label})
+    if spec.history_download:
+        history_buttons = fill(PLANS["save_button"], ids) + history_buttons
+
+    config = {
+        "storageKey": _with_tool_id(spec.storage_key or "calcfoundry_history_{tool_id}", tool_id),
+        "limit": spec.history_limit,
+        "title": spec.title,
+        "downloadName": spec.title.replace(" ", "_"),
+    }
+
+    init_js = _with_tool_id(spec.init_js, tool_id).strip()
+    if graph:
+        init_js = f"CalcFoundry.loadPlotly(\"{tool_id}\", function() {{\n            {init_js}\n        }});"
+    extra_css = _with_tool_id(spec.extra_css, tool_id)
+
+    return fill(PLANS["page"], {
+        # Front matter
+        "title": spec.title,
+        "date": date,
+        "category": spec.category,
+        "description": spec.description,
+        # Calculator grid
+        "tool_id": tool_id,
+        "core_css": CORE_ASSETS["css"][0],
+        "layout": spec.layout,
+        "main_header": fill(PLANS["graph_header"], ids) if graph else "",
+        "inputs_html": _with_tool_id(spec.inputs_html, tool_id),
+        "actions_html": _with_tool_id(actions_html, tool_id),
+        "main_output": fill(PLANS["graph_output"], ids) if graph else "",
+        "math_link": spec.math_link,
+        "history_title": spec.history_title,
+        "history_intro": _with_tool_id(spec.history_intro, tool_id),
+        "history_buttons": history_buttons,
+        "result_display": "block" if spec.result_html else "none",
+        "result_html": spec.result_html,
+        "output_html": _with_tool_id(spec.output_html, tool_id),
+        # Page script and styles
+        "core_js": CORE_ASSETS["js"][0],
+        "config": json.dumps(config, ensure_ascii=False),
+        "setup_js": _with_tool_id(spec.setup_js, tool_id),
+        "init_js": fill(PLANS["init_runtime"], {"init_js": init_js}) if init_js else "",
+        "calculation_js": _with_tool_id(spec.calculation_js, tool_id),
+        "styles": fill(PLANS["styles"], {"extra_css": extra_css}) if extra_css.strip() else "",
+        # Math section
+        "usage_heading": spec.usage_heading,
+        "educational_content": spec.educational_content,
+        "math_intro": spec.math_intro,
+        "formula_latex": spec.formula_latex,
+        "math_outro": spec.math_outro,
+        "variables": fill(PLANS["variables"], {"variable_definitions": spec.variable_definitions}) if spec.variable_definitions else "",
+    })
@@ -0,0 +1,88 @@
+"""
+Build tracing in Chrome trace-event format: `python -m calcfoundry build --trace out.json`.
+
+Spans are recorded as complete ("X") events with wall-clock microsecond
+timestamps, so events from pool workers line up with the build process.
+Open the file in Perfetto (ui.perfetto.dev) or chrome://tracing. Tracing is
+off unless enable() is called; span() is then a no-op.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_events = None
+
+
+def enable():
+    global _events
+    _events = []
+
+
+def enabled():
+    return _events is not None
+
+
+def _now():
+    return time.time_ns() / 1000
+
+
+@contextmanager
+def span(name, cat="build", **args):
+    """Records the enclosed block as one span (no-op while tracing is off)."""
+    if _events is None:
+        yield
+        return
+    start = _now()
+    try:
+        yield
+    finally:
+        _events.append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start,
+            "dur": _now() - start,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": args,
+        })
+
+
+@contextmanager
+def capture():
+    """
+    Collects the spans of the enclosed block into a fresh list (yielded),
+    so a pool worker can ship its spans back with its result.
+    """
+    global _events
+    outer, _events = _events, []
+    try:
+        yield _events
+    finally:
+        _events = outer
+
+
+def extend(events):
+    if _events is not None and events:
+        _events.extend(events)
+
+
+def save(path):
+    """Writes the recorded spans, plus process names for the build and each worker."""
+    main = os.getpid()
+    pids = sorted({event["pid"] for event in _events} | {main})
+    names = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "calcfoundry build" if pid == main else f"worker {pid}"},
+        }
+        for pid in pids
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": names + _events, "displayTimeUnit": "ms"}, f)
+    return len(_events)
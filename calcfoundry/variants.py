@@ -0,0 +1,114 @@
+"""
+Variant pages: one calculator expanded over a parameter grid.
+
+`iter_variants(spec)` is a generator. It walks the grid lazily and yields one
+derived CalculatorSpec per combination, with the inputs prefilled and the
+precomputed result (if the grid has a `result` function) baked in. Only the
+slugs seen so far are kept (to catch two combinations landing on the same
+page); the pages themselves are consumed by the build in batches.
+"""
+
+import dataclasses
+import html
+import itertools
+import re
+from functools import lru_cache
+
+from .spec import slugify
+
+# Manifest key suffix for a spec's whole variant family.
+FAMILY_SUFFIX = "/*"
+
+_DECIMAL_POINT = re.compile(r"(?<=\d)\.(?=\d)")
+
+
+def family_key(spec):
+    return spec.slug + FAMILY_SUFFIX
+
+
+def orphaned_families(specs, manifest, complete):
+    """
+    Manifest keys of variant families no spec generates any more: those of
+    the given specs that dropped their grid and, when `specs` is every spec
+    (complete), those whose spec is gone or was renamed.
+    """
+    current = {family_key(spec) for spec in specs if spec.variants}
+    listed = {family_key(spec) for spec in specs}
+    return sorted(
+        key for key in manifest
+        if key.endswith(FAMILY_SUFFIX) and key not in current and (complete or key in listed)
+    )
+
+
+def family_slug(key):
+    return key[:-len(FAMILY_SUFFIX)]
+
+
+def variant_count(spec):
+    count = 1
+    for values in spec.variants.grid.values():
+        count *= len(values)
+    return count
+
+
+@lru_cache(maxsize=None)
+def _element_pattern(element_id):
+    return re.compile(r'<(input|select)\b[^>]*\bid="%s"[^>]*>' % re.escape(element_id))
+
+
+def prefill_inputs(inputs_html, values):
+    """Sets value="..." on each <input> (or marks the matching <option> of each <select>) by element id."""
+    for element_id, value in values.items():
+        match = _element_pattern(element_id).search(inputs_html)
+        if not match:
+            raise ValueError(f"Variant grid input {element_id!r} has no <input> or <select> with that id")
+        value = html.escape(str(value))
+
+        if match.group(1) == "input":
+            tag = re.sub(r'\s+value="[^"]*"', "", match.group(0))
+            tag = tag[:-1].rstrip().rstrip("/").rstrip() + f' value="{value}">'
+            inputs_html = inputs_html[:match.start()] + tag + inputs_html[match.end():]
+        else:
+            end = inputs_html.index("</select>", match.end())
+            options = re.sub(r"\s+selected\b", "", inputs_html[match.end():end])
+            options, found = re.subn(r'(<option value="%s")' % re.escape(value), r"\1 selected", options, count=1)
+            if not found:
+                raise ValueError(f"Variant grid value {value!r} is not an option of <select id={element_id!r}>")
+            inputs_html = inputs_html[:match.end()] + options + inputs_html[end:]
+    return inputs_html
+
+
+def variant_slug(title):
+    """Slug of a variant title; decimal points become dashes so 5.5% and 55% stay apart."""
+    return slugify(_DECIMAL_POINT.sub(" ", title))
+
+
+def iter_variants(spec):
+    """
+    Yields one prefilled CalculatorSpec per grid combination, in grid order.
+    Raises ValueError if two combinations would share a slug (and so overwrite
+    each other's page).
+    """
+    variants = spec.variants
+    ids = list(variants.grid)
+    # Every variant shares the parent calculator's history.
+    storage_key = (spec.storage_key or "calcfoundry_history_{tool_id}").replace("{tool_id}", spec.tool_id)
+    seen = {}
+
+    for combination in itertools.product(*variants.grid.values()):
+        values = dict(zip(ids, combination))
+        title = variants.title.format(**values)
+        slug = variant_slug(title)
+        if slug in seen:
+            raise ValueError(f"Variants {seen[slug]} and {values} of {spec.slug!r} both have the slug {slug!r}")
+        seen[slug] = values
+        yield dataclasses.replace(
+            spec,
+            title=title,
+            page_slug=slug,
+            description=variants.description.format(**values) if variants.description else spec.description,
+            inputs_html=prefill_inputs(spec.inputs_html, values),
+            result_html=variants.result(values) if variants.result else "",
+            storage_key=storage_key,
+            variants=None,
+        )
@@ -0,0 +1,183 @@
+"""
+Resident watch mode: `python -m calcfoundry build --watch`.
+
+Polls tools/gen_*.py, the shared template and the runtime bundle sources,
+and the shared fragment modules the specs import (calcfoundry/cashflows.py,
+returns.py, cpi.py, ...) along with any DATA_FILES those list. A changed spec
+module is re-imported on its own with importlib.reload and only its pages
+are rebuilt. A changed fragment is reloaded first, then every spec module
+that imports it. A changed template or runtime file reloads
+calcfoundry.template (re-fingerprinting the bundle) and rebuilds everything.
+Imports stay warm between edits, so a rebuild costs milliseconds.
+"""
+
+import ast
+import importlib
+import importlib.util
+import os
+import sys
+import time
+import traceback
+from functools import lru_cache
+from time import perf_counter
+
+from . import assets
+from . import spec as spec_registry
+from . import template
+from .build import STATIC_DIR, build
+
+TEMPLATE_MODULE = template.__name__
+PACKAGE = __package__
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _is_spec_module(name):
+    return name.startswith(spec_registry.SPEC_PACKAGE + ".")
+
+
+@lru_cache(maxsize=None)
+def _fragment_imports(path, stamp):
+    """The calcfoundry/<name>.py modules a spec module imports, read from its source (cached per stamp)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError):
+        return frozenset()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            if node.module == PACKAGE:
+                names.update(f"{PACKAGE}.{alias.name}" for alias in node.names)
+            else:
+                names.add(node.module)
+        elif isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+    return frozenset(
+        name for name in names
+        if name.count(".") == 1 and name.startswith(PACKAGE + ".")
+        and os.path.exists(os.path.join(PACKAGE_DIR, name.partition(".")[2] + ".py"))
+    )
+
+
+def _spec_files():
+    """Maps every spec module file to its module name."""
+    package = importlib.import_module(spec_registry.SPEC_PACKAGE)
+    files = {}
+    for directory in package.__path__:
+        for name in os.listdir(directory):
+            if name.startswith(spec_registry.SPEC_PREFIX) and name.endswith(".py"):
+                files[os.path.join(directory, name)] = f"{spec_registry.SPEC_PACKAGE}.{name[:-3]}"
+    return files
+
+
+def _imports_of(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return frozenset()
+    return _fragment_imports(path, (stat.st_mtime_ns, stat.st_size))
+
+
+def _watched_files():
+    """Maps every watched file path to the module it belongs to."""
+    files = {template.__file__: TEMPLATE_MODULE}
+    for ext in assets.BUNDLE_EXTENSIONS:
+        files[assets.runtime_path(ext)] = TEMPLATE_MODULE
+    specs = _spec_files()
+    files.update(specs)
+    for name in sorted(set().union(*map(_imports_of, specs))):
+        files[os.path.join(PACKAGE_DIR, name.partition(".")[2] + ".py")] = name
+        module = sys.modules.get(name)
+        for path in getattr(module, "DATA_FILES", ()):
+            files[path] = name
+    return files
+
+
+def _dependents(fragments):
+    """Spec modules that import any of the given fragment modules."""
+    return {name for path, name in _spec_files().items() if _imports_of(path) & fragments}
+
+
+def _snapshot(files):
+    stamps = {}
+    for path in files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def _drop_bytecode(path):
+    # A same-second, same-size edit would otherwise be served from a stale .pyc.
+    try:
+        os.remove(importlib.util.cache_from_source(path))
+    except OSError:
+        pass
+
+
+def _rebuild(changed, removed, output_dir, static_dir, minify):
+    """Reloads what changed and rebuilds only the affected pages. Returns the built results."""
+    importlib.invalidate_caches()
+    for path, name in removed.items():
+        spec_registry.unload_spec_module(name)
+        print(f"🗑️  Removed spec module {name} (its pages are left in place)")
+
+    # Fragments first, so the specs re-imported below pick up the new code and data.
+    fragments = {name for name in changed.values() if name != TEMPLATE_MODULE and not _is_spec_module(name)}
+    for name in sorted(fragments):
+        module = sys.modules.get(name)
+        if module is not None:
+            _drop_bytecode(module.__file__)
+            importlib.reload(module)
+
+    modules = {name for name in changed.values() if _is_spec_module(name)} | _dependents(fragments)
+    for path, name in changed.items():
+        if _is_spec_module(name):
+            _drop_bytecode(path)
+    specs = []
+    for name in sorted(modules - set(removed.values())):
+        specs.extend(spec_registry.reload_spec_module(name))
+
+    if TEMPLATE_MODULE in changed.values():
+        _drop_bytecode(template.__file__)
+        importlib.reload(template)
+        specs = spec_registry.load_specs()
+
+    built, _ = build(specs, output_dir, static_dir=static_dir, minify=minify)
+    return built
+
+
+def watch(output_dir, interval=0.05, static_dir=STATIC_DIR, minify=True):
+    """Builds once, then rebuilds changed specs until interrupted."""
+    sys.dont_write_bytecode = True
+    build(spec_registry.load_specs(), output_dir, static_dir=static_dir, minify=minify, complete=True)
+
+    watched = _watched_files()
+    stamps = _snapshot(watched)
+    print(f"👀 Watching {len(watched)} files (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(interval)
+            files = _watched_files()
+            current = _snapshot(files)
+            if current == stamps:
+                continue
+
+            changed = {path: files[path] for path, stamp in current.items() if stamps.get(path) != stamp}
+            removed = {path: name for path, name in watched.items() if path not in current and _is_spec_module(name)}
+            stamps, watched = current, files
+
+            start = perf_counter()
+            try:
+                built = _rebuild(changed, removed, output_dir, static_dir, minify)
+            except Exception:
+                traceback.print_exc()
+                print("❌ Rebuild failed; waiting for the next change")
+                continue
+            elapsed = (perf_counter() - start) * 1000
+            print(f"♻️  Rebuilt {len(built)} page(s) in {elapsed:.1f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
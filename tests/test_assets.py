@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from calcfoundry import assets, template
+from calcfoundry.build import render_bytes
+from calcfoundry.spec import load_specs
+
+
+@pytest.fixture
+def runtime(tmp_path, monkeypatch):
+    """A copy of the runtime sources that the test can edit."""
+    runtime_dir = tmp_path / "runtime"
+    runtime_dir.mkdir()
+    for ext in assets.BUNDLE_EXTENSIONS:
+        with open(assets.runtime_path(ext), encoding="utf-8") as f:
+            (runtime_dir / f"core.{ext}").write_text(f.read(), encoding="utf-8")
+    monkeypatch.setattr(assets, "RUNTIME_DIR", str(runtime_dir))
+    return runtime_dir
+
+
+def test_names_are_content_fingerprints(runtime):
+    bundle = assets.core_assets()
+    js_name, js = bundle["js"]
+    assert js_name.startswith("calcfoundry-core.") and js_name.endswith(".js")
+    assert bundle == assets.core_assets()
+    assert len(js) < os.path.getsize(runtime / "core.js")    # minified
+
+
+def test_changed_runtime_is_renamed_and_the_old_file_removed(runtime, tmp_path):
+    static = str(tmp_path / "static")
+    old = assets.core_assets()
+    assert len(assets.emit_core_assets(static, old)) == 2
+    assert assets.emit_core_assets(static, old) == []
+
+    with open(runtime / "core.js", "a", encoding="utf-8") as f:
+        f.write("\nwindow.calcfoundryExtra = 1;\n")
+    new = assets.core_assets()
+    assert new["js"][0] != old["js"][0] and new["css"] == old["css"]
+
+    written = assets.emit_core_assets(static, new)
+    assert written == [os.path.join(static, new["js"][0])]
+    assert sorted(os.listdir(static)) == sorted(name for name, _ in new.values())
+    with open(written[0], "rb") as f:
+        assert f.read() == new["js"][1]
+
+
+def test_unrelated_static_files_are_kept(runtime, tmp_path):
+    static = tmp_path / "static"
+    static.mkdir()
+    (static / "favicon.ico").write_bytes(b"icon")
+    (static / "calcfoundry-core.000000000000.js").write_text("stale")
+    assets.emit_core_assets(str(static))
+    assert "favicon.ico" in os.listdir(static)
+    assert "calcfoundry-core.000000000000.js" not in os.listdir(static)
+
+
+def test_pages_link_the_fingerprinted_bundle():
+    page = render_bytes(load_specs()[0], "2026-01-01")[0].decode("utf-8")
+    assert f'<script src="/{template.CORE_ASSETS["js"][0]}"></script>' in page
+    assert f'href="/{template.CORE_ASSETS["css"][0]}"' in page
@@ -0,0 +1,96 @@
+import csv
+
+import pytest
+
+from calcfoundry.build import main
+from calcfoundry.engines import inflation
+
+
+def _run(tmp_path, command, text):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text(text)
+    main([command, "--in", str(src), "--out", str(dst), "--chunk-size", "2"])
+    with open(dst, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_mortgage_batch(tmp_path):
+    rows = _run(tmp_path, "mortgage", "\n".join([
+        "id,loan_amount,interest_rate,loan_term,payment_freq,extra_payment",
+        "a,300000,6,30,,200",
+        "b,300000,6,30,abc,",
+        "c,300000,6,30,12,-5000",
+        "d,100000,0,10,12,0",
+        "e,x,6,30,12,0",
+        "f,inf,6,30,12,0",
+        "g,300000,nan,30,12,0",
+        "h,300000,6,30,13,0",
+        "i,300000,6,30,26,0",
+    ]) + "\n")
+    assert [r["id"] for r in rows] == ["a", "b", "c", "d", "e", "f", "g", "h", "i"]
+    a = rows[0]
+    assert a["payment_freq"] == ""
+    assert a["payment"] == "1798.65" and a["periods"] == "360"
+    assert a["periods_with_extra"] == "279" and a["interest_saved"] == "91173.43"
+    assert rows[3]["payment"] == "833.33" and rows[3]["total_interest"] == "0.00"
+    assert rows[8]["periods"] == "780"
+    for row in rows[1:3] + rows[4:8]:
+        assert row["payment"] == "" and row["interest_saved"] == ""
+
+
+@pytest.mark.parametrize("size", ["0", "-5", "ten"])
+def test_chunk_size_must_be_positive(tmp_path, size, capsys):
+    src = tmp_path / "in.csv"
+    src.write_text("principal,rate,term\n300000,6,30\n")
+    with pytest.raises(SystemExit):
+        main(["mortgage", "--in", str(src), "--out", str(tmp_path / "out.csv"), "--chunk-size", size])
+    assert "--chunk-size" in capsys.readouterr().err
+
+
+def test_mortgage_batch_aliases(tmp_path):
+    rows = _run(tmp_path, "mortgage", "principal,rate,term\n300000,6,30\n")
+    assert rows[0]["payment"] == "1798.65"
+
+
+def test_mortgage_batch_missing_column(tmp_path):
+    with pytest.raises(SystemExit, match="interest_rate"):
+        _run(tmp_path, "mortgage", "loan_amount,loan_term\n300000,30\n")
+
+
+def test_inflation_batch(tmp_path):
+    rows = _run(tmp_path, "inflation", "\n".join([
+        "id,start_amount,start_year,end_year",
+        "a,1000,1970,2024",
+        "b,500,1990,",
+        "c,500,1990,0",
+        "d,500,1990,abc",
+        "e,500,1900,2000",
+        "f,500,2000,1990",
+    ]) + "\n")
+    a, b = rows[0], rows[1]
+    expected = inflation.adjust(1000, 1970, 2024, inflation.page_tables())
+    assert a["official_value"] == "%.2f" % expected.official
+    assert a["official_rate"] == "%.4f" % expected.official_rate
+    assert float(a["shadow_value"]) > float(a["official_value"])
+    assert b["official_value"] != ""
+    for row in rows[2:]:
+        assert row["official_value"] == "" and row["shadow_rate"] == ""
+
+
+def test_inflation_batch_blank_end_year_is_latest(tmp_path):
+    rows = _run(tmp_path, "inflation", "amount,from_year,to_year\n500,1990,\n")
+    t = inflation.page_tables()
+    latest = inflation.adjust(500, 1990, t.first_year + len(t.official) - 1, t)
+    assert float(rows[0]["official_value"]) == pytest.approx(float(latest.official), abs=0.005)
+
+
+@pytest.mark.parametrize("end_year", ["nan", " NaN ", "inf", "-inf"])
+def test_inflation_batch_non_finite_end_year_is_invalid(tmp_path, end_year):
+    rows = _run(tmp_path, "inflation", f"amount,from_year,to_year\n500,1990,{end_year}\n500,1990, \n")
+    assert rows[0]["official_value"] == "" and rows[0]["shadow_rate"] == ""
+    assert rows[1]["official_value"] != ""
+
+
+def test_inflation_batch_has_no_year_alias(tmp_path):
+    with pytest.raises(SystemExit, match="start_year"):
+        _run(tmp_path, "inflation", "amount,year,to_year\n1,1970,2000\n")
@@ -0,0 +1,26 @@
+import os
+
+from calcfoundry import build
+from calcfoundry.spec import load_specs
+
+
+def _tree(root):
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+
+def test_parallel_build_matches_serial(tmp_path):
+    specs = load_specs()
+    for jobs in (1, 2):
+        build(specs, output_dir=str(tmp_path / f"j{jobs}" / "posts"), jobs=jobs,
+              static_dir=str(tmp_path / f"j{jobs}" / "static"))
+    serial, parallel = _tree(tmp_path / "j1"), _tree(tmp_path / "j2")
+    assert any(os.sep in name[len("posts/"):] for name in serial)    # variant pages too
+    assert sorted(parallel) == sorted(serial)
+    for name, data in serial.items():
+        assert parallel[name] == data, name
@@ -0,0 +1,71 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from calcfoundry.spec import load_specs
+
+# flowValue_{tool_id} (calcfoundry/cashflows.py) and the retirement page's
+# realBalance_{tool_id}, run in node from the retirement page's setup script.
+
+NODE_HARNESS = """
+const vm = require('vm');
+vm.runInThisContext(require('fs').readFileSync(0, 'utf8'));
+const functions = { flowValue: flowValue_t, realBalance: realBalance_t };
+const out = JSON.parse(process.argv[1]).map(([name, ...args]) => functions[name](...args));
+process.stdout.write(JSON.stringify(out));
+"""
+
+requires_node = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+
+def _flows(escalation=0, holidays=(), lumps=()):
+    return dict(escalation=escalation, holidays=[list(h) for h in holidays],
+                lumps=[dict(month=m, amount=a) for m, a in lumps], active=True)
+
+
+def _run(*calls):
+    (spec,) = [s for s in load_specs() if s.slug == "retirement-planning-calculator"]
+    run = subprocess.run(["node", "-e", NODE_HARNESS, json.dumps(calls)], input=spec.setup_js.replace("{tool_id}", "t"),
+                         capture_output=True, text=True, check=True)
+    return json.loads(run.stdout)
+
+
+def _closed_form(P, PMT, rate, months):
+    i = rate / 1200
+    g = (1 + i) ** months
+    return P * g + PMT * ((g - 1) / i if i else months)
+
+
+@requires_node
+@pytest.mark.parametrize("P, PMT, rate, months", [
+    (1000, 100, 5, 30), (1000, 100, 5, 30.4), (1000, 100, 0, 30.4), (0, 250, 7, 12.75), (5000, 0, 6, 7.5),
+])
+def test_flat_schedule_matches_the_closed_form(P, PMT, rate, months):
+    (value,) = _run(["flowValue", P, PMT, rate, months, _flows()])
+    assert value["balance"] == pytest.approx(_closed_form(P, PMT, rate, months), rel=1e-12)
+    assert value["contributed"] == pytest.approx(P + PMT * months)
+    assert value["negativeAt"] == -1
+
+
+@requires_node
+def test_partial_period_follows_the_schedule():
+    holiday, escalated = _run(
+        ["flowValue", 0, 100, 0, 30.5, _flows(holidays=[(31, 36)])],
+        ["flowValue", 0, 100, 0, 24.5, _flows(escalation=0.1)],
+    )
+    assert holiday["contributed"] == pytest.approx(3000)                  # month 31 is a holiday
+    assert escalated["contributed"] == pytest.approx(1200 + 1320 + 0.5 * 121)   # month 25 is in year 3
+
+
+@requires_node
+def test_real_balance_deflates_lumps_by_cumulative_inflation():
+    j = (1.07 / 1.03 - 1) / 12
+    at_start, principal, later = _run(
+        ["realBalance", 0, 100, 7, 3, 120, _flows(lumps=[(0, 1000)])],
+        ["realBalance", 1000, 100, 7, 3, 120, _flows()],
+        ["realBalance", 0, 0, 7, 3, 120, _flows(lumps=[(60, 10000)])],
+    )
+    assert at_start == pytest.approx(principal, rel=1e-12)
+    assert later == pytest.approx(10000 / 1.03 ** 5 * (1 + j) ** 60, rel=1e-12)
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from calcfoundry import cpi
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "data", "cpi_u_monthly.csv")
+
+
+@pytest.fixture
+def monthly():
+    return cpi.load_monthly(FIXTURE)
+
+
+def test_load_monthly(monthly):
+    assert (monthly.year, monthly.month, len(monthly.values)) == (2019, 10, 30)
+    assert monthly.offset(2022, 3) == len(monthly.values) - 1
+
+
+def test_annual_averages_match_anchors(monthly):
+    averages = monthly.annual_averages()
+    # Only the calendar years the fixture fully covers.
+    assert sorted(averages) == [2020, 2021]
+    for year, average in averages.items():
+        assert average == pytest.approx(cpi.CPI_ANCHORS[year], abs=0.1)
+
+
+def test_official_table_uses_monthly_averages(monthly):
+    first = min(cpi.CPI_ANCHORS)
+    anchors = cpi.official_cpi_table()
+    table = cpi.official_cpi_table(monthly)
+    assert len(table) == len(anchors)
+    assert table[2020 - first] == pytest.approx(sum(monthly.values[3:15]) / 12)
+    assert table[2021 - first] == pytest.approx(cpi.CPI_ANCHORS[2021], abs=0.1)
+    assert table[2019 - first] == anchors[2019 - first]
+    assert table[2024 - first] == anchors[2024 - first]
+
+
+def test_missing_file_is_none(tmp_path):
+    assert cpi.load_monthly(str(tmp_path / "absent.csv")) is None
+
+
+def test_shipped_series():
+    monthly = cpi.load_monthly()
+    assert (monthly.year, monthly.month) == (1913, 1)
+    averages = monthly.annual_averages()
+    # BLS annual averages.
+    assert averages[1913] == pytest.approx(9.883, abs=1e-3)
+    assert averages[2020] == pytest.approx(258.811, abs=1e-3)
+    assert averages[2024] == pytest.approx(313.689, abs=1e-3)
+    # October 2025 was never published and is interpolated.
+    assert monthly.values[monthly.offset(2025, 10)] == pytest.approx((324.800 + 324.122) / 2)
+
+
+@pytest.mark.parametrize("marker", ["", "."])
+def test_missing_months_are_interpolated(tmp_path, marker):
+    rows = [f"2020-{m:02d}-01,{100 + m}" for m in range(1, 13)]
+    rows[4], rows[5] = f"2020-05-01,{marker}", f"2020-06-01,{marker}"
+    path = tmp_path / "cpi.csv"
+    path.write_text("\n".join(["observation_date,CPIAUCNSA"] + rows) + "\n")
+    monthly = cpi.load_monthly(str(path))
+    assert monthly.values == pytest.approx([100.0 + m for m in range(1, 13)])
+
+
+@pytest.mark.parametrize("rows, message", [
+    (["2020-01-01,"] + [f"2020-{m:02d}-01,1" for m in range(2, 13)], "first month needs a value"),
+    ([f"2020-{m:02d}-01,1" for m in range(1, 12)] + ["2020-12-01,."], "last month needs a value"),
+    (["2020-01-01,257.971", "2020-03-01,258.115"], "expected 2020-02 next"),
+    (["2020-01-01,257.971", "2020-01-01,257.971"], "expected 2020-02 next"),
+    (["2020-13-01,257.971"], "out of range"),
+    (["2020-01-01,abc"], "not a number"),
+    (["2020-01-01,-1"], "must be positive"),
+    (["01/2020,257.971"], "expected 'YYYY-MM-DD,value'"),
+    (["2020-01-01,257.971"], "at least a year"),
+])
+def test_load_monthly_rejects(tmp_path, rows, message):
+    path = tmp_path / "cpi.csv"
+    path.write_text("\n".join(["observation_date,CPIAUCNSA"] + rows) + "\n")
+    with pytest.raises(ValueError, match=message):
+        cpi.load_monthly(str(path))
+
+
+def test_errors_name_the_line(tmp_path):
+    path = tmp_path / "cpi.csv"
+    path.write_text("observation_date,CPIAUCNSA\n2020-01-01,257.971\n2020-02-01,x\n")
+    with pytest.raises(ValueError, match=r"cpi\.csv:3:"):
+        cpi.load_monthly(str(path))
+
+
+def test_inflation_engine_uses_monthly_tables(monthly):
+    np = pytest.importorskip("numpy")
+    from calcfoundry.engines import inflation
+
+    t = inflation.tables(monthly)
+    a = inflation.adjust(100, 2020, 2021, t)
+    assert a.official == pytest.approx(100 * monthly.annual_averages()[2021] / monthly.annual_averages()[2020])
+    assert np.isfinite(a.shadow_rate)
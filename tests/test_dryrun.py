@@ -0,0 +1,82 @@
+import dataclasses
+import os
+
+import pytest
+
+from calcfoundry import CalculatorSpec, build
+from calcfoundry.dryrun import byte_changes, diff_page, dry_run, format_dry_run, inline_sizes
+
+OLD = b"---\ntitle: x\n---\n<style>.a{color:red}</style>\n<script>let a=1;</script>\n"
+
+
+@pytest.mark.parametrize("new, expected", [
+    (OLD, (0, 0)),
+    (OLD + b"<p>more</p>\n", (12, 0)),                                    # appended line
+    (OLD.replace(b"title: x\n", b""), (0, 9)),                           # deleted line
+    (OLD.replace(b"let a=1;", b"let a=12;"), (1, 0)),                    # one byte inside a line
+    (OLD.replace(b"color:red", b"color:blue"), (3, 2)),                  # "blue" for "red" shares the "e"
+])
+def test_byte_changes(new, expected):
+    assert byte_changes(OLD, new) == expected
+
+
+def test_byte_changes_net_is_the_size_change():
+    new = OLD.replace(b"title: x", b"title: y\ndraft: true").replace(b"let a=1;", b"")
+    added, removed = byte_changes(OLD, new)
+    assert added - removed == len(new) - len(OLD)
+
+
+def test_inline_sizes():
+    assert inline_sizes(OLD) == (len(b"let a=1;"), len(b".a{color:red}"))
+
+
+def test_diff_page(tmp_path):
+    path = tmp_path / "page.md"
+    new = diff_page("page", str(path), OLD)
+    assert (new.status, new.added, new.removed, new.size, new.js, new.css) == ("new", len(OLD), 0, len(OLD), 8, 13)
+
+    path.write_bytes(OLD)
+    assert diff_page("page", str(path), OLD).status == "same"
+
+    data = OLD.replace(b"let a=1;", b"let a=1,b=2;")
+    changed = diff_page("page", str(path), data)
+    assert (changed.status, changed.added, changed.removed, changed.size, changed.js, changed.css) == \
+        ("changed", 4, 0, 4, 4, 0)
+
+
+SPEC = CalculatorSpec(
+    title="Double It Calculator",
+    category="Algebra",
+    description="Doubles a number.",
+    inputs_html='<input type="number" id="x_{tool_id}" value="2">',
+    calculation_js="const x = parseFloat(document.getElementById('x_{tool_id}').value); result = x * 2;",
+    formula_latex="y = 2x",
+    educational_content="Doubling a number.",
+)
+
+
+def test_dry_run_matches_the_build(tmp_path):
+    output, static = str(tmp_path / "posts"), str(tmp_path / "static")
+    (new,) = dry_run([SPEC], output)
+    assert new.status == "new" and not os.path.exists(output)
+
+    built, _ = build([SPEC], output_dir=output, static_dir=static)
+    assert new.size == built[0].size
+    assert dry_run([SPEC], output)[0].status == "same"
+
+    spec = dataclasses.replace(SPEC, calculation_js=SPEC.calculation_js + " result = result + 1;")
+    (changed,) = dry_run([spec], output, minify=False)
+    with open(built[0].path, "rb") as f:
+        before = f.read()
+    rebuilt, _ = build([spec], output_dir=output, static_dir=static, minify=False)
+    with open(rebuilt[0].path, "rb") as f:
+        after = f.read()
+    assert (changed.added, changed.removed) == byte_changes(before, after)
+    assert changed.size == len(after) - len(before)
+    assert changed.js == inline_sizes(after)[0] - inline_sizes(before)[0] > 0
+
+
+def test_format_dry_run_totals(tmp_path):
+    text = format_dry_run(dry_run([SPEC], str(tmp_path)))
+    assert text.splitlines()[0].split() == ["Page", "Status", "+Bytes", "-Bytes", "Net", "JS", "CSS"]
+    assert "Total (1 of 1 changed)" in text.splitlines()[-1]
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from calcfoundry.engines import inflation
+
+
+def test_anchor_tables():
+    t = inflation.tables()
+    assert t.first_year == 1913
+    assert t.official[0] == 9.9
+    assert t.official[1970 - 1913] == pytest.approx(38.8)
+    assert t.shadow[1980 - 1913] == 1.0
+
+
+def test_adjust():
+    t = inflation.tables()
+    a = inflation.adjust([1000, 500], [1970, 1990], [2024, 2020], t)
+    assert a.official == pytest.approx([1000 * 314.0 / 38.8, 500 * 258.8 / 130.7])
+    assert a.official_rate[0] == pytest.approx(((314.0 / 38.8) ** (1 / 54) - 1) * 100)
+    assert np.all(a.shadow > a.official)
+
+
+def test_extrapolates_past_data():
+    t = inflation.tables()
+    last = t.first_year + len(t.official) - 1
+    a = inflation.adjust(100, last, last + 2, t)
+    assert a.official == pytest.approx(100 * 1.03 ** 2)
@@ -0,0 +1,22 @@
+import pytest
+
+from calcfoundry.engines import investment
+
+
+def test_final_balance():
+    assert investment.final_balance(10000, 500, 7, 10) == pytest.approx(106639.01748372)
+    assert investment.final_balance(1000, 100, 0, 10) == pytest.approx(13000)
+
+
+def test_series_matches_closed_form():
+    s = investment.series([10000, 5000], 500, 7, [10, 2.5])
+    assert s.balance.shape == (2, 121)
+    assert s.balance[:, -1] == pytest.approx(investment.final_balance([10000, 5000], 500, 7, [10, 2.5]))
+    assert s.contributed[0, -1] == 10000 + 500 * 120
+    assert investment.yearly(s.balance).shape == (2, 11)
+
+
+def test_negative_contribution_counts_as_zero():
+    assert investment.final_balance(1000, -100, -2, 10) == pytest.approx(investment.final_balance(1000, 0, -2, 10))
+    s = investment.series(1000, -100, -2, 10)
+    assert s.balance[0, -1] == pytest.approx(investment.final_balance(1000, 0, -2, 10))
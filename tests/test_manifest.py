@@ -0,0 +1,90 @@
+import dataclasses
+import importlib
+import os
+import sys
+
+import pytest
+
+from calcfoundry import CalculatorSpec, Variants, build, manifest
+from calcfoundry.manifest import load_manifest, spec_hash
+
+build_module = sys.modules["calcfoundry.build"]
+
+SPEC = CalculatorSpec(
+    title="Double It Calculator",
+    category="Algebra",
+    description="Doubles a number.",
+    inputs_html='<input type="number" id="x_{tool_id}" value="2">',
+    calculation_js="const x = parseFloat(document.getElementById('x_{tool_id}').value); result = x * 2;",
+    formula_latex="y = 2x",
+    educational_content="Doubling a number.",
+)
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    return str(tmp_path / "posts"), str(tmp_path / "static")
+
+
+def _build(spec, dirs, **kwargs):
+    output, static = dirs
+    return build([spec], output_dir=output, static_dir=static, **kwargs)
+
+
+def test_unchanged_spec_is_skipped(dirs):
+    built, unchanged = _build(SPEC, dirs)
+    assert [r.slug for r in built] == ["double-it-calculator"] and unchanged == []
+    path = built[0].path
+    mtime = os.stat(path).st_mtime_ns
+
+    built, unchanged = _build(SPEC, dirs)
+    assert built == [] and unchanged == ["double-it-calculator"]
+    assert os.stat(path).st_mtime_ns == mtime
+    assert load_manifest(dirs[0])["double-it-calculator"]["bytes"] == os.path.getsize(path)
+
+
+def test_changed_spec_is_rebuilt_with_its_date(dirs):
+    _build(SPEC, dirs)
+    date = load_manifest(dirs[0])["double-it-calculator"]["date"]
+    built, unchanged = _build(dataclasses.replace(SPEC, description="Doubles any number."), dirs)
+    assert [r.slug for r in built] == ["double-it-calculator"] and unchanged == []
+    assert load_manifest(dirs[0])["double-it-calculator"]["date"] == date
+
+
+def test_deleted_page_and_force_rebuild(dirs):
+    built, _ = _build(SPEC, dirs)
+    os.remove(built[0].path)
+    assert len(_build(SPEC, dirs)[0]) == 1
+    assert len(_build(SPEC, dirs)[0]) == 0
+    assert len(_build(SPEC, dirs, force=True)[0]) == 1
+
+
+def test_minify_setting_is_part_of_the_version(dirs):
+    _build(SPEC, dirs)
+    assert len(_build(SPEC, dirs, minify=False)[0]) == 1
+
+
+def test_render_code_is_part_of_the_version(dirs, monkeypatch):
+    _build(SPEC, dirs)
+    monkeypatch.setattr(build_module, "RENDER_VERSION", "edited")
+    assert len(_build(SPEC, dirs)[0]) == 1
+
+
+def test_result_helpers_are_hashed(tmp_path, monkeypatch):
+    monkeypatch.setattr(manifest, "PROJECT_ROOT", str(tmp_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    helpers = tmp_path / "variant_helpers.py"
+    helpers.write_text("def label(values):\n    return str(values['x'])\n")
+    (tmp_path / "variant_spec.py").write_text(
+        "from variant_helpers import label\n\n\ndef result(values):\n    return label(values)\n"
+    )
+    try:
+        result = importlib.import_module("variant_spec").result
+        spec = dataclasses.replace(SPEC, variants=Variants(grid={"x_{tool_id}": [1, 2]}, title="{x}", result=result))
+        before = spec_hash(spec)
+        assert spec_hash(spec) == before
+        helpers.write_text("def label(values):\n    return f\"<b>{values['x']}</b>\"\n")
+        assert spec_hash(spec) != before
+    finally:
+        sys.modules.pop("variant_spec", None)
+        sys.modules.pop("variant_helpers", None)
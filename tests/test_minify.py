@@ -0,0 +1,275 @@
+import html.parser
+import json
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from calcfoundry.assets import runtime_path
+from calcfoundry.build import render_bytes
+from calcfoundry.minify import declared_globals, minify_css, minify_js, tokenize
+from calcfoundry.spec import load_specs
+from calcfoundry.variants import iter_variants
+
+
+def test_strips_comments_and_renames_locals():
+    js = "function add(alpha, beta) { // sum\n  const total = alpha + beta;\n  return total;\n}"
+    assert minify_js(js) == "function d(a,c){const b=a+c;return b;}"
+
+
+def test_top_level_names_are_kept():
+    js = "function add(alpha, beta) { return alpha + beta; }"
+    assert minify_js(js, top_level=True) == "function add(a,b){return a+b;}"
+
+
+def test_strings_regexes_and_templates_survive():
+    js = "const re = /a\\/b/g; const s = 'x // y'; const t = `${re} /* no */`;"
+    assert minify_js(js, top_level=True) == "const re=/a\\/b/g;const s='x // y';const t=`${re} /* no */`;"
+
+
+def test_line_breaks_kept_for_asi():
+    assert minify_js("let a = 1\nlet b = a\n++b") == "let a=1\nlet b=a\n++b"
+
+
+def test_shorthand_property_names_are_kept():
+    assert minify_js("function f(value) { return { value }; }").endswith("(value){return{value};}")
+
+
+def test_tool_id_token_survives():
+    js = "function go_{tool_id}(amount) { return amount * 2; }"
+    assert minify_js(js, top_level=True) == "function go_{tool_id}(a){return a*2;}"
+
+
+def test_division_is_not_a_regex():
+    assert minify_js("var x = 1; x = x / 2 / 3;") == "var x=1;x=x/2/3;"
+
+
+def test_tokenizer_round_trips_text():
+    js = "const s = 'it\\'s'; // note\nlet r = /[/]/.test(s);"
+    assert [t.text for t in tokenize(js) if t.text.strip()][:4] == ["const", "s", "=", "'it\\'s'"]
+
+
+def test_declared_globals():
+    assert "A" in declared_globals("const A = 1; function f() { let inner; }")
+    assert "inner" not in declared_globals("const A = 1; function f() { let inner; }")
+
+
+def test_minify_css_keeps_strings():
+    assert minify_css(".a { content: ' x ; y ' ; /* c */ }") == ".a{content:' x ; y '}"
+
+
+# --- WHOLE PAGES ---
+# Locals are renamed by name across a snippet, not per scope, so a name
+# declared in one function and used as a global in another would break. Every
+# generated page (variants included) is rendered raw and minified, its inline
+# scripts are parsed by V8 (as node --check does), and both versions are run
+# in node against a stub DOM: load handlers, input listeners and every on*=""
+# handler fire in page order, and each property set, DOM call and storage write
+# is logged. The minified page must leave the same log.
+
+NODE_HARNESS = """
+const vm = require('vm');
+const { core, pages } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+
+function runPage(page) {
+    const log = [];
+    const stubs = new WeakSet();
+    const snapshot = value => {
+        if (stubs.has(value)) return '<stub>';
+        if (typeof value === 'function') return '<function>';
+        if (value === null || typeof value !== 'object') return typeof value === 'number' && isNaN(value) ? 'NaN' : value;
+        try {
+            return JSON.parse(JSON.stringify(value, (k, v) => stubs.has(v) ? '<stub>' : typeof v === 'function' ? '<function>' : v));
+        } catch (e) {
+            return '<object>';
+        }
+    };
+    function stub(path, props = {}) {
+        const proxy = new Proxy(function () {}, {
+            get(target, key) {
+                if (key === Symbol.toPrimitive) return hint => hint === 'number' ? 0 : '';
+                if (key === Symbol.iterator) return function* () {};
+                if (typeof key === 'symbol' || key === 'then' || key === 'toJSON') return undefined;
+                if (!(key in props)) props[key] = stub(path + '.' + key);
+                return props[key];
+            },
+            set(target, key, value) {
+                props[key] = value;
+                log.push(['set', path + '.' + String(key), snapshot(value)]);
+                return true;
+            },
+            has(target, key) { return key in props; },
+            apply(target, self, args) {
+                log.push(['call', path, args.map(snapshot)]);
+                return stub(path + '()');
+            },
+            construct(target, args) {
+                log.push(['new', path, args.map(snapshot)]);
+                return stub('new ' + path);
+            },
+        });
+        stubs.add(proxy);
+        return proxy;
+    }
+
+    const elements = {};
+    const element = id => elements[id] || (elements[id] = stub('#' + id, Object.assign({ id, addEventListener: on('#' + id) }, page.inputs[id])));
+    let created = 0;
+    const listeners = [];
+    const on = path => (type, handler) => { listeners.push(handler); log.push(['listen', path, type]); };
+    const timers = [];
+    const queue = callback => { if (typeof callback === 'function') timers.push(callback); return timers.length; };
+
+    const storage = {};
+    class FixedDate extends Date {
+        constructor(...args) { super(...(args.length ? args : [Date.UTC(2026, 0, 15, 12)])); }
+        static now() { return Date.UTC(2026, 0, 15, 12); }
+    }
+    const sandbox = {
+        console, JSON, FixedDate,
+        document: stub('document', {
+            getElementById: id => element(id),
+            createElement: tag => stub(`<${tag}#${created++}>`),
+            addEventListener: on('document'),
+            querySelector: selector => stub('$' + selector),
+            querySelectorAll: () => [],
+        }),
+        localStorage: {
+            getItem: key => key in storage ? storage[key] : null,
+            setItem: (key, value) => { storage[key] = String(value); },
+            removeItem: key => { delete storage[key]; },
+        },
+        navigator: stub('navigator'), Blob: stub('Blob'), URL: stub('URL'), Plotly: stub('Plotly'),
+        setTimeout: queue, setInterval: queue, requestAnimationFrame: queue,
+        clearTimeout() {}, clearInterval() {}, cancelAnimationFrame() {},
+        alert: message => log.push(['alert', message]),
+        confirm: () => true,
+        performance: { now: () => 0 },
+        atob: text => Buffer.from(text, 'base64').toString('latin1'),
+        btoa: text => Buffer.from(text, 'latin1').toString('base64'),
+    };
+    const context = vm.createContext(sandbox);
+    const global = vm.runInContext('this', context);
+    global.window = global;
+    global.addEventListener = on('window');
+    vm.runInContext(`Date = FixedDate; Math.random = (() => { let s = 42; return () => (s = (s * 16807) % 2147483647) / 2147483647; })();`, context);
+
+    const attempt = (what, run) => {
+        try {
+            run();
+        } catch (e) {
+            log.push(['error', what, e && e.name]);
+        }
+    };
+    attempt('core', () => vm.runInContext(core, context));
+    page.scripts.forEach((source, i) => attempt('script ' + i, () => vm.runInContext(source, context)));
+    const drain = () => {
+        for (let n = 0; timers.length && n < 1000; n++) attempt('timer', timers.shift());
+    };
+    for (let i = 0; i < listeners.length; i++) attempt('listener', () => listeners[i](stub('event')));
+    drain();
+    for (const handler of page.handlers) {
+        attempt(handler, () => vm.runInContext(handler, context));
+        drain();
+    }
+    log.push(['storage', storage]);
+    return log;
+}
+
+const results = pages.map(page => {
+    const syntax = [];
+    page.scripts.forEach((source, i) => {
+        try {
+            new vm.Script(source, { filename: `${page.name}#${i}` });
+        } catch (e) {
+            syntax.push(`${page.name}#${i}: ${e.message}`);
+        }
+    });
+    return { syntax, log: syntax.length ? [] : runPage(page) };
+});
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+class _PageParts(html.parser.HTMLParser):
+    """Inline scripts, on*="" handlers and starting input values of a rendered page."""
+
+    def __init__(self, text):
+        super().__init__()
+        self.scripts, self.handlers, self.inputs = [], [], {}
+        self._in_script = False
+        self._select = None
+        self.feed(text)
+        self.close()
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self.handlers += [value for name, value in attrs.items() if name.startswith("on") and value]
+        if tag == "script" and "src" not in attrs:
+            self._in_script = True
+            self.scripts.append("")
+        elif tag == "input" and "id" in attrs:
+            value = attrs.get("value") or ""
+            if not value and attrs.get("type") == "number":
+                # Most inputs start blank; run them on their placeholder's example.
+                value = (re.findall(r"-?\d+(?:\.\d+)?", (attrs.get("placeholder") or "").replace(",", "")) or ["10"])[0]
+            self.inputs[attrs["id"]] = {"value": value, "checked": "checked" in attrs}
+        elif tag == "select" and "id" in attrs:
+            self._select = attrs["id"]
+            self.inputs[self._select] = {"value": None}
+        elif tag == "option" and self._select:
+            if self.inputs[self._select]["value"] is None or "selected" in attrs:
+                self.inputs[self._select]["value"] = attrs.get("value", "")
+
+    def handle_endtag(self, tag):
+        if tag == "script":
+            self._in_script = False
+        elif tag == "select":
+            self._select = None
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.scripts[-1] += data
+
+
+def _all_pages():
+    for spec in load_specs():
+        yield spec
+        if spec.variants:
+            yield from iter_variants(spec)
+
+
+def _run_pages(minify):
+    pages = []
+    for spec in _all_pages():
+        parts = _PageParts(render_bytes(spec, "2026-01-01", minify)[0].decode("utf-8"))
+        pages.append(dict(name=spec.slug, scripts=parts.scripts, handlers=parts.handlers, inputs=parts.inputs))
+    with open(runtime_path("js"), encoding="utf-8") as f:
+        core = f.read()
+    run = subprocess.run(["node", "-e", NODE_HARNESS], input=json.dumps(dict(core=core, pages=pages)),
+                         capture_output=True, text=True, check=True)
+    return dict(zip([page["name"] for page in pages], json.loads(run.stdout)))
+
+
+@pytest.fixture(scope="module")
+def page_runs():
+    return {minify: _run_pages(minify) for minify in (False, True)}
+
+
+requires_node = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+
+@requires_node
+def test_every_page_parses(page_runs):
+    errors = [error for runs in page_runs.values() for run in runs.values() for error in run["syntax"]]
+    assert not errors
+
+
+@requires_node
+def test_minified_pages_behave_the_same(page_runs):
+    raw, minified = page_runs[False], page_runs[True]
+    assert len(raw) > len(load_specs())
+    for slug, run in raw.items():
+        assert not [entry for entry in run["log"] if entry[0] == "error"], slug
+        assert minified[slug]["log"] == run["log"], slug
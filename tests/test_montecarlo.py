@@ -0,0 +1,131 @@
+import json
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+from calcfoundry.assets import core_assets, runtime_path
+from calcfoundry.engines import montecarlo
+from calcfoundry.returns import returns_table
+
+# 2,000 paths of $10,000 + $500/month at 7% (15% volatility) for 10 years, seed 42.
+# Bands at year 5 and year 10: (P10, P50, P90).
+EXPECTED = {
+    "normal": (
+        (36486.702965, 48983.992648, 65117.682031),
+        (67783.338312, 102191.793373, 155745.855175),
+    ),
+    "lognormal": (
+        (36212.041042, 48598.061839, 64710.477750),
+        (66806.760336, 100684.934280, 153809.490748),
+    ),
+    "bootstrap": (
+        (40363.011045, 58044.665572, 77140.052278),
+        (82010.239377, 136666.377679, 208705.563126),
+    ),
+}
+
+
+@pytest.mark.parametrize("model", sorted(EXPECTED))
+def test_seeded_bands(model):
+    bands = montecarlo.simulate(10000, 500, 7, 10, model=model, paths=2000, seed=42)
+    assert bands.months.tolist() == list(range(0, 121, 12))
+    for index, expected in zip((5, -1), EXPECTED[model]):
+        got = (bands.p10[index], bands.p50[index], bands.p90[index])
+        assert got == pytest.approx(expected, rel=1e-9)
+
+
+def test_bands_start_at_principal_and_stay_ordered():
+    bands = montecarlo.simulate(10000, 500, 7, 10, paths=500, seed=3)
+    assert bands.p10[0] == bands.p50[0] == bands.p90[0] == 10000
+    assert np.all(bands.p10 <= bands.p50) and np.all(bands.p50 <= bands.p90)
+
+
+def test_seed_changes_draws():
+    a = montecarlo.simulate(10000, 500, 7, 10, paths=2000, seed=42)
+    b = montecarlo.simulate(10000, 500, 7, 10, paths=2000, seed=7)
+    assert a.p50[-1] != b.p50[-1]
+
+
+def test_partial_year_reports_final_month():
+    bands = montecarlo.simulate(10000, 500, 7, 2.5, paths=100, seed=1)
+    assert bands.months.tolist() == [0, 12, 24, 30]
+
+
+def test_percentile_interpolates():
+    values = np.array([0.0, 10.0, 20.0, 30.0])
+    assert montecarlo.percentile(values, 0.5) == pytest.approx(15.0)
+    assert montecarlo.percentile(values, 0.0) == 0.0
+    assert montecarlo.percentile(values, 1.0) == 30.0
+
+
+# --- PARITY WITH THE PAGE ---
+# The bands must match CalcFoundry.monteCarlo in calcfoundry/runtime/core.js,
+# both as written and as minified into the static bundle. Without Worker
+# support the runtime runs the worker's simulate() inline, so plain node can
+# call it.
+
+NODE_HARNESS = """
+const source = require('fs').readFileSync(0, 'utf8');
+global.window = { addEventListener() {} };
+new Function(source)();
+const runs = JSON.parse(process.argv[1]).map(config => {
+    const bands = [];
+    window.CalcFoundry.monteCarlo('test', config, band => bands.push(band));
+    return bands;
+});
+process.stdout.write(JSON.stringify(runs));
+"""
+
+SCENARIOS = [
+    dict(principal=10000, contribution=500, rate=7, years=10, model="normal", volatility=15, paths=2000, seed=42),
+    dict(principal=10000, contribution=500, rate=7, years=10, model="lognormal", volatility=15, paths=2000, seed=42),
+    dict(principal=10000, contribution=500, rate=7, years=10, model="bootstrap", volatility=15, paths=2000, seed=42),
+    dict(principal=250000, contribution=0, rate=5, years=7.5, model="lognormal", volatility=22, paths=1001, seed=2**32 - 1),
+    dict(principal=0, contribution=0, rate=6, years=3, model="normal", volatility=10, paths=500, seed=9,
+         contributions=[1000] + [200 + 10 * k for k in range(36)]),
+]
+
+
+def _page_bands(source):
+    configs = []
+    for s in SCENARIOS:
+        config = dict(paths=s["paths"], months=int(round(s["years"] * 12)), principal=s["principal"],
+                      contribution=s["contribution"], model=s["model"], mean=s["rate"],
+                      volatility=s["volatility"], seed=s["seed"], returns=returns_table())
+        if "contributions" in s:
+            config["contributions"] = s["contributions"]
+        configs.append(config)
+    run = subprocess.run(["node", "-e", NODE_HARNESS, json.dumps(configs)], input=source,
+                         capture_output=True, text=True, check=True)
+    return json.loads(run.stdout)
+
+
+requires_node = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+
+def _core_js(minified):
+    if minified:
+        return core_assets()["js"][1].decode("utf-8")
+    with open(runtime_path("js"), encoding="utf-8") as f:
+        return f.read()
+
+
+@requires_node
+@pytest.mark.parametrize("minified", [False, True], ids=["raw", "minified"])
+def test_matches_core_js(minified):
+    for scenario, page in zip(SCENARIOS, _page_bands(_core_js(minified))):
+        bands = montecarlo.simulate(scenario["principal"], scenario["contribution"], scenario["rate"],
+                                    scenario["years"], model=scenario["model"], volatility=scenario["volatility"],
+                                    paths=scenario["paths"], seed=scenario["seed"],
+                                    contributions=scenario.get("contributions"))
+        assert [band["month"] for band in page] == bands.months.tolist()
+        for key in ("p10", "p50", "p90"):
+            # Same draws and arithmetic; only libm's log/cos may differ in the last ulp.
+            assert [band[key] for band in page] == pytest.approx(getattr(bands, key), rel=1e-12), (scenario["model"], key)
+
+
+@requires_node
+def test_minified_core_js_is_bit_identical():
+    assert _page_bands(_core_js(True)) == _page_bands(_core_js(False))
@@ -0,0 +1,34 @@
+import pytest
+
+from calcfoundry.engines import mortgage
+
+
+def test_quote():
+    q = mortgage.quote(300000, 6, 30, 12, 200)
+    assert q.payment == pytest.approx(1798.65157546)
+    assert q.periods == 360
+    assert q.interest == pytest.approx(347514.56716498)
+    assert q.extra_payment == pytest.approx(1998.65157546)
+    assert q.extra_periods == 279
+    assert q.extra_interest == pytest.approx(256341.13283492)
+    assert q.interest_saved == pytest.approx(91173.43433006)
+    assert q.periods_saved == 81
+
+
+def test_zero_rate():
+    q = mortgage.quote(100000, 0, 10)
+    assert q.payment == pytest.approx(100000 / 120)
+    assert q.interest == 0
+
+
+def test_broadcasts():
+    payments = mortgage.level_payment([300000, 150000], 6, 30)
+    assert payments == pytest.approx([1798.65157546, 899.32578773])
+
+
+def test_schedule_pays_off():
+    s = mortgage.schedule(1000, 12, 1)
+    assert s.balance.shape == (1, 12)
+    assert s.balance[0, -1] == pytest.approx(0, abs=1e-9)
+    assert s.principal.sum() == pytest.approx(1000)
+    assert s.interest.sum() == pytest.approx(66.18546414)
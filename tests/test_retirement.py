@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from calcfoundry.engines import retirement
+
+
+def test_years_lasting():
+    assert retirement.years_lasting(1e6, 40000, 0.03, 0.03) == pytest.approx(25)
+    assert retirement.years_lasting(1e6, 40000, 0.05, 0.03) == pytest.approx(33.62357629)
+    assert np.isinf(retirement.years_lasting(1e6, 40000, 0.08, 0.03))
+
+
+def test_safe_withdrawal_rate():
+    w = retirement.safe_withdrawal_rate(7, 3, 30)
+    assert w.fixed == pytest.approx(0.05488345, abs=1e-8)
+    assert w.worst == pytest.approx(0.03623008, abs=1e-8)
+    assert w.p90 == pytest.approx(0.05514142, abs=1e-8)
+    assert w.median == pytest.approx(0.07810061, abs=1e-8)
+    assert w.worst <= w.p90 <= w.median
+
+
+def test_goal_seek_round_trips():
+    contribution = retirement.required_contribution(50000, 1e6, 7, 3, 420)
+    assert contribution == pytest.approx(903.98467389)
+    assert retirement.real_balance(50000, contribution, 7, 3, 420) == pytest.approx(1e6)
+    assert retirement.required_months(50000, contribution, 1e6, 7, 3) == pytest.approx(420)
+    assert retirement.required_return(50000, contribution, 1e6, 3, 420) == pytest.approx(7, abs=1e-5)
+
+
+def test_goal_seek_edges():
+    assert retirement.required_months(2e6, 0, 1e6, 7, 3) == 0
+    assert np.isinf(retirement.required_months(1000, 0, 1e6, 0, 3))
+    assert np.isnan(retirement.required_return(0, 1, 1e12, 3, 12))
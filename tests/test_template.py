@@ -0,0 +1,84 @@
+import marshal
+import os
+import string
+
+import pytest
+
+from calcfoundry import template
+from calcfoundry.template import PARTIALS, PLANS, compile_plan, fill
+
+
+def test_compile_plan_alternates_literals_and_slots():
+    assert compile_plan("a {x} b {y}") == ("a ", "x", " b ", "y", "")
+    assert compile_plan("{x}") == ("", "x", "")
+    assert compile_plan("no slots") == ("no slots",)
+
+
+def test_doubled_braces_merge_into_one_literal():
+    assert compile_plan("f() {{ return {x}; }}") == ("f() { return ", "x", "; }")
+
+
+@pytest.mark.parametrize("partial", ["{x:>4}", "{x!r}", "{x.y}", "{x[0]}"])
+def test_slots_must_be_plain_names(partial):
+    with pytest.raises(ValueError, match="must be a plain name"):
+        compile_plan(partial)
+
+
+@pytest.mark.parametrize("name", sorted(PARTIALS))
+def test_plans_render_like_str_format(name):
+    fields = {field for _, field, _, _ in string.Formatter().parse(PARTIALS[name]) if field}
+    values = {field: f"<{field}>" for field in fields}
+    assert fill(PLANS[name], values) == PARTIALS[name].format(**values)
+
+
+# --- ON-DISK CACHE ---
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(template, "PLAN_CACHE", str(tmp_path / "template-plans.{version}.marshal"))
+    monkeypatch.setattr(template.sys, "dont_write_bytecode", False)
+    return tmp_path
+
+
+def _cached(cache):
+    return sorted(os.listdir(cache))
+
+
+def _read(cache, version=template.TEMPLATE_VERSION):
+    with open(cache / f"template-plans.{version}.marshal", "rb") as f:
+        return marshal.load(f)
+
+
+def test_cold_load_compiles_and_writes_the_cache(cache):
+    plans = template._load_plans()
+    assert plans == {name: compile_plan(partial) for name, partial in PARTIALS.items()}
+    assert _cached(cache) == [f"template-plans.{template.TEMPLATE_VERSION}.marshal"]
+    assert _read(cache) == plans
+
+
+def test_warm_load_reads_the_cache(cache):
+    template._load_plans()
+    marked = {name: ("from the cache",) for name in PARTIALS}
+    with open(cache / f"template-plans.{template.TEMPLATE_VERSION}.marshal", "wb") as f:
+        marshal.dump(marked, f)
+    assert template._load_plans() == marked
+
+
+def test_new_template_version_recompiles_and_drops_the_old_cache(cache, monkeypatch):
+    template._load_plans()
+    monkeypatch.setattr(template, "TEMPLATE_VERSION", "0123456789abcdef")
+    template._load_plans()
+    assert _cached(cache) == ["template-plans.0123456789abcdef.marshal"]
+
+
+@pytest.mark.parametrize("data", [b"", b"not marshal", marshal.dumps({"page": ("x",)}), marshal.dumps(["page"])])
+def test_unusable_cache_is_rebuilt(cache, data):
+    (cache / f"template-plans.{template.TEMPLATE_VERSION}.marshal").write_bytes(data)
+    assert template._load_plans() == PLANS
+    assert _read(cache) == PLANS
+
+
+def test_no_cache_written_without_bytecode(cache, monkeypatch):
+    monkeypatch.setattr(template.sys, "dont_write_bytecode", True)
+    assert template._load_plans() == PLANS
+    assert _cached(cache) == []
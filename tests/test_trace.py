@@ -0,0 +1,61 @@
+import json
+import os
+
+import pytest
+
+from calcfoundry import trace
+from calcfoundry.build import main
+
+
+@pytest.fixture(autouse=True)
+def tracing_off(monkeypatch):
+    # --trace switches tracing on for the whole process; put it back off.
+    monkeypatch.setattr(trace, "_events", None)
+
+
+def _trace(tmp_path, *args):
+    out = tmp_path / "trace.json"
+    main(["build", "--output", str(tmp_path / "posts"), "--static", str(tmp_path / "static"),
+          "--trace", str(out), *args])
+    with open(out, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_trace_file(tmp_path):
+    data = _trace(tmp_path, "--jobs", "2", "mortgage-loan-calculator")
+    assert data["displayTimeUnit"] == "ms"
+    events = data["traceEvents"]
+    names = {event["pid"]: event["args"]["name"] for event in events if event["ph"] == "M"}
+    spans = [event for event in events if event["ph"] == "X"]
+    assert names[os.getpid()] == "calcfoundry build"
+    assert {event["pid"] for event in spans} == set(names)
+    assert len(names) > 1 and all(name.startswith("worker ") for pid, name in names.items() if pid != os.getpid())
+    for event in spans:
+        assert {"name", "cat", "ts", "dur", "pid", "tid", "args"} <= set(event)
+        assert event["dur"] >= 0
+
+    (build,) = [event for event in spans if event["name"] == "build"]
+    assert build["args"] == {"jobs": 2}
+    for event in spans:
+        assert build["ts"] <= event["ts"] and event["ts"] + event["dur"] <= build["ts"] + build["dur"]
+
+    pages = [event for event in spans if event["name"] == "page"]
+    assert len(pages) == 51     # the calculator and its 50 variant pages
+    for page in pages:
+        inner = [event for event in spans if event["args"].get("slug") == page["args"]["slug"]
+                 and event["name"] in ("minify", "render", "write") and event["pid"] == page["pid"]]
+        assert sorted(event["name"] for event in inner) == ["minify", "render", "write"]
+        for event in inner:
+            assert page["ts"] <= event["ts"] and event["ts"] + event["dur"] <= page["ts"] + page["dur"]
+
+
+def test_trace_reports_the_event_count(tmp_path, capsys):
+    data = _trace(tmp_path, "bmi-calculator")
+    spans = [event for event in data["traceEvents"] if event["ph"] == "X"]
+    assert f"Wrote {len(spans)} trace events" in capsys.readouterr().out
+    assert {"build", "load specs", "bundle", "load manifest", "hash", "page", "save manifest"} <= {e["name"] for e in spans}
+
+
+def test_trace_and_watch_conflict(tmp_path):
+    with pytest.raises(SystemExit, match="can't be combined with --watch"):
+        _trace(tmp_path, "--watch")
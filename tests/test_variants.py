@@ -0,0 +1,112 @@
+import dataclasses
+import os
+
+import pytest
+
+from calcfoundry import CalculatorSpec, Variants, build
+from calcfoundry.dryrun import dry_run
+from calcfoundry.manifest import load_manifest
+from calcfoundry.variants import iter_variants, prefill_inputs, variant_slug
+
+INPUTS = """
+<input type="number" id="rate" value="5">
+<select id="term"><option value="15" selected>15</option><option value="30">30</option></select>
+"""
+
+SPEC = CalculatorSpec(
+    title="Rate Term Calculator",
+    category="Finance",
+    description="Rates and terms.",
+    inputs_html=INPUTS,
+    calculation_js="result = 1;",
+    formula_latex="y = x",
+    educational_content="Rates.",
+    variants=Variants(
+        grid={"rate": [5.0, 5.5, 55], "term": [15, 30]},
+        title="Rate {rate}% for {term} Years",
+    ),
+)
+
+
+def _variants(spec=SPEC):
+    return list(iter_variants(spec))
+
+
+def test_slugs_keep_decimal_points():
+    assert variant_slug("$200,000 Mortgage at 5.50% for 15 Years") == "200000-mortgage-at-5-50-for-15-years"
+    slugs = [v.slug for v in _variants()]
+    assert slugs[:3] == ["rate-5-0-for-15-years", "rate-5-0-for-30-years", "rate-5-5-for-15-years"]
+    assert "rate-55-for-15-years" in slugs
+    assert len(set(slugs)) == len(slugs) == 6
+
+
+def test_duplicate_slugs_are_rejected():
+    spec = dataclasses.replace(SPEC, variants=Variants(grid={"rate": [5, 6.0, 6]}, title="Rate {rate:g}"))
+    with pytest.raises(ValueError, match="both have the slug 'rate-6'"):
+        list(iter_variants(spec))
+
+
+def test_variants_share_the_parent_history():
+    keys = {v.storage_key for v in _variants()}
+    assert keys == {"calcfoundry_history_rate_term_calculator"}
+
+
+def test_prefill_inputs():
+    html = prefill_inputs(INPUTS, {"rate": 6.5, "term": 30})
+    assert '<input type="number" id="rate" value="6.5">' in html
+    assert '<option value="15">15</option><option value="30" selected>30</option>' in html
+
+
+def test_prefill_rejects_unknown_ids_and_options():
+    with pytest.raises(ValueError, match="has no <input> or <select>"):
+        prefill_inputs(INPUTS, {"missing": 1})
+    with pytest.raises(ValueError, match="is not an option of <select id='term'>"):
+        prefill_inputs(INPUTS, {"term": 20})
+
+
+# --- ORPHANED FAMILIES ---
+
+@pytest.fixture
+def dirs(tmp_path):
+    return str(tmp_path / "posts"), str(tmp_path / "static")
+
+
+def _build(specs, dirs, **kwargs):
+    return build(specs, output_dir=dirs[0], static_dir=dirs[1], minify=False, **kwargs)
+
+
+def _family_dir(dirs):
+    return os.path.join(dirs[0], SPEC.slug)
+
+
+def test_dropped_grid_prunes_the_family(dirs):
+    _build([SPEC], dirs)
+    assert len(os.listdir(_family_dir(dirs))) == 6
+    _build([dataclasses.replace(SPEC, variants=None)], dirs)
+    assert not os.path.exists(_family_dir(dirs))
+    assert "rate-term-calculator/*" not in load_manifest(dirs[0])
+    assert os.path.exists(os.path.join(dirs[0], "rate-term-calculator.md"))
+
+
+def test_removed_spec_prunes_only_on_a_complete_build(dirs):
+    _build([SPEC], dirs)
+    other = dataclasses.replace(SPEC, title="Other Calculator", variants=None)
+    _build([other], dirs)
+    assert len(os.listdir(_family_dir(dirs))) == 6
+    _build([other], dirs, complete=True)
+    assert not os.path.exists(_family_dir(dirs))
+    assert "rate-term-calculator/*" not in load_manifest(dirs[0])
+
+
+def test_dry_run_reports_deleted_variant_pages(dirs):
+    _build([SPEC], dirs)
+    with open(os.path.join(_family_dir(dirs), "rate-50-for-15-years.md"), "w") as f:
+        f.write("<script>old</script>\n")
+    family = dry_run([SPEC], dirs[0], minify=False)[1]
+    assert family.status == "6 same, 1 deleted"
+    assert (family.added, family.removed, family.size, family.js) == (0, 21, -21, -3)
+
+    orphan = dry_run([dataclasses.replace(SPEC, variants=None)], dirs[0], minify=False)[-1]
+    assert orphan.slug == "rate-term-calculator/*"
+    assert orphan.status == "7 deleted"
+    assert orphan.size < 0
@@ -0,0 +1,27 @@
+import os
+
+from calcfoundry import cpi, watch
+from calcfoundry.spec import load_specs
+
+
+def test_fragments_and_their_data_are_watched():
+    load_specs()
+    files = watch._watched_files()
+    for module in ("cashflows", "returns", "cpi"):
+        assert files[os.path.join(watch.PACKAGE_DIR, f"{module}.py")] == f"calcfoundry.{module}"
+    assert files[cpi.MONTHLY_CSV] == "calcfoundry.cpi"
+    assert os.path.join(watch.PACKAGE_DIR, "build.py") not in files
+
+
+def test_dependents():
+    assert watch._dependents({"calcfoundry.cpi"}) == {"tools.gen_true_inflation"}
+    assert watch._dependents({"calcfoundry.returns"}) == {"tools.gen_investment", "tools.gen_retirement_savings"}
+
+
+def test_fragment_change_reloads_it_and_rebuilds_its_dependents(tmp_path):
+    load_specs()
+    before = cpi.load_monthly
+    built = watch._rebuild({cpi.MONTHLY_CSV: "calcfoundry.cpi"}, {}, str(tmp_path / "posts"),
+                           str(tmp_path / "static"), minify=False)
+    assert cpi.load_monthly is not before
+    assert [result.slug for result in built] == ["shadowstats-vs-official-inflation"]
@@ -1,170 +1,4 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Calculate Tax</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            See 2024-2025 Tax Brackets
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>Recent Calculations</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    
-    <div style="display:flex; gap:10px; margin-top:10px;">
-        <button onclick="downloadHistory_{tool_id}()" class="btn-small" style="flex:1;">Save</button>
-        <button onclick="clearHistory_{tool_id}()" class="btn-small" style="flex:1;">Clear</button>
-    </div>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ 
-        renderHistory_{tool_id}();
-    }};
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        if(historyText) addToHistory_{tool_id}(historyText);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0 || history[0] !== item) {{
-            history.unshift(item);
-            if (history.length > 10) history.pop();
-            localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-            renderHistory_{tool_id}();
-        }}
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-
-    function downloadHistory_{tool_id}() {{
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0) {{
-            alert("No history to download.");
-            return;
-        }}
-
-        let content = "CalcFoundry - {title} History\\n";
-        content += "Date: " + new Date().toLocaleDateString() + "\\n";
-        content += "-----------------------------------\\n\\n";
-        
-        history.forEach(item => {{
-            let cleanItem = item.replace(/<[^>]*>?/gm, '');
-            content += cleanItem + "\\n";
-        }});
-
-        const blob = new Blob([content], {{ type: 'text/plain' }});
-        const url = window.URL.createObjectURL(blob);
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = "{title.replace(' ', '_')}_History.txt";
-        document.body.appendChild(a);
-        a.click();
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 8px 10px; margin-top: 0; color: white; border: 1px solid #555; cursor:pointer; border-radius: 4px; }}
-  .btn-small:hover {{ background: #555; }}
-  
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #007bff; }}
-  
-  /* Table Styles for Tax Breakdown */
-  .tax-table {{ width: 100%; border-collapse: collapse; margin-top: 10px; font-size: 0.9em; }}
-  .tax-table th, .tax-table td {{ padding: 8px; text-align: right; border-bottom: 1px solid #444; }}
-  .tax-table th {{ text-align: left; color: #888; font-weight: normal; }}
-  .tax-table tr:last-child td {{ border-bottom: none; font-weight: bold; color: #4caf50; font-size: 1.1em; }}
-  
-  .toggle-container {{ display: flex; align-items: center; margin-top: 10px; }}
-  .toggle-container input {{ width: auto; margin: 0 10px 0 0; }}
-  .toggle-container label {{ margin: 0; font-weight: normal; font-size: 0.9em; color: #ccc; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How it Works
-{educational_content}
-
-## The Math Behind It
-The calculator uses the **Revised Stage 3 Tax Cuts** (effective July 1, 2024) and the progressive Medicare Levy formula.
-
-**Income Tax Formula (Residents):**
-$$
-{formula_latex}
-$$
-
-**Where:**
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
+from calcfoundry import CalculatorSpec, register
 
 # === DEFINING THE AU TAX CALCULATOR ===
 
@@ -196,7 +30,7 @@ tax_js = """
     const useMedicare = document.getElementById('include_medicare').checked;
 
     let resultText = "";
-    let historyText = "";
+    let historySummary = "";
 
     if (isNaN(income) || income < 0) {
         resultText = "Please enter a valid annual income.";
@@ -264,7 +98,7 @@ tax_js = """
             </div>
         `;
         
-        historyText = `${fmt(income)} Gross -> ${fmt(net_income)} Net`;
+        historySummary = `${fmt(income)} Gross -> ${fmt(net_income)} Net`;
     }
 """
 
@@ -301,14 +135,32 @@ tax_vars = r"""
 * **Medicare Levy** is calculated separately (usually $0.02 \times y$).
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Australian Income Tax Calculator", 
-    category="Finance", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Australian Income Tax Calculator",
+    category="Finance",
     description="Estimate your weekly, fortnightly, or monthly take-home pay under the new 2024-2025 Revised Stage 3 tax cuts.",
     inputs_html=tax_inputs,
     calculation_js=tax_js,
     formula_latex=tax_latex,
     educational_content=tax_content,
-    variable_definitions=tax_vars 
-)
\ No newline at end of file
+    variable_definitions=tax_vars,
+    button_label="Calculate Tax",
+    math_link="See 2024-2025 Tax Brackets",
+    history_title="Recent Calculations",
+    usage_heading="How it Works",
+    math_intro="""The calculator uses the **Revised Stage 3 Tax Cuts** (effective July 1, 2024) and the progressive Medicare Levy formula.
+
+**Income Tax Formula (Residents):**""",
+    extra_css="""
+  /* Table Styles for Tax Breakdown */
+  .tax-table { width: 100%; border-collapse: collapse; margin-top: 10px; font-size: 0.9em; }
+  .tax-table th, .tax-table td { padding: 8px; text-align: right; border-bottom: 1px solid #444; }
+  .tax-table th { text-align: left; color: #888; font-weight: normal; }
+  .tax-table tr:last-child td { border-bottom: none; font-weight: bold; color: #4caf50; font-size: 1.1em; }
+
+  .toggle-container { display: flex; align-items: center; margin-top: 10px; }
+  .toggle-container input { width: auto; margin: 0 10px 0 0; }
+  .toggle-container label { margin: 0; font-weight: normal; font-size: 0.9em; color: #ccc; }
+""",
+))
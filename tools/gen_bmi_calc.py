@@ -1,193 +1,15 @@
-import os
-from datetime import datetime
+from calcfoundry import CalculatorSpec, register
 
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    <div style="display:flex; gap:10px; margin-bottom:15px;">
-        <button id="btn_imperial_{tool_id}" onclick="setMode_{tool_id}('imperial')" class="mode-btn active">US (Imperial)</button>
-        <button id="btn_metric_{tool_id}" onclick="setMode_{tool_id}('metric')" class="mode-btn">Metric</button>
-    </div>
-
-    <input type="hidden" id="calc_mode_{tool_id}" value="imperial">
-
-    {inputs_html}
-    
-    <button onclick="calculate_{tool_id}()">Calculate BMI</button>
-    
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            BMI Formula
-        </a>
-    </div>
-  </div>
+# === DEFINING THE BMI CALCULATOR ===
 
-  <div class="calc-history">
-    <h4>Recent Checks</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    
-    <div style="display:flex; gap:10px; margin-top:10px;">
-        <button onclick="downloadHistory_{tool_id}()" class="btn-small" style="flex:1;">Save</button>
-        <button onclick="clearHistory_{tool_id}()" class="btn-small" style="flex:1;">Clear</button>
-    </div>
-  </div>
+bmi_inputs = """
+<div style="display:flex; gap:10px; margin-bottom:15px;">
+    <button id="btn_imperial_{tool_id}" onclick="setMode_{tool_id}('imperial')" class="mode-btn active">US (Imperial)</button>
+    <button id="btn_metric_{tool_id}" onclick="setMode_{tool_id}('metric')" class="mode-btn">Metric</button>
 </div>
 
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ 
-        renderHistory_{tool_id}();
-        setMode_{tool_id}('imperial'); 
-    }};
-
-    function setMode_{tool_id}(mode) {{
-        document.getElementById('calc_mode_{tool_id}').value = mode;
-        document.getElementById('group_imperial').style.display = (mode === 'imperial') ? 'block' : 'none';
-        document.getElementById('group_metric').style.display = (mode === 'metric') ? 'block' : 'none';
-        document.getElementById('btn_imperial_{tool_id}').className = (mode === 'imperial') ? 'mode-btn active' : 'mode-btn';
-        document.getElementById('btn_metric_{tool_id}').className = (mode === 'metric') ? 'mode-btn active' : 'mode-btn';
-    }}
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        addToHistory_{tool_id}(historyItem);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        history.unshift(item);
-        if (history.length > 10) history.pop(); 
-        localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-        renderHistory_{tool_id}();
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
+<input type="hidden" id="calc_mode_{tool_id}" value="imperial">
 
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-
-    function downloadHistory_{tool_id}() {{
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0) {{
-            alert("No history to download.");
-            return;
-        }}
-
-        // 1. Prepare Content
-        let content = "CalcFoundry - {title} History\\n";
-        content += "Date: " + new Date().toLocaleDateString() + "\\n";
-        content += "-----------------------------------\\n\\n";
-        
-        history.forEach(item => {{
-            // Remove HTML tags for clean text file
-            let cleanItem = item.replace(/<[^>]*>?/gm, '');
-            content += cleanItem + "\\n";
-        }});
-
-        // 2. Create Blob
-        const blob = new Blob([content], {{ type: 'text/plain' }});
-        const url = window.URL.createObjectURL(blob);
-
-        // 3. Trigger Download
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = "{title.replace(' ', '_')}_History_" + new Date().toISOString().slice(0,10) + ".txt";
-        document.body.appendChild(a);
-        a.click();
-        
-        // 4. Cleanup
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 8px 10px; margin-top: 0; color: white; border: 1px solid #555; cursor:pointer; border-radius: 4px; }}
-  .btn-small:hover {{ background: #555; }}
-  
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-  
-  .mode-btn {{ flex:1; padding: 8px; background: #333; border: 1px solid #555; color: #888; cursor: pointer; }}
-  .mode-btn.active {{ background: #007bff; color: white; border-color: #007bff; }}
-
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #007bff; }}
-  .row-inputs {{ display: flex; gap: 10px; }}
-  .row-inputs div {{ flex: 1; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Interpret Your Results
-{educational_content}
-
-## The Math Behind It
-BMI is calculated differently depending on your unit system, though the underlying ratio remains the same:
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
-
-# === DEFINING THE BMI CALCULATOR ===
-
-bmi_inputs = """
 <div id="group_imperial">
     <label>Height</label>
     <div class="row-inputs">
@@ -208,8 +30,18 @@ bmi_inputs = """
 </div>
 """
 
+bmi_setup_js = """
+    function setMode_{tool_id}(mode) {
+        document.getElementById('calc_mode_{tool_id}').value = mode;
+        document.getElementById('group_imperial').style.display = (mode === 'imperial') ? 'block' : 'none';
+        document.getElementById('group_metric').style.display = (mode === 'metric') ? 'block' : 'none';
+        document.getElementById('btn_imperial_{tool_id}').className = (mode === 'imperial') ? 'mode-btn active' : 'mode-btn';
+        document.getElementById('btn_metric_{tool_id}').className = (mode === 'metric') ? 'mode-btn active' : 'mode-btn';
+    }
+"""
+
 bmi_js = """
-    const mode = document.getElementById('calc_mode_bmi_calculator').value;
+    const mode = document.getElementById('calc_mode_{tool_id}').value;
     let bmi = 0;
     let weight_display = "";
     let height_display = "";
@@ -239,7 +71,7 @@ bmi_js = """
     }
 
     let resultText = "";
-    let historyItem = "";
+    let historySummary = "";
 
     if (bmi > 0) {
         let category = "";
@@ -256,10 +88,10 @@ bmi_js = """
             <hr style="border-color:#444; opacity:0.3; margin: 10px 0;">
             <small>Healthy range is usually 18.5 – 24.9</small>
         `;
-        historyItem = `BMI ${bmi.toFixed(1)} (${category})`;
+        historySummary = `BMI ${bmi.toFixed(1)} (${category})`;
     } else {
         resultText = "Please enter valid height and weight measurements.";
-        historyItem = "Invalid Input";
+        historySummary = "Invalid Input";
     }
 """
 
@@ -285,14 +117,27 @@ bmi_vars = """
 * **703**: The conversion factor used only for the Imperial formula.
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="BMI Calculator", 
-    category="Health", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="BMI Calculator",
+    category="Health",
     description="Check your Body Mass Index (BMI) instantly. Supports both Metric (cm/kg) and Imperial (ft/lbs) units with accurate health categories.",
     inputs_html=bmi_inputs,
     calculation_js=bmi_js,
     formula_latex=bmi_latex,
     educational_content=bmi_content,
-    variable_definitions=bmi_vars 
-)
\ No newline at end of file
+    variable_definitions=bmi_vars,
+    button_label="Calculate BMI",
+    math_link="BMI Formula",
+    history_title="Recent Checks",
+    usage_heading="How to Interpret Your Results",
+    math_intro="BMI is calculated differently depending on your unit system, though the underlying ratio remains the same:",
+    setup_js=bmi_setup_js,
+    init_js="setMode_{tool_id}('imperial');",
+    extra_css="""
+  .mode-btn { flex:1; padding: 8px; background: #333; border: 1px solid #555; color: #888; cursor: pointer; }
+  .mode-btn.active { background: #007bff; color: white; border-color: #007bff; }
+  .row-inputs { display: flex; gap: 10px; }
+  .row-inputs div { flex: 1; }
+""",
+))
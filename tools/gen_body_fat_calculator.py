@@ -1,158 +1,4 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Calculate Body Fat</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            How is this calculated?
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>Recent Calculations</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    
-    <div style="display:flex; gap:10px; margin-top:10px;">
-        <button onclick="downloadHistory_{tool_id}()" class="btn-small" style="flex:1;">Save</button>
-        <button onclick="clearHistory_{tool_id}()" class="btn-small" style="flex:1;">Clear</button>
-    </div>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ renderHistory_{tool_id}(); }};
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        if(historySummary) addToHistory_{tool_id}(historySummary);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0 || history[0] !== item) {{
-            history.unshift(item);
-            if (history.length > 10) history.pop();
-            localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-            renderHistory_{tool_id}();
-        }}
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-
-    function downloadHistory_{tool_id}() {{
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0) {{
-            alert("No history to download.");
-            return;
-        }}
-
-        let content = "CalcFoundry - {title} History\\n";
-        content += "Date: " + new Date().toLocaleDateString() + "\\n";
-        content += "-----------------------------------\\n\\n";
-        
-        history.forEach(item => {{
-            let cleanItem = item.replace(/<[^>]*>?/gm, '');
-            content += cleanItem + "\\n";
-        }});
-
-        const blob = new Blob([content], {{ type: 'text/plain' }});
-        const url = window.URL.createObjectURL(blob);
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = "{title.replace(' ', '_')}_History.txt";
-        document.body.appendChild(a);
-        a.click();
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 8px 10px; margin-top: 0; color: white; border: 1px solid #555; cursor:pointer; border-radius: 4px; }}
-  .btn-small:hover {{ background: #555; }}
-  
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-  .row-inputs div {{ flex: 1; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Interpret Your Results
-{educational_content}
-
-## The Math Behind It
-The tool uses the following mathematical principle:
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
+from calcfoundry import CalculatorSpec, register
 
 # === DEFINING THE BODY FAT CALCULATOR ===
 
@@ -381,14 +227,20 @@ bf_vars = """
 * *Note: If Metric units are entered, they are converted to inches ($\text{inches} = \text{cm} / 2.54$) before computing.*
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Body Fat Calculator US Navy Method", 
-    category="Health", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Body Fat Calculator US Navy Method",
+    category="Health",
     description="Estimate your body fat percentage using the standard US Navy circumference-based equations. Supports both US Imperial and Metric systems.",
     inputs_html=bf_inputs,
     calculation_js=bf_js,
     formula_latex=bf_latex,
     educational_content=bf_content,
-    variable_definitions=bf_vars 
-)
+    variable_definitions=bf_vars,
+    button_label="Calculate Body Fat",
+    history_title="Recent Calculations",
+    usage_heading="How to Interpret Your Results",
+    extra_css="""
+  .row-inputs div { flex: 1; }
+""",
+))
@@ -1,130 +1,4 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Calculate Tax Estimate</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            How is this calculated?
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>Recent Calculations</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    <button onclick="clearHistory_{tool_id}()" class="btn-small">Clear History</button>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ 
-        renderHistory_{tool_id}();
-    }};
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        addToHistory_{tool_id}(historyItem);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        history.unshift(item);
-        if (history.length > 5) history.pop(); 
-        localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-        renderHistory_{tool_id}();
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 5px 10px; margin-top: 10px; }}
-  
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-  
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #007bff; }}
-  .row-inputs {{ display: flex; gap: 10px; }}
-  .row-inputs div {{ flex: 1; }}
-  .toggle-label {{ display:flex; align-items:center; gap:10px; font-weight:normal !important; margin-top:10px; cursor:pointer; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Use This Calculator
-{educational_content}
-
-## The Math Behind It (ATO Rules)
-This calculator applies the **2024-2025 Resident Tax Rates** (including the Stage 3 tax cuts).
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
+from calcfoundry import CalculatorSpec, register
 
 # === DEFINING THE CRYPTO TAX CALCULATOR ===
 
@@ -229,7 +103,7 @@ crypto_js = """
     };
 
     let resultText = "";
-    let historyItem = "";
+    let historySummary = "";
     let color = gross_gain >= 0 ? "#4caf50" : "#ff5252";
 
     if (gross_gain >= 0) {
@@ -242,7 +116,7 @@ crypto_js = """
                 Taxable Component: ${fmt(taxable_gain)} ${discount_applied ? '(50% Discount Applied)' : ''}
             </div>
         `;
-        historyItem = `Profit: ${fmt(gross_gain)} | Tax: ${fmt(tax_payable)}`;
+        historySummary = `Profit: ${fmt(gross_gain)} | Tax: ${fmt(tax_payable)}`;
     } else {
         resultText = `
             <strong>Capital Loss:</strong> <span style="color:${color}; font-size:1.4em;">${fmt(gross_gain)}</span><br>
@@ -252,7 +126,7 @@ crypto_js = """
                 Tax Payable: $0.00
             </div>
         `;
-        historyItem = `Loss: ${fmt(gross_gain)}`;
+        historySummary = `Loss: ${fmt(gross_gain)}`;
     }
 """
 
@@ -283,14 +157,25 @@ crypto_vars = """
 * $Rate$ is your marginal tax bracket percentage.
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Australia Crypto Tax Calculator", 
-    category="Finance", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Australia Crypto Tax Calculator",
+    category="Finance",
     description="Estimate your Capital Gains Tax (CGT) on cryptocurrency trades in Australia. Includes 2024-2025 tax brackets and the 50% long-term holding discount.",
     inputs_html=crypto_inputs,
     calculation_js=crypto_js,
     formula_latex=crypto_latex,
     educational_content=crypto_content,
-    variable_definitions=crypto_vars 
-)
\ No newline at end of file
+    variable_definitions=crypto_vars,
+    button_label="Calculate Tax Estimate",
+    history_title="Recent Calculations",
+    history_limit=5,
+    history_download=False,
+    clear_label="Clear History",
+    math_intro="Under the ATO rules, this calculator applies the **2024-2025 Resident Tax Rates** (including the Stage 3 tax cuts).",
+    extra_css="""
+  .row-inputs { display: flex; gap: 10px; }
+  .row-inputs div { flex: 1; }
+  .toggle-label { display:flex; align-items:center; gap:10px; font-weight:normal !important; margin-top:10px; cursor:pointer; }
+""",
+))
@@ -1,159 +1,4 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Calculate</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            How is this calculated?
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>History</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    
-    <div style="display:flex; gap:10px; margin-top:10px;">
-        <button onclick="downloadHistory_{tool_id}()" class="btn-small" style="flex:1;">Save</button>
-        <button onclick="clearHistory_{tool_id}()" class="btn-small" style="flex:1;">Clear</button>
-    </div>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ renderHistory_{tool_id}(); }};
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        if(historySummary) addToHistory_{tool_id}(historySummary);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        // Prevent duplicates at top
-        if (history.length === 0 || history[0] !== item) {{
-            history.unshift(item);
-            if (history.length > 10) history.pop();
-            localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-            renderHistory_{tool_id}();
-        }}
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-
-    function downloadHistory_{tool_id}() {{
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0) {{
-            alert("No history to download.");
-            return;
-        }}
-
-        let content = "CalcFoundry - {title} History\\n";
-        content += "Date: " + new Date().toLocaleDateString() + "\\n";
-        content += "-----------------------------------\\n\\n";
-        
-        history.forEach(item => {{
-            let cleanItem = item.replace(/<[^>]*>?/gm, '');
-            content += cleanItem + "\\n";
-        }});
-
-        const blob = new Blob([content], {{ type: 'text/plain' }});
-        const url = window.URL.createObjectURL(blob);
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = "{title.replace(' ', '_')}_History.txt";
-        document.body.appendChild(a);
-        a.click();
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 8px 10px; margin-top: 0; color: white; border: 1px solid #555; cursor:pointer; border-radius: 4px; }}
-  .btn-small:hover {{ background: #555; }}
-  
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #007bff; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Use This Calculator
-{educational_content}
-
-## The Math Behind It
-The tool uses the following mathematical principle:
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
+from calcfoundry import CalculatorSpec, cashflows, register, returns
 
 # === DEFINING THE INVESTMENT CALCULATOR ===
 
@@ -169,7 +14,7 @@ compound_inputs = """
 
 <label>Time Period (Years)</label>
 <input type="number" id="years_grow" placeholder="e.g. 30">
-"""
+""" + cashflows.INPUTS_HTML + returns.INPUTS_HTML
 
 compound_js = """
     let P = parseFloat(document.getElementById('principal').value);
@@ -177,15 +22,19 @@ compound_js = """
     let r_annual = parseFloat(document.getElementById('interest_rate').value);
     let t = parseFloat(document.getElementById('years_grow').value);
 
-    // Sanitize inputs
+    // Sanitize inputs (contributions only go in; withdrawals are one-off flows)
     if (isNaN(P)) P = 0;
-    if (isNaN(PMT)) PMT = 0;
+    if (isNaN(PMT) || PMT < 0) PMT = 0;
 
     let resultText = "";
     let historySummary = "";
 
+    const flows = readFlows_{tool_id}();
+
     if (isNaN(r_annual) || isNaN(t) || t <= 0) {
         resultText = "Please enter a valid interest rate and time period (years > 0).";
+    } else if (flows.error) {
+        resultText = flows.error;
     } else {
         // Calculations
         let n = 12; // Monthly compounding frequency
@@ -197,14 +46,30 @@ compound_js = """
         
         // Future Value of the Series (Monthly Contributions)
         let fv_series = 0;
-        if (PMT > 0 && r > 0) {
+        if (PMT > 0 && r !== 0) {
             fv_series = PMT * ( (Math.pow((1 + r/n), total_months) - 1) / (r/n) );
-        } else if (PMT > 0 && r === 0) {
+        } else if (PMT > 0) {
             fv_series = PMT * total_months;
         }
 
         let total_fv = fv_principal + fv_series;
         let total_contributed = P + (PMT * total_months);
+        let warning = "";
+
+        // Escalation, holidays and one-off flows (see flowValue_{tool_id})
+        let contributions = null;
+        if (flows.active) {
+            const scheduled = flowValue_{tool_id}(P, PMT, r_annual, total_months, flows);
+            total_fv = scheduled.balance;
+            total_contributed = scheduled.contributed;
+            contributions = monthlyFlows_{tool_id}(PMT, flows, total_months);
+            if (scheduled.negativeAt >= 0) {
+                warning = `<br><small style="color:#ff9800;">Warning: the withdrawal in month ${scheduled.negativeAt} takes the balance below zero.</small>`;
+            }
+        }
+
+        drawGrowth_{tool_id}(growthSeries_{tool_id}(P, PMT, r_annual, total_months, contributions), t);
+        runMonteCarlo_{tool_id}(P, PMT, r_annual, total_months, contributions);
         let total_interest = total_fv - total_contributed;
 
         // Formatting currency
@@ -216,7 +81,7 @@ compound_js = """
             <strong>Final Balance:</strong> <span style="color:#4caf50; font-size:1.2em;">${fmt(total_fv)}</span><br>
             <hr style="border-color:#444; opacity:0.3; margin: 10px 0;">
             <small>Total Contributed: ${fmt(total_contributed)}</small><br>
-            <small>Total Interest Earned: ${fmt(total_interest)}</small>
+            <small>Total Interest Earned: ${fmt(total_interest)}</small>${warning}
         `;
         
         // Create a clean summary for the history log/download
@@ -224,6 +89,91 @@ compound_js = """
     }
 """
 
+# --- GROWTH SERIES & CHART ---
+# Month-by-month balance, contributions and interest from one running product
+# of (1 + r/n), instead of a pow() per month. The chart redraws on every
+# keystroke, so it is a plain canvas stacked area rather than Plotly.
+
+compound_setup_js = """
+    // Balance B_k = P g_k + PMT (g_k - 1) / i with g_k = (1+i)^k built up by
+    // multiplication, for k = 0..months (a fractional final month takes the
+    // remaining fraction of a period, as in the closed form). With a
+    // contribution schedule (monthlyFlows_{tool_id}) it is the recurrence
+    // B_k = B_{k-1} (1+i) + c_k instead.
+    function growthSeries_{tool_id}(P, PMT, rateAnnual, months, contributions) {
+        if (contributions) return scheduledSeries_{tool_id}(P, rateAnnual, months, contributions);
+        const i = rateAnnual / 100 / 12;
+        const count = Math.ceil(months) + 1;
+        const balance = new Float64Array(count);
+        const contributed = new Float64Array(count);
+        const interest = new Float64Array(count);
+        let growth = 1;
+        for (let k = 0; k < count; k++) {
+            const elapsed = Math.min(k, months);
+            if (k > 0) growth *= k > months ? Math.pow(1 + i, months - (k - 1)) : 1 + i;
+            balance[k] = P * growth + (i !== 0 ? PMT * (growth - 1) / i : PMT * elapsed);
+            contributed[k] = P + PMT * elapsed;
+            interest[k] = balance[k] - contributed[k];
+        }
+        return { balance: balance, contributed: contributed, interest: interest, months: months };
+    }
+
+    function scheduledSeries_{tool_id}(P, rateAnnual, months, contributions) {
+        const i = rateAnnual / 100 / 12;
+        const count = Math.ceil(months) + 1;
+        const balance = new Float64Array(count);
+        const contributed = new Float64Array(count);
+        const interest = new Float64Array(count);
+        balance[0] = contributed[0] = P + contributions[0];
+        for (let k = 1; k < count; k++) {
+            const c = k < contributions.length ? contributions[k] : 0;
+            balance[k] = balance[k - 1] * Math.pow(1 + i, Math.min(1, months - (k - 1))) + c;
+            contributed[k] = contributed[k - 1] + c;
+            interest[k] = balance[k] - contributed[k];
+        }
+        return { balance: balance, contributed: contributed, interest: interest, months: months };
+    }
+
+    function drawGrowth_{tool_id}(series, years) {
+        const money = (v) => '$' + Math.round(v).toLocaleString('en-US');
+        // Interest can dip below zero only with negative rates; stack it from 0.
+        const gains = series.interest.map(v => Math.max(0, v));
+        const principal = series.balance.map((v, k) => Math.min(v, series.contributed[k]));
+        CalcFoundry.stackedChart('growth_chart_{tool_id}', [
+            { values: principal, color: '#2f6db5' },
+            { values: gains, color: '#4caf50' },
+        ], {
+            xMax: years,
+            xLabel: (x) => (Math.round(x * 10) / 10) + 'y',
+            yLabel: money,
+        });
+    }
+
+    function liveGrowth_{tool_id}() {
+        const P = parseFloat(document.getElementById('principal').value) || 0;
+        const PMT = Math.max(0, parseFloat(document.getElementById('monthly_contribution').value) || 0);
+        const rate = parseFloat(document.getElementById('interest_rate').value);
+        const years = parseFloat(document.getElementById('years_grow').value);
+        const flows = readFlows_{tool_id}();
+        if (isNaN(rate) || isNaN(years) || years <= 0 || years > 200 || flows.error) return;
+        const contributions = flows.active ? monthlyFlows_{tool_id}(PMT, flows, years * 12) : null;
+        drawGrowth_{tool_id}(growthSeries_{tool_id}(P, PMT, rate, years * 12, contributions), years);
+    }
+"""
+
+compound_init = """
+    ['principal', 'monthly_contribution', 'interest_rate', 'years_grow',
+     'flow_escalation_{tool_id}', 'flow_holidays_{tool_id}', 'flow_lumps_{tool_id}'].forEach(id => {
+        document.getElementById(id).addEventListener('input', liveGrowth_{tool_id});
+    });
+    liveGrowth_{tool_id}();
+"""
+
+compound_output = """
+<canvas id="growth_chart_{tool_id}" class="calc-chart"></canvas>
+<div class="calc-legend"><span style="background:#2f6db5"></span>Contributions<span style="background:#4caf50"></span>Interest</div>
+"""
+
 compound_latex = r"A = P \left(1 + \frac{r}{n}\right)^{nt} + PMT \times \frac{\left(1 + \frac{r}{n}\right)^{nt} - 1}{\frac{r}{n}}"
 
 compound_content = """
@@ -245,14 +195,18 @@ compound_vars = """
 * $t$ is the **Time** in years.
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Investment Growth Calculator", 
-    category="Finance", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Investment Growth Calculator",
+    category="Finance",
     description="Visualize the power of compound interest with monthly contributions. See how small savings grow into massive wealth over time.",
     inputs_html=compound_inputs,
     calculation_js=compound_js,
     formula_latex=compound_latex,
     educational_content=compound_content,
-    variable_definitions=compound_vars 
-)
\ No newline at end of file
+    variable_definitions=compound_vars,
+    setup_js=compound_setup_js + cashflows.SETUP_JS + returns.SETUP_JS,
+    init_js=compound_init,
+    output_html=compound_output + returns.OUTPUT_HTML,
+    extra_css=returns.CSS,
+))
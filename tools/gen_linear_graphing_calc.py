@@ -1,128 +1,27 @@
-import os
-from datetime import datetime
+from calcfoundry import CalculatorSpec, register
 
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    # Inject tool_id into JS
-    calculation_js = calculation_js.replace("{tool_id}", tool_id)
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
+# === DEFINING THE LINEAR GRAPHER LOGIC ===
 
-<div class="calc-grid">
-  <div class="calc-main">
-    
-    <div id="loading_status_{tool_id}" style="display:none; color: #888; font-size: 0.8em; margin-bottom: 5px;">Loading Graph Engine...</div>
+graph_inputs = """
+<div id="lines_container_{tool_id}" class="lines-container"></div>
+"""
 
-    <div id="lines_container_{tool_id}" class="lines-container">
-        </div>
-    
-    <div class="button-row">
+graph_actions = """<div class="button-row">
         <button onclick="addLine_{tool_id}()" class="btn-secondary">+ Add Line</button>
         <button onclick="calculate_{tool_id}()" class="btn-primary">Plot & Solve</button>
-    </div>
-
-    <div id="graph_{tool_id}" class="graph-box"></div>
+    </div>"""
 
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            How the math works
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>Analysis Log</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    
-    <div style="display:flex; gap:10px; margin-top:10px;">
-        <button onclick="downloadHistory_{tool_id}()" class="btn-small" style="flex:1;">Save</button>
-        <button onclick="clearHistory_{tool_id}()" class="btn-small" style="flex:1;">Clear Log</button>
-    </div>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
+graph_setup_js = """
     let lineCount_{tool_id} = 0;
 
-    // --- ROBUST SCRIPT LOADER ---
-    // This ensures Plotly is loaded even if Hugo strips the static tag
-    function loadPlotlyAndInit_{tool_id}() {{
-        if (typeof Plotly !== 'undefined') {{
-            initCalculator_{tool_id}();
-        }} else {{
-            const status = document.getElementById('loading_status_{tool_id}');
-            if(status) status.style.display = 'block';
-
-            const script = document.createElement('script');
-            script.src = "https://cdn.plot.ly/plotly-2.24.1.min.js";
-            script.onload = function() {{
-                if(status) status.style.display = 'none';
-                initCalculator_{tool_id}();
-            }};
-            script.onerror = function() {{
-                if(status) status.innerHTML = "Error: Could not load graphing library.";
-            }};
-            document.head.appendChild(script);
-        }}
-    }}
-
-    // Entry point
-    window.addEventListener('load', loadPlotlyAndInit_{tool_id});
-
-    function initCalculator_{tool_id}() {{
-        // Initialize with two lines
-        addLine_{tool_id}(); 
-        addLine_{tool_id}();
-        renderHistory_{tool_id}();
-        
-        // Pre-fill inputs
-        setTimeout(() => {{
-            const inputs = document.querySelectorAll('#lines_container_{tool_id} input');
-            if(inputs.length >= 4) {{
-                inputs[0].value = 2;   
-                inputs[1].value = 1;   
-                inputs[2].value = -0.5;
-                inputs[3].value = 4;   
-                calculate_{tool_id}(); 
-            }}
-        }}, 200);
-    }}
-
-    function addLine_{tool_id}() {{
+    function addLine_{tool_id}() {
         const container = document.getElementById('lines_container_{tool_id}');
         const id = lineCount_{tool_id}++;
-        
+
         const div = document.createElement('div');
         div.className = 'line-input-row';
         div.id = 'line_row_' + id;
-        
+
         // TIGHTER LAYOUT STRUCTURE
         div.innerHTML = `
             <div class="eq-group">
@@ -131,207 +30,35 @@ disableSpecial1stPost: true
                 <span class="eq-text">x +</span>
                 <input type="number" class="eq-input" placeholder="b" step="any">
             </div>
-            <button onclick="removeLine_{tool_id}(${{id}})" class="btn-remove" title="Remove Line">×</button>
+            <button onclick="removeLine_{tool_id}(${id})" class="btn-remove" title="Remove Line">×</button>
         `;
         container.appendChild(div);
-    }}
+    }
 
-    function removeLine_{tool_id}(id) {{
+    function removeLine_{tool_id}(id) {
         const row = document.getElementById('line_row_' + id);
         if(row) row.remove();
-        calculate_{tool_id}(); 
-    }}
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        if(resultText) resBox.style.display = 'block';
-        
-        if (historyText && historyText !== "Graph Updated") addToHistory_{tool_id}(historyText);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        // Prevent duplicate consecutive entries
-        if (history.length === 0 || history[0] !== item) {{
-            history.unshift(item);
-            if (history.length > 5) history.pop();
-            localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-            renderHistory_{tool_id}();
-        }}
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        if(!list) return;
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-
-    function downloadHistory_{tool_id}() {{
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0) {{
-            alert("No history to download.");
-            return;
-        }}
-
-        // 1. Prepare Content
-        let content = "CalcFoundry - {title} History\\n";
-        content += "Date: " + new Date().toLocaleDateString() + "\\n";
-        content += "-----------------------------------\\n\\n";
-        
-        history.forEach(item => {{
-            // Remove HTML tags for clean text file
-            let cleanItem = item.replace(/<[^>]*>?/gm, '');
-            content += cleanItem + "\\n";
-        }});
-
-        // 2. Create Blob
-        const blob = new Blob([content], {{ type: 'text/plain' }});
-        const url = window.URL.createObjectURL(blob);
-
-        // 3. Trigger Download
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = "{title.replace(' ', '_')}_History_" + new Date().toISOString().slice(0,10) + ".txt";
-        document.body.appendChild(a);
-        a.click();
-        
-        // 4. Cleanup
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
-    }}
-</script>
-
-<style>
-  /* MAIN LAYOUT */
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 900px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  
-  .calc-main {{ background: #1e1e1e; padding: 20px; border-radius: 8px; border: 1px solid #333; }}
-  
-  /* INPUT ROWS - FIXED FOR HORIZONTAL LAYOUT */
-  .lines-container {{ display: flex; flex-direction: column; gap: 10px; margin-bottom: 20px; }}
-  
-  .line-input-row {{ 
-      display: flex; 
-      align-items: center; 
-      justify-content: space-between; 
-      background: #2d2d2d; 
-      padding: 8px 12px; 
-      border-radius: 6px; 
-      border-left: 4px solid #007bff;
-      flex-wrap: nowrap; /* Prevent wrapping */
-  }}
-  
-  .eq-group {{ 
-      display: flex; 
-      align-items: center; 
-      flex: 1; 
-      white-space: nowrap; /* Keep text on one line */
-      overflow-x: auto; /* Handle overflow gracefully on tiny screens */
-  }}
-
-  .eq-text {{ 
-      font-weight: bold; 
-      font-family: monospace; 
-      font-size: 1.1em; 
-      color: #ddd; 
-      margin: 0 8px; /* Breathing room for text */
-  }}
-  .y-equals {{ color: #007bff; margin-left: 0; }}
-  
-  /* INPUT FIELDS - SMALLER */
-  .eq-input {{ 
-      width: 55px; /* Significantly smaller width */
-      padding: 6px; 
-      background: #111; 
-      border: 1px solid #444; 
-      color: white; 
-      border-radius: 4px; 
-      text-align: center;
-      min-width: 50px;
-  }}
-  .eq-input:focus {{ border-color: #007bff; outline: none; }}
-
-  /* BUTTONS */
-  .button-row {{ display: flex; gap: 10px; margin-bottom: 20px; }}
-  
-  .btn-primary {{ flex: 2; padding: 12px; background: #007bff; color: white; border: none; cursor: pointer; border-radius: 4px; font-weight: bold; transition: background 0.2s; }}
-  .btn-primary:hover {{ background: #0056b3; }}
-  
-  .btn-secondary {{ flex: 1; padding: 12px; background: #444; color: white; border: none; cursor: pointer; border-radius: 4px; transition: background 0.2s; }}
-  .btn-secondary:hover {{ background: #555; }}
-
-  .btn-remove {{ 
-      flex: 0 0 24px;
-      height: 24px; 
-      background: #dc3545; 
-      color: white; 
-      border: none; 
-      border-radius: 4px; 
-      cursor: pointer; 
-      display: flex; 
-      align-items: center; 
-      justify-content: center; 
-      font-weight: bold;
-      margin-left: 10px;
-  }}
-  .btn-remove:hover {{ background: #a71d2a; }}
-
-  /* GRAPH CONTAINER */
-  .graph-box {{ 
-      width: 100%; 
-      height: 450px; 
-      background: #111; 
-      border: 1px solid #444; 
-      border-radius: 4px;
-  }}
-  
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #28a745; }}
-  
-  /* HISTORY */
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; height: fit-content; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; color: #ddd; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; margin: 0; }}
-  .calc-history li {{ margin-bottom: 5px; }}
-  
-  /* UPDATED BUTTON STYLE TO MATCH BMI CALCULATOR */
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 8px 10px; margin-top: 0; color: white; border: 1px solid #555; cursor:pointer; border-radius: 4px; }}
-  .btn-small:hover {{ background: #555; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Use
-{educational_content}
-
-## The Math Behind It
-We calculate properties using the standard Slope-Intercept form:
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-{variable_definitions}
+        calculate_{tool_id}();
+    }
 """
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
-
-# === DEFINING THE LINEAR GRAPHER LOGIC ===
 
-graph_inputs = "" 
+graph_init_js = """
+            // Initialize with two lines
+            addLine_{tool_id}();
+            addLine_{tool_id}();
+
+            // Pre-fill inputs
+            setTimeout(() => {
+                const inputs = document.querySelectorAll('#lines_container_{tool_id} input');
+                if(inputs.length >= 4) {
+                    inputs[0].value = 2;
+                    inputs[1].value = 1;
+                    inputs[2].value = -0.5;
+                    inputs[3].value = 4;
+                    calculate_{tool_id}();
+                }
+            }, 200);
+"""
 
 graph_js = """
     const containerId = 'lines_container_{tool_id}';
@@ -448,7 +175,7 @@ graph_js = """
     
     // UPDATED HISTORY TEXT
     // Now saves actual coordinates (e.g., "(2.00, 4.00), (-1.50, 3.20)") instead of just "2 Intersections"
-    var historyText = (intersections.length > 0) ? intersections.map(p => p.label).join(", ") : "Graph Updated";
+    var historySummary = intersections.map(p => p.label).join(", ");
 """
 
 graph_latex = r"y = mx + b \quad \bigg| \quad x_{int} = \frac{b_2 - b_1}{m_1 - m_2}"
@@ -474,14 +201,86 @@ graph_vars = r"""
 * $x_{int}$ is the x-coordinate of the **Intersection**.
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Linear Equation Grapher", 
-    category="Algebra", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Linear Equation Grapher",
+    category="Algebra",
     description="Plot multiple linear equations (y=mx+b), find intersection points, and calculate x/y intercepts instantly with interactive graphs.",
     inputs_html=graph_inputs,
     calculation_js=graph_js,
     formula_latex=graph_latex,
     educational_content=graph_content,
-    variable_definitions=graph_vars 
-)
\ No newline at end of file
+    variable_definitions=graph_vars,
+    layout="graph",
+    actions_html=graph_actions,
+    math_link="How the math works",
+    usage_heading="How to Use",
+    math_intro="We calculate properties using the standard Slope-Intercept form:",
+    history_title="Analysis Log",
+    history_limit=5,
+    clear_label="Clear Log",
+    setup_js=graph_setup_js,
+    init_js=graph_init_js,
+    extra_css="""
+  /* INPUT ROWS - FIXED FOR HORIZONTAL LAYOUT */
+  .lines-container { display: flex; flex-direction: column; gap: 10px; margin-bottom: 20px; }
+
+  .line-input-row {
+      display: flex;
+      align-items: center;
+      justify-content: space-between;
+      background: #2d2d2d;
+      padding: 8px 12px;
+      border-radius: 6px;
+      border-left: 4px solid #007bff;
+      flex-wrap: nowrap; /* Prevent wrapping */
+  }
+
+  .eq-group {
+      display: flex;
+      align-items: center;
+      flex: 1;
+      white-space: nowrap; /* Keep text on one line */
+      overflow-x: auto; /* Handle overflow gracefully on tiny screens */
+  }
+
+  .eq-text {
+      font-weight: bold;
+      font-family: monospace;
+      font-size: 1.1em;
+      color: #ddd;
+      margin: 0 8px; /* Breathing room for text */
+  }
+  .y-equals { color: #007bff; margin-left: 0; }
+
+  /* INPUT FIELDS - SMALLER */
+  .eq-input {
+      width: 55px; /* Significantly smaller width */
+      padding: 6px;
+      background: #111;
+      border: 1px solid #444;
+      color: white;
+      border-radius: 4px;
+      text-align: center;
+      min-width: 50px;
+  }
+  .eq-input:focus { border-color: #007bff; outline: none; }
+
+  .btn-remove {
+      flex: 0 0 24px;
+      height: 24px;
+      background: #dc3545;
+      color: white;
+      border: none;
+      border-radius: 4px;
+      cursor: pointer;
+      display: flex;
+      align-items: center;
+      justify-content: center;
+      font-weight: bold;
+      margin-left: 10px;
+  }
+  .btn-remove:hover { background: #a71d2a; }
+  .calc-history li { margin-bottom: 5px; line-height: normal; }
+""",
+))
@@ -1,157 +1,9 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Calculate Payments</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            How is this calculated?
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>Recent Calculations</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    
-    <div style="display:flex; gap:10px; margin-top:10px;">
-        <button onclick="downloadHistory_{tool_id}()" class="btn-small" style="flex:1;">Save</button>
-        <button onclick="clearHistory_{tool_id}()" class="btn-small" style="flex:1;">Clear</button>
-    </div>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ renderHistory_{tool_id}(); }};
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        if(historySummary) addToHistory_{tool_id}(historySummary);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0 || history[0] !== item) {{
-            history.unshift(item);
-            if (history.length > 10) history.pop();
-            localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-            renderHistory_{tool_id}();
-        }}
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-
-    function downloadHistory_{tool_id}() {{
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0) {{
-            alert("No history to download.");
-            return;
-        }}
-
-        let content = "CalcFoundry - {title} History\\n";
-        content += "Date: " + new Date().toLocaleDateString() + "\\n";
-        content += "-----------------------------------\\n\\n";
-        
-        history.forEach(item => {{
-            let cleanItem = item.replace(/<[^>]*>?/gm, '');
-            content += cleanItem + "\\n";
-        }});
-
-        const blob = new Blob([content], {{ type: 'text/plain' }});
-        const url = window.URL.createObjectURL(blob);
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = "{title.replace(' ', '_')}_History.txt";
-        document.body.appendChild(a);
-        a.click();
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 8px 10px; margin-top: 0; color: white; border: 1px solid #555; cursor:pointer; border-radius: 4px; }}
-  .btn-small:hover {{ background: #555; }}
-  
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Use This Calculator
-{educational_content}
-
-## The Math Behind It
-The tool uses the following mathematical principle:
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
+import base64
+import json
+import math
+import struct
 
+from calcfoundry import CalculatorSpec, Variants, register
 
 # === DEFINING THE MORTGAGE & LOAN CALCULATOR ===
 
@@ -174,6 +26,9 @@ mortgage_inputs = """
 
 <label>Optional Extra Payment per Period ($)</label>
 <input type="number" id="extra_payment" placeholder="e.g. 200" value="0">
+
+<label>Optional Events (one per line: years from start, then rate / lump / offset / freq)</label>
+<textarea id="loan_events" rows="4" placeholder="2: rate 6.5&#10;3.5: lump 20000&#10;1: offset 15000&#10;5: freq fortnightly"></textarea>
 """
 
 mortgage_js = """
@@ -200,39 +55,14 @@ mortgage_js = """
             M = P / N;
         }
 
-        // Amortization tracking with/without extra payments
-        let balance_base = P;
-        let total_interest_base = 0;
-        for (let i = 0; i < N; i++) {
-            let interest = balance_base * r;
-            let principal = M - interest;
-            if (principal > balance_base) {
-                principal = balance_base;
-            }
-            total_interest_base += interest;
-            balance_base -= principal;
-            if (balance_base <= 0) break;
-        }
-
-        let balance_extra = P;
-        let total_interest_extra = 0;
-        let payments_made_extra = 0;
-        let total_paid_extra = 0;
-        let M_total = M + extra;
-
-        for (let i = 0; i < N; i++) {
-            let interest = balance_extra * r;
-            let principal = M_total - interest;
-            if (principal > balance_extra) {
-                principal = balance_extra;
-            }
-            total_interest_extra += interest;
-            balance_extra -= principal;
-            payments_made_extra++;
-            if (balance_extra <= 0) {
-                break;
-            }
-        }
+        // Closed-form payoff with/without extra payments (see payoff_{tool_id})
+        const max_periods = Math.ceil(N);
+        const M_total = M + extra;
+        const base = payoff_{tool_id}(P, r, M, max_periods);
+        const with_extra = payoff_{tool_id}(P, r, M_total, max_periods);
+        const total_interest_base = base.interest;
+        const total_interest_extra = with_extra.interest;
+        const payments_made_extra = with_extra.periods;
 
         let total_cost_base = P + total_interest_base;
         let total_cost_extra = P + total_interest_extra;
@@ -276,13 +106,383 @@ mortgage_js = """
             `;
         }
         
-        historySummary = `${fmt(P)} @ ${r_annual}% for ${t_years}y: ${fmt(M)}/${freq_name}`;
+        const events = parseEvents_{tool_id}(document.getElementById('loan_events').value);
+        if (events.error) {
+            resultText += `<hr style="border-color:#444; opacity:0.3; margin: 10px 0;"><span style="color:#ff9800;">${events.error}</span>`;
+        } else if (events.length > 0) {
+            const sim = simulate_{tool_id}(P, r_annual, t_years, freq, extra, events);
+            const years_taken = sim.years.toFixed(1);
+            resultText += `
+                <hr style="border-color:#444; opacity:0.3; margin: 10px 0;">
+                <strong>With Events (${events.length}):</strong><br>
+                ${sim.balance > 0 ? `Balance left at end of term: ${fmt(sim.balance)}` : `Paid off after ${years_taken} years (${sim.payments} payments)`}<br>
+                Total Cost: ${fmt(P - sim.balance + sim.interest)} (Interest: ${fmt(sim.interest)})<br>
+                <span style="color:${sim.interest <= total_interest_extra ? '#4caf50' : '#ff9800'}; font-weight:bold;">${fmt(Math.abs(total_interest_extra - sim.interest))} ${sim.interest <= total_interest_extra ? 'less' : 'more'} interest than without events</span>
+                ${renderSegments_{tool_id}(sim.segments, fmt)}
+            `;
+            historySummary = ` [${events.length} event${events.length === 1 ? '' : 's'}: ${fmt(sim.interest)} interest]`;
+        }
+
+        renderSensitivity_{tool_id}(sensitivityGrid_{tool_id}(P, r_annual, freq, extra), r_annual, t_years);
+        renderSchedule_{tool_id}(amortizationSchedule_{tool_id}(P, r, M_total, with_extra.periods), freq_name);
+
+        historySummary = `${fmt(P)} @ ${r_annual}% for ${t_years}y: ${fmt(M)}/${freq_name}` + historySummary;
         if (extra > 0) {
             historySummary += ` (+${fmt(extra)} extra, saved ${fmt(interest_saved)})`;
         }
     }
 """
 
+mortgage_setup_js = """
+    // Payoff of a loan P at periodic rate r with a level payment X, in O(1).
+    // The balance after k payments is B_k = P(1+r)^k - X((1+r)^k - 1)/r, so it
+    // reaches zero after n = ceil(-ln(1 - rP/X) / ln(1+r)) payments; the final
+    // payment is only B_{n-1}(1+r). Loans that don't clear within maxPeriods
+    // (X too small) stop there with the balance left outstanding.
+    function payoff_{tool_id}(P, r, X, maxPeriods) {
+        const balanceAfter = (k) => r > 0
+            ? P * Math.pow(1 + r, k) - X * (Math.pow(1 + r, k) - 1) / r
+            : P - X * k;
+
+        if (X > P * r) {
+            const exact = r > 0 ? -Math.log(1 - r * P / X) / Math.log(1 + r) : P / X;
+            const n = Math.max(1, Math.ceil(exact - 1e-9));
+            if (n <= maxPeriods) {
+                const last = balanceAfter(n - 1) * (1 + r);
+                return { periods: n, interest: (n - 1) * X + last - P, balance: 0 };
+            }
+        }
+        const balance = balanceAfter(maxPeriods);
+        return { periods: maxPeriods, interest: maxPeriods * X + balance - P, balance: balance };
+    }
+"""
+
+# --- EVENT TIMELINE ---
+# Variable-rate loans: rate resets, lump sums, offset balances and frequency
+# switches at given times (years from the start, taking effect at the next
+# payment). The simulator jumps from event to event with closed-form segments,
+# so its cost depends on the number of events, not the number of payments.
+
+mortgage_events_js = """
+    const FREQUENCIES_{tool_id} = { monthly: 12, fortnightly: 26, weekly: 52 };
+    const FREQ_NAMES_{tool_id} = { 12: 'monthly', 26: 'fortnightly', 52: 'weekly' };
+
+    // "2: rate 6.5" -> { at: 2, type: 'rate', value: 6.5 }. Returns the events
+    // sorted by time, or { error } for the first line that doesn't parse.
+    function parseEvents_{tool_id}(text) {
+        const events = [];
+        const lines = text.split('\\n');
+        for (let i = 0; i < lines.length; i++) {
+            const line = lines[i].trim();
+            if (!line) continue;
+            const m = /^([\\d.]+)\\s*(?:y|years?)?\\s*[:,]?\\s*(rate|lump|offset|freq)\\s+([\\w.]+)$/i.exec(line);
+            let value = m ? parseFloat(m[3]) : NaN;
+            if (m && m[2].toLowerCase() === 'freq') {
+                value = FREQUENCIES_{tool_id}[m[3].toLowerCase()] || (FREQ_NAMES_{tool_id}[value] ? value : NaN);
+            }
+            if (!m || isNaN(value) || value < 0) {
+                return { error: `Could not read event line ${i + 1}: "${line}". Use e.g. "2: rate 6.5", "3: lump 20000", "1: offset 15000" or "5: freq weekly".` };
+            }
+            events.push({ at: parseFloat(m[1]), type: m[2].toLowerCase(), value: value });
+        }
+        return events.sort((a, b) => a.at - b.at);
+    }
+
+    // n payments of X on balance B with offset O, in O(1). Interest accrues on
+    // the net debt D = B - O, which amortizes like a plain loan of D; once D
+    // reaches zero the payments reduce B without interest.
+    function advance_{tool_id}(B, O, r, X, n) {
+        let D = B - O, k = 0, interest = 0;
+        if (D > 0) {
+            const seg = payoff_{tool_id}(D, r, X, n);
+            k = seg.periods;
+            if (seg.balance > 0) return { balance: seg.balance + O, interest: seg.interest, periods: k };
+            const growth = Math.pow(1 + r, k);
+            const overpaid = r > 0 ? D * growth - X * (growth - 1) / r : D - X * k;   // <= 0: net debt after payment k
+            interest = seg.interest;
+            B = O + overpaid;
+            if (B <= 0) return { balance: 0, interest: interest, periods: k };
+        }
+        const rest = Math.min(n - k, Math.ceil(B / X - 1e-9));
+        return { balance: Math.max(0, B - rest * X), interest: interest, periods: k + rest };
+    }
+
+    // Runs the loan through its events. The required payment is recalculated
+    // over the remaining term at the start and after every rate reset or
+    // frequency switch; lump sums and offset changes keep the payment, so they
+    // shorten the loan instead.
+    function simulate_{tool_id}(P, rate, years, freq, extra, events) {
+        let B = P, O = 0, t = 0, r = rate / 100 / freq;
+        let interest = 0, payments = 0;
+        const segments = [];
+        const remaining = (until) => Math.max(0, Math.ceil((until - t) * freq - 1e-9));
+        const required = () => {
+            const n = Math.max(1, remaining(years));
+            const growth = Math.pow(1 + r, n);
+            return (r > 0 ? B * (r * growth) / (growth - 1) : B / n) + extra;
+        };
+        let X = required();
+
+        for (let i = 0; i <= events.length && B > 0; i++) {
+            const event = events[i];
+            const until = event ? Math.min(event.at, years) : years;
+            const seg = advance_{tool_id}(B, O, r, X, remaining(until));
+            if (seg.periods > 0) {
+                segments.push({ from: t, periods: seg.periods, freq: freq, rate: r * freq * 100, payment: X, offset: O, interest: seg.interest });
+            }
+            t += seg.periods / freq;
+            B = seg.balance;
+            interest += seg.interest;
+            payments += seg.periods;
+            if (!event || B <= 0 || event.at >= years) break;
+
+            if (event.type === 'rate') {
+                rate = event.value;
+                r = rate / 100 / freq;
+                X = required();
+            } else if (event.type === 'freq') {
+                freq = event.value;
+                r = rate / 100 / freq;
+                X = required();
+            } else if (event.type === 'lump') {
+                B = Math.max(0, B - event.value);
+            } else {
+                O = event.value;
+            }
+        }
+        // Sub-cent leftovers are float dust from the closed form, not an unpaid balance.
+        return { balance: B >= 0.005 ? B : 0, interest: interest, payments: payments, years: t, segments: segments };
+    }
+
+    function renderSegments_{tool_id}(segments, fmt) {
+        let html = '<table class="sens-table" style="margin-top:10px;"><thead><tr><th>From</th><th>Payments</th><th>Rate</th><th>Payment</th><th>Offset</th><th>Interest</th></tr></thead><tbody>';
+        for (const seg of segments) {
+            html += `<tr><td>${seg.from.toFixed(2)}y</td><td>${seg.periods} ${FREQ_NAMES_{tool_id}[seg.freq]}</td><td>${seg.rate.toFixed(2)}%</td>`
+                + `<td>${fmt(seg.payment)}</td><td>${fmt(seg.offset)}</td><td>${fmt(seg.interest)}</td></tr>`;
+        }
+        return html + '</tbody></table>';
+    }
+"""
+
+# --- SENSITIVITY HEATMAP ---
+# Payment and total interest across rates around the user's rate and a fixed
+# set of terms. The default inputs' grid is computed here at build time and
+# baked into the page as a base64 Float32Array; other inputs are recomputed
+# in the browser with the O(1) payment and payoff formulas (49 cells).
+
+SENSITIVITY_RATE_STEPS = [-1.5, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5]   # the window shifts up near 0%
+SENSITIVITY_TERMS = [10, 15, 20, 25, 30, 35, 40]
+SENSITIVITY_DEFAULT = (300000, 6.0, 12, 0)   # loan amount, rate, frequency, extra (the input defaults)
+
+
+def _payoff_interest(P, r, X, max_periods):
+    # Python twin of payoff_{tool_id}; total interest only.
+    def balance_after(k):
+        return P * (1 + r) ** k - X * ((1 + r) ** k - 1) / r if r > 0 else P - X * k
+
+    if X > P * r:
+        exact = -math.log(1 - r * P / X) / math.log(1 + r) if r > 0 else P / X
+        n = max(1, math.ceil(exact - 1e-9))
+        if n <= max_periods:
+            return (n - 1) * X + balance_after(n - 1) * (1 + r) - P
+    return max_periods * X + balance_after(max_periods) - P
+
+
+def sensitivity_rates(rate):
+    base = max(rate, -SENSITIVITY_RATE_STEPS[0])
+    return [base + step for step in SENSITIVITY_RATE_STEPS]
+
+
+def sensitivity_grid(P, rate, freq, extra):
+    """Row-major (rate, term) cells of [payment, total interest], as sensitivityGrid_{tool_id} computes them."""
+    cells = []
+    for row_rate in sensitivity_rates(rate):
+        r = row_rate / 100 / freq
+        for years in SENSITIVITY_TERMS:
+            N = years * freq
+            M = P * (r * (1 + r) ** N) / ((1 + r) ** N - 1) if r > 0 else P / N
+            cells += [M, _payoff_interest(P, r, M + extra, math.ceil(N))]
+    return cells
+
+
+def _baked_sensitivity():
+    cells = sensitivity_grid(*SENSITIVITY_DEFAULT)
+    data = base64.b64encode(struct.pack(f"<{len(cells)}f", *cells)).decode("ascii")
+    return json.dumps({"center": list(SENSITIVITY_DEFAULT), "data": data})
+
+
+mortgage_sensitivity_js = """
+    const SENS_RATE_STEPS_{tool_id} = """ + json.dumps(SENSITIVITY_RATE_STEPS) + """;
+    const SENS_TERMS_{tool_id} = """ + json.dumps(SENSITIVITY_TERMS) + """;
+    // Grid for the default inputs, computed at build time: [payment, interest] per (rate, term), Float32 LE.
+    const SENS_DEFAULT_{tool_id} = """ + _baked_sensitivity() + """;
+    let sensState_{tool_id} = null;
+
+    function sensitivityRates_{tool_id}(rate) {
+        const base = Math.max(rate, -SENS_RATE_STEPS_{tool_id}[0]);
+        return SENS_RATE_STEPS_{tool_id}.map(step => base + step);
+    }
+
+    function sensitivityGrid_{tool_id}(P, rate, freq, extra) {
+        const grid = new Float64Array(SENS_RATE_STEPS_{tool_id}.length * SENS_TERMS_{tool_id}.length * 2);
+        let i = 0;
+        for (const rowRate of sensitivityRates_{tool_id}(rate)) {
+            const r = rowRate / 100 / freq;
+            for (const years of SENS_TERMS_{tool_id}) {
+                const N = years * freq;
+                const M = r > 0 ? P * (r * Math.pow(1 + r, N)) / (Math.pow(1 + r, N) - 1) : P / N;
+                grid[i++] = M;
+                grid[i++] = payoff_{tool_id}(P, r, M + extra, Math.ceil(N)).interest;
+            }
+        }
+        return grid;
+    }
+
+    function renderSensitivity_{tool_id}(grid, rate, years) {
+        sensState_{tool_id} = { grid: grid, rate: rate, years: years };
+        const box = document.getElementById('sensitivity_{tool_id}');
+        if (!box) return;
+        const metric = document.getElementById('sens_metric_{tool_id}').value === 'interest' ? 1 : 0;
+        const terms = SENS_TERMS_{tool_id};
+        let lo = Infinity, hi = -Infinity;
+        for (let i = metric; i < grid.length; i += 2) {
+            lo = Math.min(lo, grid[i]);
+            hi = Math.max(hi, grid[i]);
+        }
+        const fmt = (num) => '$' + Math.round(num).toLocaleString('en-US');
+
+        let html = '<table class="sens-table"><thead><tr><th>Rate / Term</th>';
+        html += terms.map(t => `<th class="${t === years ? 'sens-current' : ''}">${t}y</th>`).join('');
+        html += '</tr></thead><tbody>';
+        sensitivityRates_{tool_id}(rate).forEach((rowRate, row) => {
+            const isRate = Math.abs(rowRate - rate) < 1e-9;
+            html += `<tr><th class="${isRate ? 'sens-current' : ''}">${rowRate.toFixed(2)}%</th>`;
+            terms.forEach((t, col) => {
+                const value = grid[(row * terms.length + col) * 2 + metric];
+                const heat = hi > lo ? (value - lo) / (hi - lo) : 0;
+                const current = isRate && t === years ? ' sens-current' : '';
+                html += `<td class="sens-cell${current}" style="background:hsl(${Math.round(120 - 120 * heat)},45%,28%)">${fmt(value)}</td>`;
+            });
+            html += '</tr>';
+        });
+        box.innerHTML = html + '</tbody></table>';
+    }
+
+    function redrawSensitivity_{tool_id}() {
+        if (sensState_{tool_id}) renderSensitivity_{tool_id}(sensState_{tool_id}.grid, sensState_{tool_id}.rate, sensState_{tool_id}.years);
+    }
+"""
+
+# --- AMORTIZATION SCHEDULE ---
+# The full per-period schedule (with any extra payment) lives in Float64Arrays;
+# CalcFoundry.virtualTable only puts the rows in view into the DOM, so a
+# 40-year weekly loan (2,080 rows) scrolls as cheaply as a 10-year monthly one.
+
+mortgage_schedule_js = """
+    let schedule_{tool_id} = null;
+    let scheduleTable_{tool_id} = null;
+
+    // Row k (payment k + 1) from the closed-form opening balance B_k, like engines/mortgage.py.
+    function amortizationSchedule_{tool_id}(P, r, X, periods) {
+        const interest = new Float64Array(periods);
+        const principal = new Float64Array(periods);
+        const balance = new Float64Array(periods);
+        for (let k = 0; k < periods; k++) {
+            const growth = Math.pow(1 + r, k);
+            const opening = r > 0 ? P * growth - X * (growth - 1) / r : P - X * k;
+            interest[k] = opening * r;
+            principal[k] = Math.min(X - interest[k], opening);
+            const closing = opening - principal[k];
+            balance[k] = k === periods - 1 && Math.abs(closing) < 1e-6 ? 0 : closing;
+        }
+        return { interest: interest, principal: principal, balance: balance, periods: periods };
+    }
+
+    function renderSchedule_{tool_id}(schedule, periodName) {
+        schedule_{tool_id} = schedule;
+        if (!scheduleTable_{tool_id}) {
+            const money = (num) => num.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
+            scheduleTable_{tool_id} = CalcFoundry.virtualTable(
+                'schedule_{tool_id}',
+                '<span>#</span><span>Payment</span><span>Principal</span><span>Interest</span><span>Balance</span>',
+                function(i) {
+                    const s = schedule_{tool_id};
+                    return `<span>${i + 1}</span><span>${money(s.interest[i] + s.principal[i])}</span>`
+                        + `<span>${money(s.principal[i])}</span><span>${money(s.interest[i])}</span><span>${money(s.balance[i])}</span>`;
+                }
+            );
+        }
+        const caption = document.getElementById('schedule_caption_{tool_id}');
+        if (caption) caption.innerText = `${schedule.periods.toLocaleString('en-US')} ${periodName}ly payments`;
+        scheduleTable_{tool_id}(schedule.periods);
+    }
+
+    function downloadSchedule_{tool_id}() {
+        const s = schedule_{tool_id};
+        if (!s) return;
+        CalcFoundry.downloadCSV(
+            'Amortization_Schedule_' + new Date().toISOString().slice(0,10) + '.csv',
+            ['period', 'payment', 'principal', 'interest', 'balance'],
+            s.periods,
+            i => [i + 1, (s.interest[i] + s.principal[i]).toFixed(2), s.principal[i].toFixed(2), s.interest[i].toFixed(2), s.balance[i].toFixed(2)]
+        );
+    }
+"""
+
+mortgage_init = """
+    const P = parseFloat(document.getElementById('loan_amount').value);
+    const rate = parseFloat(document.getElementById('interest_rate').value);
+    const years = parseFloat(document.getElementById('loan_term').value);
+    const freq = parseInt(document.getElementById('payment_freq').value);
+    const extra = parseFloat(document.getElementById('extra_payment').value) || 0;
+    const center = SENS_DEFAULT_{tool_id}.center;
+    if (P === center[0] && rate === center[1] && freq === center[2] && extra === center[3]) {
+        const bytes = Uint8Array.from(atob(SENS_DEFAULT_{tool_id}.data), c => c.charCodeAt(0));
+        renderSensitivity_{tool_id}(new Float32Array(bytes.buffer), rate, years);
+    } else if (P > 0 && rate >= 0 && years > 0) {
+        renderSensitivity_{tool_id}(sensitivityGrid_{tool_id}(P, rate, freq, extra), rate, years);
+    }
+    if (P > 0 && rate >= 0 && years > 0) {
+        const r = rate / 100 / freq;
+        const N = years * freq;
+        const M = r > 0 ? P * (r * Math.pow(1 + r, N)) / (Math.pow(1 + r, N) - 1) : P / N;
+        const periods = payoff_{tool_id}(P, r, M + extra, Math.ceil(N)).periods;
+        renderSchedule_{tool_id}(amortizationSchedule_{tool_id}(P, r, M + extra, periods), {12: 'month', 26: 'fortnight', 52: 'week'}[freq]);
+    }
+"""
+
+mortgage_output = """
+<div class="sens-header">
+    <h4>Rate &amp; Term Sensitivity</h4>
+    <select id="sens_metric_{tool_id}" onchange="redrawSensitivity_{tool_id}()">
+        <option value="payment" selected>Payment per period</option>
+        <option value="interest">Total interest</option>
+    </select>
+</div>
+<div id="sensitivity_{tool_id}" class="sens-box"></div>
+
+<div class="sens-header">
+    <h4>Amortization Schedule <small id="schedule_caption_{tool_id}"></small></h4>
+    <button class="btn-small" onclick="downloadSchedule_{tool_id}()">💾 CSV</button>
+</div>
+<div id="schedule_{tool_id}" class="schedule-box"></div>
+"""
+
+mortgage_css = """
+  .calc-main textarea { width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; font-family: monospace; }
+  .sens-header { display: flex; align-items: center; justify-content: space-between; gap: 10px; margin-top: 20px; }
+  .sens-header h4 { margin: 0; }
+  .calc-main .sens-header select, .calc-main .sens-header button { width: auto; margin-top: 0; }
+  .sens-header small { font-weight: normal; opacity: 0.7; }
+  .sens-box { overflow-x: auto; margin-top: 10px; }
+  .sens-table { border-collapse: collapse; width: 100%; font-size: 0.8em; text-align: right; }
+  .sens-table th, .sens-table td { padding: 4px 6px; border: 1px solid #333; white-space: nowrap; }
+  .sens-table th { background: #252526; color: #bbb; }
+  .sens-table .sens-current { outline: 2px solid #4caf50; outline-offset: -2px; color: #fff; }
+  .schedule-box { margin-top: 10px; border: 1px solid #333; }
+  .schedule-box .vt-row { grid-template-columns: 0.6fr 1fr 1fr 1fr 1.2fr; grid-auto-flow: row; }
+"""
+
 mortgage_latex = r"M = P \frac{r(1+r)^N}{(1+r)^N - 1}"
 
 mortgage_content = """
@@ -294,6 +494,18 @@ When you take out a loan, each periodic payment is split between **paying off th
 3. **The Power of Extra Payments:** Because interest is calculated based on your remaining principal, making even small extra payments directly targets the principal. This reduces the balance faster, compounding your interest savings over the remainder of the loan term.
 """
 
+mortgage_outro = r"""
+With extra payments the periodic payment rises to $X = M + \text{extra}$, and the loan is repaid after
+
+$$
+n = \left\lceil \frac{-\ln\left(1 - \frac{rP}{X}\right)}{\ln(1+r)} \right\rceil
+$$
+
+payments, the last of which only clears the remaining balance. Total interest is everything paid minus $P$.
+
+With events, the loan is split into segments at each event. Within a segment the rate, payment $X$ and offset balance $O$ are fixed, and interest accrues only on the net debt $D = B - O$, so $D$ follows the same closed form as a loan of $D$ and each segment is solved in one step. A rate reset or frequency switch recalculates the required payment over the remaining term.
+"""
+
 mortgage_vars = """
 * $M$ is the **Periodic Payment**.
 * $P$ is the **Loan Principal** (total borrowed amount).
@@ -301,14 +513,47 @@ mortgage_vars = """
 * $N$ is the **Total Number of Payments** (Years $\times$ Frequency).
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Mortgage Loan Calculator", 
-    category="Finance", 
+# === VARIANT LANDING PAGES ===
+# One prefilled page per loan amount x rate x term, with the base payment precomputed.
+
+def mortgage_variant_result(values):
+    P = values["loan_amount"]
+    r = values["interest_rate"] / 100 / 12
+    N = values["loan_term"] * 12
+    M = P * (r * (1 + r) ** N) / ((1 + r) ** N - 1) if r > 0 else P / N
+    total_cost = M * N
+    return f"""
+            <strong>Base Payment per month:</strong> <span style="color:#4caf50; font-size:1.3em; font-weight:bold;">${M:,.2f}</span><br>
+            <small style="opacity:0.8">Total Payments: {N} | Total Cost: ${total_cost:,.2f} (Interest: ${total_cost - P:,.2f})</small>
+        """
+
+mortgage_variants = Variants(
+    grid={
+        "loan_amount": [200000, 300000, 400000, 500000, 750000],
+        "interest_rate": [5.0, 5.5, 6.0, 6.5, 7.0],
+        "loan_term": [15, 30],
+    },
+    title="${loan_amount:,} Mortgage at {interest_rate:.2f}% for {loan_term} Years",
+    description="Monthly payment, total cost and interest for a ${loan_amount:,} mortgage at {interest_rate:.2f}% over {loan_term} years, with room to test extra payments.",
+    result=mortgage_variant_result,
+)
+
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Mortgage Loan Calculator",
+    category="Finance",
     description="Calculate your periodic mortgage or loan payments, see the impact of extra payments, and estimate how much interest you can save.",
     inputs_html=mortgage_inputs,
     calculation_js=mortgage_js,
     formula_latex=mortgage_latex,
     educational_content=mortgage_content,
-    variable_definitions=mortgage_vars 
-)
+    variable_definitions=mortgage_vars,
+    button_label="Calculate Payments",
+    history_title="Recent Calculations",
+    math_outro=mortgage_outro,
+    setup_js=mortgage_setup_js + mortgage_events_js + mortgage_sensitivity_js + mortgage_schedule_js,
+    init_js=mortgage_init,
+    output_html=mortgage_output,
+    extra_css=mortgage_css,
+    variants=mortgage_variants,
+))
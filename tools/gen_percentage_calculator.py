@@ -1,184 +1,10 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Calculate</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            How does this work?
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>History</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    
-    <div style="display:flex; gap:10px; margin-top:10px;">
-        <button onclick="downloadHistory_{tool_id}()" class="btn-small" style="flex:1;">Save</button>
-        <button onclick="clearHistory_{tool_id}()" class="btn-small" style="flex:1;">Clear</button>
-    </div>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ 
-        renderHistory_{tool_id}();
-        updateLabels_{tool_id}(); 
-    }};
-
-    function updateLabels_{tool_id}() {{
-        const mode = document.getElementById('calc_mode').value;
-        const lblA = document.getElementById('label_a');
-        const lblB = document.getElementById('label_b');
-        
-        if (mode === 'percent_of') {{
-            lblA.innerText = "Percentage (%)";
-            lblB.innerText = "Total Value";
-        }} else if (mode === 'what_percent') {{
-            lblA.innerText = "Part Value";
-            lblB.innerText = "Total Value";
-        }} else if (mode === 'percent_change') {{
-            lblA.innerText = "Old Value";
-            lblB.innerText = "New Value";
-        }}
-    }}
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        if(historyText) addToHistory_{tool_id}(historyText);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0 || history[0] !== item) {{
-            history.unshift(item);
-            if (history.length > 10) history.pop();
-            localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-            renderHistory_{tool_id}();
-        }}
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-
-    function downloadHistory_{tool_id}() {{
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        if (history.length === 0) {{
-            alert("No history to download.");
-            return;
-        }}
-
-        let content = "CalcFoundry - {title} History\\n";
-        content += "Date: " + new Date().toLocaleDateString() + "\\n";
-        content += "-----------------------------------\\n\\n";
-        
-        history.forEach(item => {{
-            let cleanItem = item.replace(/<[^>]*>?/gm, '');
-            content += cleanItem + "\\n";
-        }});
-
-        const blob = new Blob([content], {{ type: 'text/plain' }});
-        const url = window.URL.createObjectURL(blob);
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = "{title.replace(' ', '_')}_History.txt";
-        document.body.appendChild(a);
-        a.click();
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 8px 10px; margin-top: 0; color: white; border: 1px solid #555; cursor:pointer; border-radius: 4px; }}
-  .btn-small:hover {{ background: #555; }}
-  
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #007bff; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Use
-{educational_content}
-
-## The Math Behind It
-Depending on the mode you selected, the tool uses one of these three formulas:
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
+from calcfoundry import CalculatorSpec, register
 
 # === DEFINING THE PERCENTAGE CALCULATOR ===
 
 pct_inputs = """
 <label>What do you want to calculate?</label>
-<select id="calc_mode" onchange="updateLabels_universal_percentage_calculator()">
+<select id="calc_mode" onchange="updateLabels_{tool_id}()">
     <option value="percent_of">Percentage of a Number (e.g., 20% of 150)</option>
     <option value="what_percent">What % is X of Y? (e.g., 5 is what % of 20?)</option>
     <option value="percent_change">Percentage Increase/Decrease</option>
@@ -191,6 +17,25 @@ pct_inputs = """
 <input type="number" id="input_b" placeholder="Enter second value">
 """
 
+pct_setup_js = """
+    function updateLabels_{tool_id}() {
+        const mode = document.getElementById('calc_mode').value;
+        const lblA = document.getElementById('label_a');
+        const lblB = document.getElementById('label_b');
+
+        if (mode === 'percent_of') {
+            lblA.innerText = "Percentage (%)";
+            lblB.innerText = "Total Value";
+        } else if (mode === 'what_percent') {
+            lblA.innerText = "Part Value";
+            lblB.innerText = "Total Value";
+        } else if (mode === 'percent_change') {
+            lblA.innerText = "Old Value";
+            lblB.innerText = "New Value";
+        }
+    }
+"""
+
 pct_js = """
     const mode = document.getElementById('calc_mode').value;
     const valA = parseFloat(document.getElementById('input_a').value);
@@ -198,11 +43,11 @@ pct_js = """
 
     let result = 0;
     let resultText = "";
-    let historyText = "";
+    let historySummary = "";
 
     if (isNaN(valA) || isNaN(valB)) {
         resultText = "Please enter valid numbers in both fields.";
-        historyText = "";
+        historySummary = "";
     } else {
         if (mode === 'percent_of') {
             result = (valA / 100) * valB;
@@ -210,25 +55,25 @@ pct_js = """
                 <strong>Result:</strong> <span style="color:#4caf50; font-size:1.4em;">${result.toLocaleString()}</span><br>
                 <small>${valA}% of ${valB} is ${result}</small>
             `;
-            historyText = `${valA}% of ${valB} = ${result}`;
+            historySummary = `${valA}% of ${valB} = ${result}`;
         } 
         else if (mode === 'what_percent') {
             if (valB === 0) {
                 resultText = "Cannot divide by zero.";
-                historyText = "Error";
+                historySummary = "Error";
             } else {
                 result = (valA / valB) * 100;
                 resultText = `
                     <strong>Result:</strong> <span style="color:#4caf50; font-size:1.4em;">${result.toFixed(2)}%</span><br>
                     <small>${valA} is ${result.toFixed(2)}% of ${valB}</small>
                 `;
-                historyText = `${valA} is ${result.toFixed(2)}% of ${valB}`;
+                historySummary = `${valA} is ${result.toFixed(2)}% of ${valB}`;
             }
         } 
         else if (mode === 'percent_change') {
             if (valA === 0) {
                 resultText = "Starting value cannot be zero for change calculation.";
-                historyText = "Error";
+                historySummary = "Error";
             } else {
                 result = ((valB - valA) / valA) * 100;
                 let direction = result > 0 ? "Increase" : "Decrease";
@@ -238,7 +83,7 @@ pct_js = """
                     <strong>${direction}:</strong> <span style="color:${color}; font-size:1.4em;">${Math.abs(result).toFixed(2)}%</span><br>
                     <small>From ${valA} to ${valB}</small>
                 `;
-                historyText = `${valA} -> ${valB}: ${result.toFixed(2)}%`;
+                historySummary = `${valA} -> ${valB}: ${result.toFixed(2)}%`;
             }
         }
     }
@@ -265,14 +110,19 @@ pct_vars = r"""
 * Values are standard decimal or integer inputs.
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Universal Percentage Calculator", 
-    category="Math", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Universal Percentage Calculator",
+    category="Math",
     description="The only percentage tool you need. Calculate percentage increases, find parts of a whole, and solve 'X is what percent of Y' problems instantly.",
     inputs_html=pct_inputs,
     calculation_js=pct_js,
     formula_latex=pct_latex,
     educational_content=pct_content,
-    variable_definitions=pct_vars 
-)
\ No newline at end of file
+    variable_definitions=pct_vars,
+    math_link="How does this work?",
+    usage_heading="How to Use",
+    math_intro="Depending on the mode you selected, the tool uses one of these three formulas:",
+    setup_js=pct_setup_js,
+    init_js="updateLabels_{tool_id}();",
+))
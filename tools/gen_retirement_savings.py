@@ -1,125 +1,4 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    tool_id = safe_title.replace("-", "_")
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Calculate Retirement Fund</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            See the math (Inflation Adjustment)
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>Scenarios</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    <button onclick="clearHistory_{tool_id}()" class="btn-small">Clear History</button>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    window.onload = function() {{ renderHistory_{tool_id}(); }};
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        addToHistory_{tool_id}(historySummary);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        history.unshift(item);
-        if (history.length > 5) history.pop();
-        localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-        renderHistory_{tool_id}();
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 5px 10px; margin-top: 10px; }}
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #007bff; color: white; border: none; cursor: pointer; }}
-  .calc-main button:hover {{ background: #0056b3; }}
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #007bff; }}
-  .row-inputs {{ display: flex; gap: 10px; }}
-  .row-inputs div {{ flex: 1; }}
-</style>
-
-{{{{< /calculator >}}}}
-
-## Interpretation Guide
-{educational_content}
-
-## The Math Behind It
-We calculate your future balance using the standard compound interest formula, but the "Purchasing Power" calculation adjusts for inflation using the **Real Rate of Return** (Fisher Equation):
-
-$$
-{formula_latex}
-$$
-
-**Where:**
-
-{variable_definitions}
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
-
+from calcfoundry import CalculatorSpec, cashflows, register, returns
 
 # === DEFINING THE RETIREMENT CALCULATOR ===
 
@@ -151,7 +30,41 @@ retire_inputs = """
         <input type="number" id="inflation_rate" placeholder="3" value="3">
     </div>
 </div>
-"""
+
+<div class="row-inputs">
+    <div>
+        <label>Withdrawal Rate (%)</label>
+        <input type="number" id="withdrawal_rate" placeholder="4" value="4" step="0.1">
+    </div>
+    <div>
+        <label>Plan Until Age</label>
+        <input type="number" id="plan_age" placeholder="95" value="95">
+    </div>
+    <div>
+        <label>Return in Retirement (%)</label>
+        <input type="number" id="retire_return" placeholder="same">
+    </div>
+</div>
+
+<details class="mc-options">
+    <summary>Goal seek</summary>
+    <div class="row-inputs">
+        <div>
+            <label>Target Balance (today's $)</label>
+            <input type="number" id="goal_target_{tool_id}" placeholder="e.g. 1000000">
+        </div>
+        <div>
+            <label>Solve For</label>
+            <select id="goal_solve_{tool_id}">
+                <option value="contribution" selected>Monthly contribution</option>
+                <option value="age">Retirement age</option>
+                <option value="return">Annual return</option>
+            </select>
+        </div>
+    </div>
+    <div id="goal_result_{tool_id}" class="drawdown-box"></div>
+</details>
+""" + cashflows.INPUTS_HTML + returns.INPUTS_HTML
 
 retire_js = """
     // Inputs
@@ -164,11 +77,15 @@ retire_js = """
 
     let resultText = "";
     let historySummary = "";
+    const flows = readFlows_{tool_id}();
+    retirement_{tool_id} = null;
 
     if (isNaN(age_now) || isNaN(age_ret) || age_ret <= age_now) {
         resultText = "Please ensure Retirement Age is greater than Current Age.";
     } else if (isNaN(r_nom)) {
         resultText = "Please enter an expected Annual Return rate.";
+    } else if (flows.error) {
+        resultText = flows.error;
     } else {
         let years = age_ret - age_now;
         let months = years * 12;
@@ -196,6 +113,22 @@ retire_js = """
             fv_series_real = PMT * months;
         }
         let total_real = fv_principal_real + fv_series_real;
+        let total_contributed = P + (PMT * months);
+        let warning = "";
+
+        // --- 3. CONTRIBUTION SCHEDULE (escalation, holidays, one-offs) ---
+        // Valued in O(events) with closed-form discounted sums (flowValue_{tool_id}).
+        let contributions = null;
+        if (flows.active) {
+            const nominal = flowValue_{tool_id}(P, PMT, r_nom, months, flows);
+            total_nominal = nominal.balance;
+            total_real = realBalance_{tool_id}(P, PMT, r_nom, inf, months, flows);
+            total_contributed = nominal.contributed;
+            contributions = monthlyFlows_{tool_id}(PMT, flows, months);
+            if (nominal.negativeAt >= 0) {
+                warning = `<br><small style="color:#ff9800;">Warning: the withdrawal in month ${nominal.negativeAt} takes the balance below zero.</small>`;
+            }
+        }
 
         // Formatting
         const fmt = (num) => new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD', maximumFractionDigits: 0 }).format(num);
@@ -208,11 +141,280 @@ retire_js = """
             <span style="color:#ff9800; font-size:1.2em;">${fmt(total_real)}</span>
             <hr style="border-color:#444; opacity:0.3; margin: 10px 0;">
             <small>Time Horizon: ${years} Years</small><br>
-            <small>Total Contributed: ${fmt(P + (PMT*months))}</small>
+            <small>Total Contributed: ${fmt(total_contributed)}</small>${warning}
         `;
         
+        runMonteCarlo_{tool_id}(P, PMT, r_nom, months, contributions);
+        retirement_{tool_id} = { balance: total_nominal, age: age_ret, years: years, rate: r_nom, inflation: inf };
+
         historySummary = `${years} yrs @ ${r_nom}%: ${fmt(total_nominal)}`;
     }
+    renderDrawdown_{tool_id}();
+"""
+
+# --- DRAWDOWN & SAFE WITHDRAWAL RATE ---
+# After retirement: a first-year withdrawal of rate x balance, raised with
+# inflation every year and taken at the start of the year; the rest grows at
+# the retirement return. How long that lasts has a closed form. The safe
+# withdrawal rate is found by bisection run on many return sequences at once
+# (the fixed return plus every historical S&P 500 start year), so the whole
+# section redraws as the drawdown inputs change.
+
+retire_setup_js = """
+    let retirement_{tool_id} = null;
+
+    // Withdrawals W (1+f)^y leave B_y = (1+R)^y (B - W G(q, y)), with
+    // q = (1+f)/(1+R) and G(q, y) = 1 + q + ... + q^(y-1). The money lasts
+    // while W G(q, n) <= B, so n = ln(1 + (q-1) B/W) / ln q funded years
+    // (fractional: the last one is only partly paid), or Infinity.
+    function yearsLasting_{tool_id}(B, W, R, inflation) {
+        if (W <= 0) return Infinity;
+        const q = (1 + inflation) / (1 + R);
+        if (Math.abs(q - 1) < 1e-12) return B / W;
+        const arg = 1 + (q - 1) * B / W;
+        return arg <= 0 ? Infinity : Math.log(arg) / Math.log(q);
+    }
+
+    // Highest first-year withdrawal rate (fraction of the starting balance)
+    // that funds every withdrawal for `years` years, for each lane of
+    // `growth` (lanes x years factors, row-major). All lanes bisect together:
+    // each step runs one pass over the years with every lane's own midpoint.
+    function sustainableRates_{tool_id}(growth, lanes, years, inflation, iterations) {
+        const lo = new Float64Array(lanes), hi = new Float64Array(lanes).fill(1);
+        const rate = new Float64Array(lanes), balance = new Float64Array(lanes);
+        const alive = new Uint8Array(lanes);
+        for (let it = 0; it < (iterations || 40); it++) {
+            for (let l = 0; l < lanes; l++) rate[l] = (lo[l] + hi[l]) / 2;
+            balance.fill(1);
+            alive.fill(1);
+            let raise = 1;
+            for (let y = 0; y < years; y++) {
+                for (let l = 0; l < lanes; l++) {
+                    if (!alive[l]) continue;
+                    const w = rate[l] * raise;
+                    if (balance[l] < w - 1e-12) alive[l] = 0;
+                    else balance[l] = (balance[l] - w) * growth[l * years + y];
+                }
+                raise *= 1 + inflation;
+            }
+            for (let l = 0; l < lanes; l++) {
+                if (alive[l]) lo[l] = rate[l];
+                else hi[l] = rate[l];
+            }
+        }
+        return lo;
+    }
+
+    // Lane 0 earns the fixed return every year; lane 1 + s replays the
+    // historical table from start year s, wrapping around at the end.
+    function withdrawalLanes_{tool_id}(R, years) {
+        const table = MC_RETURNS_{tool_id};
+        const lanes = table.length + 1;
+        const growth = new Float64Array(lanes * years);
+        for (let y = 0; y < years; y++) {
+            growth[y] = 1 + R;
+            for (let s = 0; s < table.length; s++) growth[(s + 1) * years + y] = 1 + table[(s + y) % table.length] / 100;
+        }
+        return { growth: growth, lanes: lanes };
+    }
+
+    function renderDrawdown_{tool_id}() {
+        const box = document.getElementById('drawdown_{tool_id}');
+        const ret = retirement_{tool_id};
+        if (!box) return;
+        if (!ret || !(ret.balance > 0)) {
+            box.innerHTML = '';
+            return;
+        }
+        const pct = parseFloat(document.getElementById('withdrawal_rate').value);
+        const planAge = parseFloat(document.getElementById('plan_age').value);
+        const retReturn = parseFloat(document.getElementById('retire_return').value);
+        const R = (isNaN(retReturn) ? ret.rate : retReturn) / 100;
+        const inflation = ret.inflation / 100;
+        const fmt = (num) => new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD', maximumFractionDigits: 0 }).format(num);
+        if (isNaN(pct) || pct < 0) {
+            box.innerHTML = 'Enter a withdrawal rate to see how long the savings last.';
+            return;
+        }
+
+        const W = ret.balance * pct / 100;
+        const today = W / Math.pow(1 + inflation, ret.years);
+        const lasts = yearsLasting_{tool_id}(ret.balance, W, R, inflation);
+        const horizon = Math.round(planAge - ret.age);
+        let html = `<strong>Drawdown:</strong> withdrawing ${pct}% = ${fmt(W)} in the first year (${fmt(today)} in today's money), rising with inflation, `;
+        if (lasts === Infinity) {
+            html += `<span style="color:#4caf50;">never runs out</span> at a ${(R * 100).toFixed(2)}% return.`;
+        } else {
+            const color = horizon > 0 && lasts < horizon ? '#ff9800' : '#4caf50';
+            html += `<span style="color:${color};">lasts ${lasts.toFixed(1)} years (to age ${(ret.age + lasts).toFixed(1)})</span> at a ${(R * 100).toFixed(2)}% return.`;
+        }
+
+        if (horizon > 0) {
+            const lanes = withdrawalLanes_{tool_id}(R, horizon);
+            const rates = sustainableRates_{tool_id}(lanes.growth, lanes.lanes, horizon, inflation);
+            const historical = Array.from(rates.subarray(1)).sort((a, b) => a - b);
+            const table = MC_RETURNS_{tool_id};
+            const pctText = (x) => (x * 100).toFixed(2) + '%';
+            html += `<br><strong>Safe withdrawal rate to age ${ret.age + horizon}:</strong> ${pctText(rates[0])} at a fixed ${(R * 100).toFixed(2)}% return`
+                + `<br><small>Historical S&amp;P 500 sequences (${table.length} start years, wrapping): `
+                + `${pctText(historical[0])} never failed, ${pctText(historical[Math.floor(0.1 * historical.length)])} succeeded in 90%, `
+                + `median ${pctText(historical[Math.floor(historical.length / 2)])}</small>`;
+        }
+        box.innerHTML = html;
+    }
+"""
+
+# --- GOAL SEEK ---
+# The inverse problem: the monthly contribution, retirement age or return that
+# reaches a target balance in today's money. The real balance is linear in the
+# contribution, and without a schedule the annuity formula inverts for the
+# horizon, so those two are closed forms (under a schedule the horizon is a
+# bisection over whole months). The return takes a bracketed Newton solve over
+# the same closed-form value. A solve is a few dozen evaluations at most, so it
+# reruns on every keystroke.
+
+goal_setup_js = """
+    // Balance in today's money after `months` months, valued as the page does:
+    // growth at the real rate, with the contributions in today's money. One-off
+    // flows are nominal, so each is first deflated by the inflation up to its
+    // month (growing it at the real rate deflates only the months after it).
+    function realBalance_{tool_id}(P, PMT, ratePercent, inflationPercent, months, flows) {
+        const j = ((1 + ratePercent / 100) / (1 + inflationPercent / 100) - 1) / 12;
+        if (flows.active) {
+            const lumps = flows.lumps.map(lump => ({
+                month: lump.month,
+                amount: lump.amount / Math.pow(1 + inflationPercent / 100, lump.month / 12),
+            }));
+            return flowValue_{tool_id}(P, PMT, j * 1200, months, Object.assign({}, flows, { lumps: lumps })).balance;
+        }
+        const g = Math.pow(1 + j, months);
+        return P * g + PMT * (j !== 0 ? (g - 1) / j : months);
+    }
+
+    // Root of f in [lo, hi], where f(lo) and f(hi) differ in sign (else NaN),
+    // starting from `guess` (the midpoint if it's outside). The bracket shrinks around the sign change every step; Newton steps (on a
+    // central-difference slope) are taken while they land inside it, and
+    // bisection otherwise, so it converges even where f is flat or has jumps.
+    function bracketedNewton_{tool_id}(f, lo, hi, tolerance, guess) {
+        let flo = f(lo);
+        const fhi = f(hi);
+        if (flo === 0) return lo;
+        if (fhi === 0) return hi;
+        if (!(flo * fhi < 0)) return NaN;
+        let x = guess > lo && guess < hi ? guess : (lo + hi) / 2;
+        for (let it = 0; it < 100 && hi - lo > tolerance; it++) {
+            const fx = f(x);
+            if (fx === 0) return x;
+            if ((fx < 0) === (flo < 0)) {
+                lo = x;
+                flo = fx;
+            } else {
+                hi = x;
+            }
+            const h = 1e-6 * (1 + Math.abs(x));
+            let next = x - fx * 2 * h / (f(x + h) - f(x - h));
+            if (!(next > lo && next < hi)) next = (lo + hi) / 2;
+            if (Math.abs(next - x) <= tolerance) return next;
+            x = next;
+        }
+        return x;
+    }
+
+    function goalSeek_{tool_id}() {
+        const box = document.getElementById('goal_result_{tool_id}');
+        const target = parseFloat(document.getElementById('goal_target_{tool_id}').value);
+        const solve = document.getElementById('goal_solve_{tool_id}').value;
+        const ageNow = parseFloat(document.getElementById('current_age').value);
+        const ageRet = parseFloat(document.getElementById('retire_age').value);
+        const P = parseFloat(document.getElementById('current_savings').value) || 0;
+        const PMT = parseFloat(document.getElementById('monthly_contrib').value) || 0;
+        const rate = parseFloat(document.getElementById('annual_return').value);
+        const inf = parseFloat(document.getElementById('inflation_rate').value) || 0;
+        const flows = readFlows_{tool_id}();
+        const fmt = (num) => new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD', maximumFractionDigits: 0 }).format(num);
+        const value = (pmt, ratePercent, months) => realBalance_{tool_id}(P, pmt, ratePercent, inf, months, flows);
+
+        if (isNaN(target) || target <= 0) {
+            box.innerHTML = '';
+            return;
+        }
+        if (flows.error) {
+            box.innerHTML = flows.error;
+            return;
+        }
+        if (isNaN(ageNow) || (solve !== 'age' && (isNaN(ageRet) || ageRet <= ageNow))) {
+            box.innerHTML = 'Enter your current and retirement ages.';
+            return;
+        }
+        if (solve !== 'return' && isNaN(rate)) {
+            box.innerHTML = 'Enter an expected Annual Return rate.';
+            return;
+        }
+        const months = (ageRet - ageNow) * 12;
+        const goal = `${fmt(target)} in today's money`;
+
+        if (solve === 'contribution') {
+            // Linear in the contribution: value(x) = value(0) + x (value(1) - value(0)).
+            const base = value(0, rate, months);
+            const needed = (target - base) / (value(1, rate, months) - base);
+            box.innerHTML = needed <= 0
+                ? `Your current savings alone reach ${goal} by age ${ageRet}.`
+                : `Contribute <strong>${fmt(Math.ceil(needed))}</strong> a month${flows.escalation ? ' to start (rising with your schedule)' : ''} to reach ${goal} by age ${ageRet}.`;
+        } else if (solve === 'age') {
+            const limit = 12 * Math.max(0, 120 - ageNow);
+            let n;
+            if (value(PMT, rate, 0) >= target) {
+                n = 0;
+            } else if (flows.active) {
+                // A schedule's balance jumps at every month end, so search the
+                // whole months: the first one that reaches the target.
+                let lo = 0, hi = Math.floor(limit);
+                if (value(PMT, rate, hi) < target) hi = NaN;
+                while (hi - lo > 1) {
+                    const mid = (lo + hi) >> 1;
+                    if (value(PMT, rate, mid) >= target) hi = mid;
+                    else lo = mid;
+                }
+                n = hi;
+            } else {
+                // (P + PMT/j)(1+j)^n - PMT/j = target, solved for n.
+                const j = ((1 + rate / 100) / (1 + inf / 100) - 1) / 12;
+                n = j !== 0
+                    ? Math.log((target + PMT / j) / (P + PMT / j)) / Math.log(1 + j)
+                    : (target - P) / PMT;
+            }
+            if (!(n >= 0 && n <= limit)) {
+                box.innerHTML = `At these contributions and returns you would not reach ${goal} by age 120.`;
+            } else {
+                const at = Math.round(ageNow * 12) + Math.ceil(n - 1e-9);
+                box.innerHTML = `You reach ${goal} at age <strong>${Math.floor(at / 12)} and ${at % 12} month(s)</strong> (${(n / 12).toFixed(1)} years from now).`;
+            }
+        } else {
+            const lo = -50, hi = 100;
+            const required = bracketedNewton_{tool_id}((r) => value(PMT, r, months) - target, lo, hi, 1e-6, rate);
+            if (value(PMT, lo, months) >= target) {
+                box.innerHTML = `You reach ${goal} by age ${ageRet} whatever the return.`;
+            } else if (isNaN(required)) {
+                box.innerHTML = `Reaching ${goal} by age ${ageRet} would take more than a ${hi}% annual return.`;
+            } else {
+                box.innerHTML = `You need an average return of at least <strong>${required.toFixed(2)}%</strong> a year (${(((1 + required / 100) / (1 + inf / 100) - 1) * 100).toFixed(2)}% after inflation) to reach ${goal} by age ${ageRet}.`;
+            }
+        }
+    }
+"""
+
+retire_init = """
+    ['withdrawal_rate', 'plan_age', 'retire_return'].forEach(id => {
+        document.getElementById(id).addEventListener('input', renderDrawdown_{tool_id});
+    });
+    ['current_age', 'retire_age', 'current_savings', 'monthly_contrib', 'annual_return', 'inflation_rate',
+     'goal_target_{tool_id}', 'goal_solve_{tool_id}', 'flow_escalation_{tool_id}', 'flow_holidays_{tool_id}', 'flow_lumps_{tool_id}'].forEach(id => {
+        document.getElementById(id).addEventListener('input', goalSeek_{tool_id});
+    });
+"""
+
+retire_output = """
+<div id="drawdown_{tool_id}" class="drawdown-box"></div>
 """
 
 retire_latex = r"r_{real} = \frac{1 + r_{nominal}}{1 + i_{inflation}} - 1"
@@ -228,6 +430,8 @@ Most calculators only show you the **Nominal Value**—the actual dollar amount
 1.  **Current & Retirement Age:** Determines your "Time Horizon" (how long the money has to grow).
 2.  **Annual Return:** The stock market (S&P 500) has historically returned about 10% annually (before inflation), or 7% (after inflation).
 3.  **Inflation Rate:** The historical average is roughly 3%. This calculator adjusts your purchasing power based on this input.
+4.  **Withdrawal Rate & Plan Until Age:** The drawdown. You take this percentage of the balance in your first year of retirement and raise it with inflation every year after. The calculator shows how long that lasts, and the **Safe Withdrawal Rate**: the highest starting rate that still lasts to your plan age at a fixed return, and across every historical S&P 500 sequence since 1970. Leave "Return in Retirement" blank to keep your Annual Return, or lower it for a more conservative portfolio.
+5.  **Goal Seek:** Have a number in mind? Enter a target balance in today's money and choose what to solve for: the monthly contribution, the retirement age or the annual return that gets you there. The answer updates as you type.
 """
 
 retire_vars = """
@@ -236,14 +440,30 @@ retire_vars = """
 * $i_{inflation}$ is the expected annual inflation rate.
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="Retirement Planning Calculator", 
-    category="Finance", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="Retirement Planning Calculator",
+    category="Finance",
     description="Calculate the future value of your retirement savings with a crucial twist: see both your projected account balance AND its actual purchasing power after inflation.",
     inputs_html=retire_inputs,
     calculation_js=retire_js,
     formula_latex=retire_latex,
     educational_content=retire_content,
-    variable_definitions=retire_vars 
-)
\ No newline at end of file
+    variable_definitions=retire_vars,
+    button_label="Calculate Retirement Fund",
+    math_link="See the math (Inflation Adjustment)",
+    history_title="Scenarios",
+    history_limit=5,
+    history_download=False,
+    clear_label="Clear History",
+    usage_heading="Interpretation Guide",
+    math_intro='We calculate your future balance using the standard compound interest formula, but the "Purchasing Power" calculation adjusts for inflation using the **Real Rate of Return** (Fisher Equation):',
+    setup_js=cashflows.SETUP_JS + returns.SETUP_JS + retire_setup_js + goal_setup_js,
+    init_js=retire_init,
+    output_html=retire_output + returns.OUTPUT_HTML,
+    extra_css="""
+  .row-inputs { display: flex; gap: 10px; }
+  .row-inputs div { flex: 1; }
+  .drawdown-box { margin-top: 15px; line-height: 1.6; }
+""" + returns.CSS,
+))
@@ -1,165 +1,6 @@
-import os
-from datetime import datetime
-
-# --- CONFIGURATION & PATH SETUP ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "content", "posts")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def create_calculator(title, category, description, inputs_html, calculation_js, formula_latex, educational_content, variable_definitions):
-    # 1. Create a safe filename
-    safe_title = "".join(c for c in title if c.isalnum() or c == " ").lower().strip().replace(" ", "-")
-    filename = os.path.join(OUTPUT_DIR, f"{safe_title}.md")
-    
-    # Create unique ID for JS
-    tool_id = safe_title.replace("-", "_")
-    
-    # 2. Date string
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    # 3. Markdown Content Construction
-    content = f"""---
-title: "{title}"
-date: {date_str}
-categories: ["{category}"]
-summary: "{description}"
-math: true
-disableSpecial1stPost: true
----
-
-{description}
-
-{{{{< calculator >}}}}
-
-<div class="calc-grid">
-  <div class="calc-main">
-    {inputs_html}
-    <button onclick="calculate_{tool_id}()">Compare Official vs. Shadow</button>
-    <div id="result_box" class="result-box" style="display:none;">
-        <span id="result_val"></span>
-    </div>
-    
-    <div style="margin-top: 15px; text-align: center; font-size: 0.85em;">
-        <a href="#the-math-behind-it" style="color: #888; text-decoration: underline; cursor: pointer;">
-            How we calculate the "Real" number
-        </a>
-    </div>
-  </div>
-
-  <div class="calc-history">
-    <h4>Recent Comparisons</h4>
-    <ul id="history_list_{tool_id}"></ul>
-    <button onclick="clearHistory_{tool_id}()" class="btn-small">Clear History</button>
-  </div>
-</div>
-
-<script>
-    const STORAGE_KEY_{tool_id} = "calcfoundry_history_{tool_id}"; 
-
-    // --- OFFICIAL BLS CPI DATA (Annual Average) ---
-    // Anchors used for interpolation. Source: BLS
-    const CPI_DATA = {{
-        1913: 9.9, 1920: 20.0, 1930: 16.7, 1940: 14.0, 1950: 24.1, 
-        1960: 29.6, 1970: 38.8, 1980: 82.4, 1990: 130.7, 2000: 172.2, 
-        2010: 218.0, 2020: 258.8, 2021: 270.9, 2022: 292.6, 2023: 304.7, 2024: 314.0, 2025: 322.0
-    }};
-
-    window.onload = function() {{ renderHistory_{tool_id}(); }};
-
-    // Helper: Linear Interpolation for Official CPI
-    function getOfficialIndex(year) {{
-        if (CPI_DATA[year]) return CPI_DATA[year];
-        
-        let keys = Object.keys(CPI_DATA).map(Number).sort((a,b)=>a-b);
-        if (year < keys[0]) return CPI_DATA[keys[0]]; 
-        if (year > keys[keys.length-1]) {{
-            // Extrapolate future at 3% if beyond data
-            let lastYear = keys[keys.length-1];
-            let lastVal = CPI_DATA[lastYear];
-            return lastVal * Math.pow(1.03, year - lastYear);
-        }}
-
-        let low = keys.filter(k => k < year).pop();
-        let high = keys.find(k => k > year);
-        
-        let ratio = (year - low) / (high - low);
-        return CPI_DATA[low] + (ratio * (CPI_DATA[high] - CPI_DATA[low]));
-    }}
-
-    function calculate_{tool_id}() {{
-        {calculation_js}
-        
-        const resBox = document.getElementById('result_box');
-        document.getElementById('result_val').innerHTML = resultText;
-        resBox.style.display = 'block';
-        addToHistory_{tool_id}(historyText);
-    }}
-
-    function addToHistory_{tool_id}(item) {{
-        let history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        history.unshift(item);
-        if (history.length > 5) history.pop();
-        localStorage.setItem(STORAGE_KEY_{tool_id}, JSON.stringify(history));
-        renderHistory_{tool_id}();
-    }}
-
-    function renderHistory_{tool_id}() {{
-        const list = document.getElementById('history_list_{tool_id}');
-        const history = JSON.parse(localStorage.getItem(STORAGE_KEY_{tool_id})) || [];
-        list.innerHTML = history.map(item => `<li>${{item}}</li>`).join('');
-    }}
-
-    function clearHistory_{tool_id}() {{
-        localStorage.removeItem(STORAGE_KEY_{tool_id});
-        renderHistory_{tool_id}();
-    }}
-</script>
-
-<style>
-  .calc-grid {{ display: grid; gap: 20px; grid-template-columns: 1fr; }}
-  @media (min-width: 768px) {{ .calc-grid {{ grid-template-columns: 2fr 1fr; }} }}
-  .calc-history {{ background: #252526; padding: 15px; border-radius: 8px; font-size: 0.9em; }}
-  .calc-history h4 {{ margin-top: 0; border-bottom: 1px solid #444; padding-bottom: 5px; }}
-  .calc-history ul {{ padding-left: 20px; color: #bbb; }}
-  .btn-small {{ background: #444; font-size: 0.8em; padding: 5px 10px; margin-top: 10px; }}
-  .calc-main label {{ display: block; margin-top: 10px; font-weight: bold; }}
-  .calc-main input, .calc-main select {{ width: 100%; padding: 8px; margin-top: 5px; background: #333; border: 1px solid #555; color: white; }}
-  
-  /* Custom Red Button */
-  .calc-main button {{ margin-top: 20px; width: 100%; padding: 10px; background: #c62828; color: white; border: none; cursor: pointer; font-weight:bold; letter-spacing: 0.5px; }}
-  .calc-main button:hover {{ background: #b71c1c; }}
-  
-  .result-box {{ margin-top: 20px; padding: 15px; background: #2d2d2d; border-left: 4px solid #c62828; }}
-
-  /* Comparison Table Styling */
-  .comp-table {{ width: 100%; border-collapse: collapse; margin-top: 15px; }}
-  .comp-table th {{ text-align: left; color: #888; font-size: 0.85em; padding-bottom: 5px; border-bottom: 1px solid #444; }}
-  .comp-table td {{ padding: 10px 0; border-bottom: 1px solid #444; font-size: 1.1em; }}
-  .val-gov {{ color: #4caf50; font-weight: bold; }} /* Green for Official */
-  .val-shadow {{ color: #ff5252; font-weight: bold; }} /* Red for Shadow */
-</style>
-
-{{{{< /calculator >}}}}
-
-## How to Interpret Results
-{educational_content}
-
-## The Math Behind It
-The calculator runs two parallel equations. 
-
-**1. Official Calculation:** Uses the standard BLS Consumer Price Index ($CPI$).
-$$
-{formula_latex}
-$$
-
-**2. Shadow Calculation:** Reconstructs the index by adding back the methodology changes (substitution bias, hedonics) that were removed in 1980 and 1990.
-"""
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Created: {filename}")
+import json
 
+from calcfoundry import CalculatorSpec, cpi, register
 
 # === DEFINING THE SHADOW STATS CALCULATOR ===
 
@@ -175,55 +16,159 @@ shadow_inputs = """
     </div>
 </div>
 
+"""
+
+shadow_amount_input = """
 <label>Amount in Start Year ($)</label>
 <input type="number" id="start_amount" placeholder="1000" value="1000">
 <small style="color:#888;">Example: What $1,000 in 1970 is worth today.</small>
 """
 
+# --- OFFICIAL BLS CPI DATA ---
+# Annual anchors, plus the monthly CPI-U series when data/cpi_u_monthly.csv
+# is present (see calcfoundry.cpi).
+CPI_MONTHLY = cpi.load_monthly()
+CPI_TABLE = cpi.official_cpi_table(CPI_MONTHLY)
+CPI_FIRST_YEAR = min(cpi.CPI_ANCHORS)
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def _month_select(element_id):
+    options = "".join(f'<option value="{i}">{name}</option>' for i, name in enumerate(MONTH_NAMES, start=1))
+    return f'<select id="{element_id}"><option value="0" selected>Annual average</option>{options}</select>'
+
+
+if CPI_MONTHLY is not None:
+    last_year = CPI_MONTHLY.year + (CPI_MONTHLY.month - 2 + len(CPI_MONTHLY.values)) // 12
+    shadow_inputs += f"""
+<div style="display:flex; gap:10px;">
+    <div style="flex:1;">
+        <label>Start Month</label>
+        {_month_select("start_month")}
+    </div>
+    <div style="flex:1;">
+        <label>End Month</label>
+        {_month_select("end_month")}
+    </div>
+</div>
+<small style="color:#888;">Monthly CPI-U from {MONTH_NAMES[CPI_MONTHLY.month - 1]} {CPI_MONTHLY.year} to {MONTH_NAMES[(CPI_MONTHLY.month - 2 + len(CPI_MONTHLY.values)) % 12]} {last_year}.</small>
+"""
+
+cpi_setup_js = """
+    // --- OFFICIAL BLS CPI DATA (Annual Average) ---
+    // Dense per-year index from """ + str(CPI_FIRST_YEAR) + """, interpolated between the BLS anchors at build time.
+    const CPI_FIRST_YEAR = """ + str(CPI_FIRST_YEAR) + """;
+    const CPI_INDEX = new Float64Array(""" + json.dumps(CPI_TABLE) + """);
+
+    // Monthly CPI-U (null without data/cpi_u_monthly.csv): consecutive months
+    // from { year, month }, as base64 Float32 LE.
+    const CPI_MONTHLY = """ + (json.dumps({
+        "year": CPI_MONTHLY.year,
+        "month": CPI_MONTHLY.month,
+        "data": cpi.encode_float32(CPI_MONTHLY.values),
+    }) if CPI_MONTHLY else "null") + """;
+    const CPI_MONTHS = CPI_MONTHLY && new Float32Array(Uint8Array.from(atob(CPI_MONTHLY.data), c => c.charCodeAt(0)).buffer);
+
+    // Official CPI for a year: an array lookup, clamped below the data and
+    // extrapolated at """ + f"{cpi.CPI_EXTRAPOLATION - 1:.0%}" + """ a year beyond it.
+    function getOfficialIndex(year) {
+        const i = year - CPI_FIRST_YEAR;
+        if (i <= 0) return CPI_INDEX[0];
+        if (i < CPI_INDEX.length) return CPI_INDEX[i];
+        return CPI_INDEX[CPI_INDEX.length - 1] * Math.pow(""" + repr(cpi.CPI_EXTRAPOLATION) + """, i - (CPI_INDEX.length - 1));
+    }
+
+    // Official CPI for a month (1-12) of the monthly series; the annual
+    // average for month 0, or when there is no monthly figure for that month.
+    function getMonthlyIndex(year, month) {
+        if (CPI_MONTHS && month > 0) {
+            const i = (year - CPI_MONTHLY.year) * 12 + (month - CPI_MONTHLY.month);
+            if (i >= 0 && i < CPI_MONTHS.length) return CPI_MONTHS[i];
+        }
+        return getOfficialIndex(year);
+    }
+
+    // Cumulative shadow divergence, as prefix products over the same years, so
+    // the divergence between any two years is shadowMultiplier(y2) / shadowMultiplier(y1).
+    // Fractional years (months) compound at that year's rate.
+    const SHADOW_CUMULATIVE = new Float64Array(""" + json.dumps(cpi.shadow_multiplier_table(len(CPI_TABLE))) + """);
+
+    function shadowMultiplier(year) {
+        const i = Math.floor(year) - CPI_FIRST_YEAR, part = year - Math.floor(year);
+        const last = SHADOW_CUMULATIVE.length - 1;
+        if (i < 0) return 1;
+        if (i < last) return SHADOW_CUMULATIVE[i] * Math.pow(SHADOW_CUMULATIVE[i + 1] / SHADOW_CUMULATIVE[i], part);
+        return SHADOW_CUMULATIVE[last] * Math.pow(""" + repr(1 + cpi.annual_divergence(CPI_FIRST_YEAR + len(CPI_TABLE) - 1)) + """, i - last + part);
+    }
+
+    // What the amount from every start year is worth in endYear, official
+    // and shadow: two lookups per point, however long the range.
+    function drawStartYears_{tool_id}(endYear, endMonth, amount) {
+        const count = Math.ceil(endYear + (endMonth ? (endMonth - 1) / 12 : 0)) - CPI_FIRST_YEAR;
+        if (count < 2) return;
+        const cpiEnd = getMonthlyIndex(endYear, endMonth), shadowEnd = shadowMultiplier(endYear + (endMonth ? (endMonth - 1) / 12 : 0));
+        const official = new Float64Array(count), gap = new Float64Array(count);
+        for (let i = 0; i < count; i++) {
+            official[i] = amount * cpiEnd / getOfficialIndex(CPI_FIRST_YEAR + i);
+            gap[i] = official[i] * (shadowEnd / shadowMultiplier(CPI_FIRST_YEAR + i) - 1);
+        }
+        const fmt = (num) => new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD', maximumFractionDigits: 0 }).format(num);
+        CalcFoundry.stackedChart('start_years_chart_{tool_id}', [
+            { values: official, color: 'rgba(76,175,80,0.6)' },
+            { values: gap, color: 'rgba(255,82,82,0.45)' },
+        ], {
+            xMax: count - 1,
+            xLabel: (x) => String(Math.round(CPI_FIRST_YEAR + x)),
+            yLabel: fmt,
+        });
+    }
+"""
+
+shadow_output = """
+<h4 style="margin-bottom:0;">Every Start Year in <span id="start_years_end_{tool_id}">Today's</span> Dollars</h4>
+<canvas id="start_years_chart_{tool_id}" class="calc-chart"></canvas>
+<div class="calc-legend"><span style="background:rgba(76,175,80,0.6)"></span>Official<span style="background:rgba(255,82,82,0.45)"></span>Extra under Shadow Stats</div>
+"""
+
 shadow_js = """
     let y1 = parseInt(document.getElementById('start_year').value);
     let y2 = parseInt(document.getElementById('end_year').value);
     let amt = parseFloat(document.getElementById('start_amount').value);
+    // Months (1-12) when the monthly series is on the page; 0 = annual average.
+    const monthOf = (id) => { const el = document.getElementById(id); return el ? parseInt(el.value) || 0 : 0; };
+    let m1 = monthOf('start_month');
+    let m2 = monthOf('end_month');
+    let t1 = y1 + (m1 ? (m1 - 1) / 12 : 0);
+    let t2 = y2 + (m2 ? (m2 - 1) / 12 : 0);
+    const when = (y, m) => (m ? ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"][m - 1] + ' ' : '') + y;
 
     let resultText = "";
-    let historyText = "";
+    let historySummary = "";
 
     if (isNaN(y1) || isNaN(y2) || isNaN(amt)) {
         resultText = "Please enter valid years and amount.";
     } else if (y1 < 1913) {
         resultText = "Data starts at 1913 (Creation of the Federal Reserve).";
-    } else if (y1 >= y2) {
+    } else if (t1 >= t2) {
         resultText = "Start year must be before End year.";
     } else {
         // 1. OFFICIAL CALCULATION
-        let cpi1 = getOfficialIndex(y1);
-        let cpi2 = getOfficialIndex(y2);
+        let cpi1 = getMonthlyIndex(y1, m1);
+        let cpi2 = getMonthlyIndex(y2, m2);
         let ratio_official = cpi2 / cpi1;
         let final_official = amt * ratio_official;
 
         // 2. SHADOW CALCULATION (Divergence Model)
-        // ShadowStats methodology roughly matches Official until 1980.
-        // Post 1980: Diverges by ~1.5% - 2% annually.
-        // Post 1990: Diverges by ~4% - 5% annually (widening gap).
-        
-        let shadow_mult = 1.0;
-        
-        for (let y = y1; y < y2; y++) {
-            let annual_div = 0;
-            if (y >= 1980 && y < 1990) {
-                annual_div = 0.012; // 1.2% divergence in the 80s
-            } else if (y >= 1990) {
-                annual_div = 0.045; // 4.5% divergence post-90s (Conservative avg of SGS charts)
-            }
-            shadow_mult = shadow_mult * (1 + annual_div);
-        }
+        // Cumulative divergence over [t1, t2), from the prefix-product table.
+        let shadow_mult = shadowMultiplier(t2) / shadowMultiplier(t1);
 
         // The "True" ratio is the Official Ratio * The Cumulative Divergence
         let ratio_shadow = ratio_official * shadow_mult;
         let final_shadow = amt * ratio_shadow;
 
         // 3. CAGR Calculations (Reverse Engineering the Rate)
-        let n = y2 - y1;
+        let n = t2 - t1;
         let cagr_official = (Math.pow(ratio_official, 1/n) - 1) * 100;
         let cagr_shadow = (Math.pow(ratio_shadow, 1/n) - 1) * 100;
 
@@ -232,7 +177,7 @@ shadow_js = """
 
         resultText = `
             <div style="font-size:1.1em; margin-bottom:10px;">
-                <strong>True Cost Comparison (${y2}):</strong>
+                <strong>True Cost Comparison (${when(y2, m2)}):</strong>
             </div>
             
             <table class="comp-table">
@@ -269,7 +214,11 @@ shadow_js = """
             </div>
         `;
 
-        historyText = `${y1}->${y2}: Gov ${cagr_official.toFixed(1)}% vs Shadow ${cagr_shadow.toFixed(1)}%`;
+        // 4. EVERY START YEAR vs the end year
+        document.getElementById('start_years_end_{tool_id}').innerText = when(y2, m2);
+        drawStartYears_{tool_id}(y2, m2, amt);
+
+        historySummary = `${when(y1, m1)}->${when(y2, m2)}: Gov ${cagr_official.toFixed(1)}% vs Shadow ${cagr_shadow.toFixed(1)}%`;
     }
 """
 
@@ -294,14 +243,42 @@ shadow_vars = """
 * **Divergence**: The cumulative gap created by changing statistical formulas.
 """
 
-# === GENERATE THE FILE ===
-create_calculator(
-    title="ShadowStats vs. Official Inflation", 
-    category="Finance", 
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="ShadowStats vs. Official Inflation",
+    category="Finance",
     description="Calculate the true devaluation of the dollar. Compare the Official Government CPI rate against the ShadowStats 1980-based alternative methodology side-by-side.",
-    inputs_html=shadow_inputs,
+    inputs_html=shadow_inputs + shadow_amount_input,
     calculation_js=shadow_js,
     formula_latex=shadow_latex,
     educational_content=shadow_content,
-    variable_definitions=shadow_vars 
-)
\ No newline at end of file
+    variable_definitions=shadow_vars,
+    button_label="Compare Official vs. Shadow",
+    math_link='How we calculate the "Real" number',
+    history_title="Recent Comparisons",
+    history_limit=5,
+    history_download=False,
+    clear_label="Clear History",
+    usage_heading="How to Interpret Results",
+    math_intro="""The calculator runs two parallel equations.
+
+**1. Official Calculation:** Uses the standard BLS Consumer Price Index ($CPI$).""",
+    math_outro="""
+**2. Shadow Calculation:** Reconstructs the index by adding back the methodology changes (substitution bias, hedonics) that were removed in 1980 and 1990.
+""",
+    setup_js=cpi_setup_js,
+    output_html=shadow_output,
+    extra_css="""
+  /* Custom Red Button */
+  .calc-main button { font-weight:bold; letter-spacing: 0.5px; background: #c62828; }
+  .calc-main button:hover { background: #b71c1c; }
+  .result-box { border-left-color: #c62828; }
+
+  /* Comparison Table Styling */
+  .comp-table { width: 100%; border-collapse: collapse; margin-top: 15px; }
+  .comp-table th { text-align: left; color: #888; font-size: 0.85em; padding-bottom: 5px; border-bottom: 1px solid #444; }
+  .comp-table td { padding: 10px 0; border-bottom: 1px solid #444; font-size: 1.1em; }
+  .val-gov { color: #4caf50; font-weight: bold; } /* Green for Official */
+  .val-shadow { color: #ff5252; font-weight: bold; } /* Red for Shadow */
+""",
+))
@@ -0,0 +1,101 @@
+from calcfoundry import CalculatorSpec, register
+
+# === DEFINING THE WILSON SCORE CALCULATOR ===
+
+wilson_inputs = """
+<label>Total Trials (e.g., Visitors, Reviews)</label>
+<input type="number" id="n_trials" placeholder="e.g. 100">
+
+<label>Successes (e.g., Sales, 5-Star Ratings)</label>
+<input type="number" id="n_success" placeholder="e.g. 95">
+
+<label>Confidence Level</label>
+<select id="conf_level">
+    <option value="1.64485">90%</option>
+    <option value="1.95996" selected>95% (Standard)</option>
+    <option value="2.57583">99%</option>
+</select>
+"""
+
+wilson_js = """
+    // 1. Get Inputs
+    let n = parseFloat(document.getElementById('n_trials').value);
+    let x = parseFloat(document.getElementById('n_success').value);
+    let z = parseFloat(document.getElementById('conf_level').value);
+
+    let resultText = "";
+    let historySummary = "";
+
+    // 2. Validation
+    if (isNaN(n) || isNaN(x) || n <= 0) {
+        resultText = "Please enter valid positive numbers.";
+    } else if (x > n) {
+        resultText = "Successes cannot be greater than Total Trials.";
+    } else {
+        // 3. Wilson Score Formula Logic
+        // p_hat is the observed proportion
+        let p = x / n;
+        
+        // Parts of the formula broken down for readability
+        let p1 = p + ( (z*z) / (2*n) );
+        let p2 = z * Math.sqrt( ( (p*(1-p))/n ) + ( (z*z)/(4*n*n) ) );
+        let p3 = 1 + ( (z*z) / n );
+        
+        // Calculate Lower and Upper Bounds
+        let lower = (p1 - p2) / p3;
+        let upper = (p1 + p2) / p3;
+        
+        // Convert to Percentages
+        let obs_perc = (p * 100).toFixed(2);
+        let min_perc = (lower * 100).toFixed(2);
+        let max_perc = (upper * 100).toFixed(2);
+        
+        // 4. Format Output
+        // We use a clean summary string for the result text
+        resultText = `
+            <strong>True Score Range:</strong> ${min_perc}% — ${max_perc}%<br>
+            <small style='opacity:0.8'>Observed Rate: ${obs_perc}% (at 95% Confidence)</small>
+        `;
+        historySummary = `${x}/${n}: ${min_perc}% — ${max_perc}%`;
+    }
+"""
+
+wilson_latex = r"w = \frac{\hat{p} + \frac{z^2}{2n} \pm z \sqrt{\frac{\hat{p}(1-\hat{p})}{n} + \frac{z^2}{4n^2}}}{1 + \frac{z^2}{n}}"
+
+wilson_content = """
+### Why "Average Rating" is a Lie
+Imagine two products:
+1. **Product A:** Has one review, and it is 5 stars. (Average: 5.0)
+2. **Product B:** Has 100 reviews, with 95 positive. (Average: 4.95)
+
+Mathematically, Product A has a higher average. But intuitively, you trust Product B more. 
+The **Wilson Score** solves this by asking: *"Given the data we have, what is the 'true' rating we can be 95% confident in?"*
+
+For Product A, the Wilson Score might be **20%** (because one data point is unreliable).
+For Product B, the score is likely **92%** (because the data is solid).
+
+### Real World Use Cases
+* **Amazon/eCommerce:** Ranking products by "Best Match" instead of "Highest Average".
+* **Reddit:** How "Best" comments are sorted (upvotes vs downvotes).
+* **Conversion Rate Optimization:** Determining if a landing page change actually worked.
+"""
+
+wilson_vars = r"""
+* $n$ is the **Total Trials** (total reviews or visitors).
+* $\hat{p}$ is the **Observed Success Rate** (successes / trials).
+* $z$ is the **Z-Score** (1.96 for 95% confidence).
+"""
+
+# === REGISTER THE CALCULATOR ===
+register(CalculatorSpec(
+    title="True Rating Calculator (Wilson Score)",
+    category="Statistics",
+    description="Calculate the true statistical accuracy of a rating or conversion rate using the Wilson Score Interval.",
+    inputs_html=wilson_inputs,
+    calculation_js=wilson_js,
+    formula_latex=wilson_latex,
+    educational_content=wilson_content,
+    variable_definitions=wilson_vars,
+    history_download=False,
+    clear_label="Clear History",
+))